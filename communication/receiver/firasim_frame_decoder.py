@@ -0,0 +1,112 @@
+from configuration.configuration import Configuration
+from lib.utils.field_utils import FieldUtils
+from lib.utils.firasim_utils import FIRASimUtils
+
+from lib.domain.field import Field
+from lib.domain.robot import Robot
+from lib.domain.ball import Ball
+
+from lib.utils.geometry_utils import GeometryUtils
+
+class FirasimFrameDecoder:
+    """
+    Fills a field from a FIRASim frame message, mirrored to the perspective
+    of the given team.
+    """
+
+    def __init__(
+        self,
+        is_yellow_team: bool,
+        field: Field
+    ):
+        self.is_yellow_team = is_yellow_team
+        self.field = field
+        self.is_left_team = \
+            Configuration.firasim_team_is_yellow_left_team == is_yellow_team
+
+    def decode(self, frame):
+        self._field_data_from_frame(self.field, frame)
+
+    def _entity_from_message(
+        self,
+        entity: (Robot | Ball),
+        message,
+        orientation: float = 0,
+        v_orientation: float = 0
+    ):
+        entity.position.x, entity.position.y = \
+            FIRASimUtils.correct_position(
+                message.x,
+                message.y,
+                self.is_left_team)
+
+        entity.position.theta = \
+            GeometryUtils.correct_angle(
+                orientation,
+                self.is_left_team)
+
+        entity.velocity.x, entity.velocity.y = \
+            FIRASimUtils.correct_speed(
+                message.vx,
+                message.vy,
+                self.is_left_team)
+
+        entity.velocity.theta = v_orientation
+        entity.active = True
+
+    def _field_data_from_frame(
+        self,
+        field: Field,
+        frame
+    ):
+        if self.is_yellow_team:
+            team_messages = frame.robots_yellow
+            foes_messages = frame.robots_blue
+        else:
+            team_messages = frame.robots_blue
+            foes_messages = frame.robots_yellow
+
+        if frame.HasField('ball'):
+            self._entity_from_message(field.ball, frame.ball)
+
+        self._team_from_messages(
+            team_messages,
+            field._robots
+        )
+
+        self._team_from_messages(
+            foes_messages,
+            field._foes
+        )
+
+    def _is_robot_inside_field(
+        self,
+        robot: Robot
+    ):
+        return FieldUtils.is_inside_field(
+            robot.position.x,
+            robot.position.y,
+            Configuration.field_length,
+            Configuration.field_width,
+            Configuration.field_goal_width,
+            Configuration.field_goal_depth
+        )
+
+    def _team_from_messages(
+        self,
+        messages,
+        robots: list
+    ):
+        robot_ids = [message.robot_id for message in messages]
+
+        for message in messages:
+            self._entity_from_message(
+                robots[message.robot_id],
+                message,
+                message.orientation,
+                message.vorientation)
+
+        for i in range(len(robots)):
+            robot = robots[i]
+            if i not in robot_ids or not self._is_robot_inside_field(robot):
+                robot.active = False
@@ -2,21 +2,46 @@ import socket
 import struct
 from abc import ABC
 
+from communication.recording.datagram_log import DatagramLogWriter
+from communication.recording.datagram_replay import ReplayChannel
+
 class SocketReceiver(ABC):
     def __init__(
         self,
         receiver_ip: str,
         receiver_port: str,
-        buffer_size: int
+        buffer_size: int,
+        source: 'ReplayChannel | None' = None
     ):
         self.receiver_ip = receiver_ip
         self.receiver_port = receiver_port
-        self.receiver_socket = self._create_socket()
         self.buffer_size = buffer_size
 
+        # a replayed channel stands in for the socket
+        self.source = source
+        self.receiver_socket = self._create_socket() if source is None else None
+
+        self.recorder: 'DatagramLogWriter | None' = None
+        self.recorder_channel: 'int | None' = None
+
     def receive(self):
+        if self.source is not None:
+            return self.source.receive()
+
         return self.receiver_socket.recv(self.buffer_size)
 
+    def set_recorder(
+        self,
+        recorder: 'DatagramLogWriter | None',
+        channel: 'int | None' = None
+    ):
+        self.recorder = recorder
+        self.recorder_channel = channel
+
+    def _record(self, data: bytes):
+        if self.recorder is not None:
+            self.recorder.write(self.recorder_channel, data)
+
     def _create_socket(self):
         sock = socket.socket(
             socket.AF_INET,
@@ -0,0 +1,159 @@
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+# channels of the recorded datagrams
+VISION_CHANNEL = 0
+REFEREE_CHANNEL = 1
+
+LOG_MAGIC = b"VSSLOG01"
+INDEX_EXTENSION = ".idx"
+
+# timestamp, channel and size before the bytes of each datagram
+RECORD_HEADER = struct.Struct("<dBI")
+
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("timestamp", "<f8"),
+    ("channel", "u1")
+])
+
+def _get_index_path(path: str):
+    return path + INDEX_EXTENSION
+
+class DatagramLogWriter:
+    """
+    Appends datagrams with their receive timestamps to a binary log. Each
+    record is the header (timestamp, channel, size) followed by the bytes.
+    The offset, timestamp and channel of every record also go to the index
+    file next to the log, used by DatagramLogReader for seeking.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.file = open(path, "ab")
+        self.index_file = open(_get_index_path(path), "ab")
+
+        if self.file.tell() == 0:
+            self.file.write(LOG_MAGIC)
+
+        self.offset = self.file.tell()
+
+    def write(
+        self,
+        channel: int,
+        data: bytes,
+        timestamp: 'float | None' = None
+    ):
+        if timestamp is None:
+            timestamp = time.time()
+
+        self.file.write(RECORD_HEADER.pack(timestamp, channel, len(data)))
+        self.file.write(data)
+
+        self.index_file.write(np.array([(self.offset, timestamp, channel)], INDEX_DTYPE).tobytes())
+
+        self.offset += RECORD_HEADER.size + len(data)
+
+    def flush(self):
+        self.file.flush()
+        self.index_file.flush()
+
+    def close(self):
+        self.file.close()
+        self.index_file.close()
+
+class DatagramLogReader:
+    """
+    Reads a log written by DatagramLogWriter. The index is rebuilt from the
+    log when its file is missing or does not cover every record, as after a
+    crash of the recorder.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "rb")
+        # the replay channels read from their own threads
+        self.lock = threading.Lock()
+
+        if self.file.read(len(LOG_MAGIC)) != LOG_MAGIC:
+            raise ValueError(f"{path} is not a datagram log")
+
+        self.index = self._load_index()
+
+    def _load_index(self):
+        index_path = _get_index_path(self.path)
+        size = os.path.getsize(self.path)
+
+        if os.path.exists(index_path):
+            index = np.fromfile(index_path, INDEX_DTYPE)
+
+            if len(index) == 0 and size == len(LOG_MAGIC):
+                return index
+
+            if len(index) > 0 and self._get_end_offset(index[-1]["offset"]) == size:
+                return index
+
+        return self._build_index(size)
+
+    def _get_end_offset(self, offset: int):
+        self.file.seek(offset)
+        header = self.file.read(RECORD_HEADER.size)
+
+        if len(header) < RECORD_HEADER.size:
+            return None
+
+        return offset + RECORD_HEADER.size + RECORD_HEADER.unpack(header)[2]
+
+    def _build_index(self, size: int):
+        entries = []
+        offset = len(LOG_MAGIC)
+
+        while offset + RECORD_HEADER.size <= size:
+            self.file.seek(offset)
+            timestamp, channel, length = RECORD_HEADER.unpack(self.file.read(RECORD_HEADER.size))
+
+            # a record cut by a crash is left out
+            if offset + RECORD_HEADER.size + length > size:
+                break
+
+            entries.append((offset, timestamp, channel))
+            offset += RECORD_HEADER.size + length
+
+        return np.array(entries, INDEX_DTYPE)
+
+    def __len__(self):
+        return len(self.index)
+
+    def read(self, position: int):
+        """
+        Returns the timestamp, channel and bytes of the record at position.
+        """
+
+        with self.lock:
+            self.file.seek(int(self.index[position]["offset"]))
+            timestamp, channel, length = RECORD_HEADER.unpack(self.file.read(RECORD_HEADER.size))
+
+            return timestamp, channel, self.file.read(length)
+
+    def get_position_by_time(self, timestamp: float):
+        """
+        Returns the position of the first record received at or after
+        timestamp.
+        """
+
+        return int(np.searchsorted(self.index["timestamp"], timestamp, side="left"))
+
+    def get_channel_positions(self, channel: int):
+        return np.flatnonzero(self.index["channel"] == channel)
+
+    def close(self):
+        self.file.close()
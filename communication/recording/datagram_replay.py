@@ -0,0 +1,137 @@
+import threading
+import time
+
+from communication.recording.datagram_log import DatagramLogReader
+
+# recorded speed, scaled by the speed of the replay
+REALTIME_MODE = "realtime"
+# every datagram as soon as it is asked for
+FAST_MODE = "fast"
+# one blocking receive per call of step
+STEPPED_MODE = "stepped"
+
+class DatagramReplay:
+    """
+    Plays back a datagram log. Each channel is read through a ReplayChannel,
+    which stands in for the socket of a SocketReceiver.
+
+    The replay keeps the recorded time of the last datagram handed out. A
+    poll only returns datagrams recorded up to that time (or up to the
+    replay clock, in realtime), so the referee messages stay in order with
+    the vision frames whatever the mode.
+    """
+
+    def __init__(
+        self,
+        reader: DatagramLogReader,
+        mode: str = REALTIME_MODE,
+        speed: float = 1.0,
+        start_time: 'float | None' = None,
+        clock = time.monotonic,
+        sleep = time.sleep
+    ):
+        if mode not in (REALTIME_MODE, FAST_MODE, STEPPED_MODE):
+            raise ValueError(f"Unknown replay mode {mode}")
+
+        self.reader = reader
+        self.mode = mode
+        self.speed = speed
+        self.clock = clock
+        self.sleep = sleep
+
+        start_position = 0 if start_time is None else reader.get_position_by_time(start_time)
+
+        if start_position < len(reader):
+            self.first_timestamp = float(reader.index[start_position]["timestamp"])
+        else:
+            self.first_timestamp = 0.0
+
+        self.start_position = start_position
+        self.current_timestamp = self.first_timestamp
+        self.replay_start = None
+
+        self.condition = threading.Condition()
+        self.allowed_steps = 0
+
+    def get_channel(self, channel: int):
+        positions = self.reader.get_channel_positions(channel)
+        return ReplayChannel(self, positions[positions >= self.start_position])
+
+    def step(self, count: int = 1):
+        """
+        Lets count more blocking receives through, in stepped mode.
+        """
+
+        with self.condition:
+            self.allowed_steps += count
+            self.condition.notify_all()
+
+    def _get_replay_timestamp(self):
+        if self.replay_start is None:
+            self.replay_start = self.clock()
+
+        return self.first_timestamp + (self.clock() - self.replay_start) * self.speed
+
+    def _wait_for(self, timestamp: float):
+        if self.mode == REALTIME_MODE:
+            delay = (timestamp - self._get_replay_timestamp()) / self.speed
+
+            if delay > 0:
+                self.sleep(delay)
+        elif self.mode == STEPPED_MODE:
+            with self.condition:
+                while self.allowed_steps == 0:
+                    self.condition.wait()
+
+                self.allowed_steps -= 1
+
+        with self.condition:
+            self.current_timestamp = max(self.current_timestamp, timestamp)
+
+    def _is_due(self, timestamp: float):
+        if self.mode == REALTIME_MODE:
+            return timestamp <= self._get_replay_timestamp()
+
+        return timestamp <= self.current_timestamp
+
+class ReplayChannel:
+    """
+    Datagrams of one channel of a DatagramReplay. receive blocks until the
+    next datagram is due, as a blocking socket, and raises EOFError at the
+    end of the log; poll returns None when no datagram is due, as a
+    non-blocking one.
+    """
+
+    def __init__(
+        self,
+        replay: DatagramReplay,
+        positions
+    ):
+        self.replay = replay
+        self.positions = positions
+        self.next = 0
+
+    def _has_next(self):
+        return self.next < len(self.positions)
+
+    def _get_next_timestamp(self):
+        return float(self.replay.reader.index[self.positions[self.next]]["timestamp"])
+
+    def _read_next(self):
+        data = self.replay.reader.read(self.positions[self.next])[2]
+        self.next += 1
+
+        return data
+
+    def receive(self):
+        if not self._has_next():
+            raise EOFError("End of the datagram log")
+
+        self.replay._wait_for(self._get_next_timestamp())
+        return self._read_next()
+
+    def poll(self):
+        if not self._has_next() or not self.replay._is_due(self._get_next_timestamp()):
+            return None
+
+        return self._read_next()
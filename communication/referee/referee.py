@@ -1,28 +1,51 @@
 from communication.protobuf.referee import vssref_command_pb2
 from communication.receiver.socket_receiver import SocketReceiver
+from communication.recording.datagram_replay import ReplayChannel
 from configuration.configuration import Configuration
 from lib.domain.referee_message import RefereeMessage
 from lib.utils.referee_utils import RefereeUtils
 import select
 
 class Referee(SocketReceiver):
-    def __init__(self, referee_message: RefereeMessage):
+    def __init__(
+        self,
+        referee_message: RefereeMessage,
+        source: 'ReplayChannel | None' = None
+    ):
         super(Referee, self).__init__(
             Configuration.referee_ip,
             Configuration.referee_port,
-            Configuration.referee_buffer_size
+            Configuration.referee_buffer_size,
+            source
         )
 
-        self.receiver_socket.setblocking(False)
+        if self.receiver_socket is not None:
+            self.receiver_socket.setblocking(False)
+
         self.referee_message = referee_message
         self.protobuf_command = vssref_command_pb2.VSSRef_Command()
 
     def update(self):
+        if self.source is not None:
+            data = self.source.poll()
+
+            if data is not None:
+                self.update_by_data(data)
+
+            return
+
         ready_to_read, _, _ = select.select([self.receiver_socket], [], [], 0)
         if ready_to_read:
             try:
-                data = super().receive()
-                self.protobuf_command.ParseFromString(data)
-                RefereeUtils.set_referee_message(self.referee_message, self.protobuf_command)
+                self.update_by_data(super().receive())
             except Exception:
-                pass
\ No newline at end of file
+                pass
+
+    def update_by_data(self, data: bytes):
+        self._record(data)
+
+        try:
+            self.protobuf_command.ParseFromString(data)
+            RefereeUtils.set_referee_message(self.referee_message, self.protobuf_command)
+        except Exception:
+            pass
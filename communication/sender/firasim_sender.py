@@ -29,8 +29,8 @@ class FirasimSender(SocketSender):
 
         self.transmit(packet)
 
+    @staticmethod
     def _fill_robot_command_packet(
-        self,
         robot_id: int,
         left_speed: float,
         right_speed: float,
@@ -53,7 +53,8 @@ class FirasimSender(SocketSender):
         packet = self._fill_team_command_packet(team_command)
         self.transmit(packet)
 
-    def _fill_team_command_packet(self, team_command: TeamCommand):
+    @staticmethod
+    def _fill_team_command_packet(team_command: TeamCommand):
         command_packet = command_pb2.Commands()
 
         for i in range(len(team_command.commands)):
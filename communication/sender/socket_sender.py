@@ -12,9 +12,15 @@ class SocketSender(ABC):
 
         self.transmitter_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
+        # set when the socket is driven by an asyncio event loop
+        self.transport = None
+
     @abstractmethod
     def transmit(self, packet):
         data = packet.SerializeToString()
-        self.transmitter_socket.sendto(
-            data,
-            (self.transmitter_ip, self.transmitter_port))
+        address = (self.transmitter_ip, self.transmitter_port)
+
+        if self.transport is not None:
+            self.transport.sendto(data, address)
+        else:
+            self.transmitter_socket.sendto(data, address)
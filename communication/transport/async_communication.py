@@ -0,0 +1,92 @@
+import asyncio
+
+from communication.receiver.firasim_receiver import FirasimReceiver
+from communication.receiver.socket_receiver import SocketReceiver
+from communication.referee.referee import Referee
+from communication.sender.socket_sender import SocketSender
+from communication.transport.datagram_queue_protocol import DatagramQueueProtocol
+from lib.control.frame_scheduler import AsyncFrameScheduler
+
+class AsyncCommunication:
+    """
+    Runs the vision, referee and command sockets on one asyncio event loop.
+
+    The sockets of the given receivers and senders are handed over to
+    datagram endpoints; the received datagrams are decoded on the loop, so
+    the fields are only touched from the loop thread.
+    """
+
+    def __init__(
+        self,
+        vision_receivers: 'list[FirasimReceiver]',
+        referee: Referee,
+        senders: 'list[SocketSender]',
+        frame_scheduler: AsyncFrameScheduler,
+        queue_size: int = 1
+    ):
+        self.vision_receivers = vision_receivers
+        self.referee = referee
+        self.senders = senders
+        self.frame_scheduler = frame_scheduler
+        self.queue_size = queue_size
+
+        self._transports = []
+        self._tasks: 'list[asyncio.Task]' = []
+
+    async def start(self):
+        for receiver in self.vision_receivers:
+            protocol = await self._create_receiver_endpoint(receiver)
+            self._tasks.append(asyncio.create_task(self._consume_vision(receiver, protocol)))
+
+        protocol = await self._create_receiver_endpoint(self.referee)
+        self._tasks.append(asyncio.create_task(self._consume_referee(protocol)))
+
+        loop = asyncio.get_running_loop()
+
+        for sender in self.senders:
+            transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol,
+                sock=sender.transmitter_socket)
+
+            sender.transport = transport
+            self._transports.append(transport)
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+
+        for sender in self.senders:
+            sender.transport = None
+
+        for transport in self._transports:
+            transport.close()
+
+        self._tasks = []
+        self._transports = []
+
+    async def _create_receiver_endpoint(self, receiver: SocketReceiver):
+        loop = asyncio.get_running_loop()
+
+        transport, protocol = await loop.create_datagram_endpoint(
+            lambda: DatagramQueueProtocol(self.queue_size),
+            sock=receiver.receiver_socket)
+
+        self._transports.append(transport)
+
+        return protocol
+
+    async def _consume_vision(
+        self,
+        receiver: FirasimReceiver,
+        protocol: DatagramQueueProtocol
+    ):
+        while True:
+            data = await protocol.queue.get()
+
+            if receiver.update_by_data(data):
+                self.frame_scheduler.notify_frame()
+
+    async def _consume_referee(self, protocol: DatagramQueueProtocol):
+        while True:
+            data = await protocol.queue.get()
+            self.referee.update_by_data(data)
@@ -0,0 +1,19 @@
+import asyncio
+
+class DatagramQueueProtocol(asyncio.DatagramProtocol):
+    """
+    Puts the received datagrams into a bounded queue. When the queue is
+    full the oldest datagram is dropped, so a slow consumer always reads
+    the most recent ones.
+    """
+
+    def __init__(self, max_size: int = 1):
+        self.queue: 'asyncio.Queue[bytes]' = asyncio.Queue(max_size)
+        self.dropped_count = 0
+
+    def datagram_received(self, data: bytes, address):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped_count += 1
+
+        self.queue.put_nowait(data)
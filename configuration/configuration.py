@@ -66,6 +66,13 @@ class Configuration:
     rsoccer_training_max_distance = configuration["rsoccer"]["training"]["max-distance"]
     rsoccer_training_max_x = configuration["rsoccer"]["training"]["max-x"]
     rsoccer_training_max_y = configuration["rsoccer"]["training"]["max-y"]
+    rsoccer_training_profiling_enabled = configuration["rsoccer"]["training"]["profiling"]["enabled"]
+    rsoccer_training_profiling_capacity = configuration["rsoccer"]["training"]["profiling"]["capacity"]
+    rsoccer_training_profiling_report_interval = configuration["rsoccer"]["training"]["profiling"]["report-interval"]
+    rsoccer_training_profiling_directory = configuration["rsoccer"]["training"]["profiling"]["directory"]
+    rsoccer_training_trajectory_recording_enabled = configuration["rsoccer"]["training"]["trajectory-recording"]["enabled"]
+    rsoccer_training_trajectory_recording_directory = configuration["rsoccer"]["training"]["trajectory-recording"]["directory"]
+    rsoccer_training_trajectory_recording_chunk_size = configuration["rsoccer"]["training"]["trajectory-recording"]["chunk-size"]
 
     firasim_control_ip = configuration["firasim"]["control"]["ip"]
     firasim_control_port = configuration["firasim"]["control"]["port"]
@@ -235,6 +242,15 @@ class Configuration:
     supporter_weights_distance_to_position = configuration["supporter"]["weights"]["distance-to-position"]
     supporter_weights_distance_to_ball = configuration["supporter"]["weights"]["distance-to-ball"]
     supporter_weights_distance_to_goal = configuration["supporter"]["weights"]["distance-to-goal"]
+    supporter_tracking_enabled = configuration["supporter"]["tracking"]["enabled"]
+    supporter_tracking_window_radius = configuration["supporter"]["tracking"]["window-radius"]
+    supporter_tracking_full_search_interval = configuration["supporter"]["tracking"]["full-search-interval"]
+    supporter_tracking_score_change_threshold = configuration["supporter"]["tracking"]["score-change-threshold"]
+    supporter_tracking_hysteresis = configuration["supporter"]["tracking"]["hysteresis"]
+    supporter_multiresolution_enabled = configuration["supporter"]["multiresolution"]["enabled"]
+    supporter_multiresolution_levels = configuration["supporter"]["multiresolution"]["levels"]
+    supporter_multiresolution_top_k = configuration["supporter"]["multiresolution"]["top-k"]
+    supporter_multiresolution_refinement = configuration["supporter"]["multiresolution"]["refinement"]
 
     supporter_univector_field_navigation_de = configuration["supporter"]["univector-field-navigation"]["de"]
     supporter_univector_field_navigation_kr = configuration["supporter"]["univector-field-navigation"]["kr"]
@@ -247,6 +263,21 @@ class Configuration:
     univector_field_navigation_k0 = configuration["univector-field-navigation"]["k0"]
     univector_field_navigation_dmin = configuration["univector-field-navigation"]["dmin"]
     univector_field_navigation_gaussian_delta = configuration["univector-field-navigation"]["gaussian-delta"]
+    univector_field_navigation_multi_obstacle = configuration["univector-field-navigation"]["multi-obstacle"]
+    univector_field_navigation_lookup_table_enabled = configuration["univector-field-navigation"]["lookup-table"]["enabled"]
+    univector_field_navigation_lookup_table_resolution = configuration["univector-field-navigation"]["lookup-table"]["resolution"]
+    univector_field_navigation_lookup_table_max_error = configuration["univector-field-navigation"]["lookup-table"]["max-error"]
+    univector_field_navigation_lookup_table_directory = configuration["univector-field-navigation"]["lookup-table"]["directory"]
+
+    control_rate = configuration["control"]["rate"]
+    control_asyncio = configuration["control"]["asyncio"]
+
+    recording_enabled = configuration["recording"]["enabled"]
+    recording_directory = configuration["recording"]["directory"]
+
+    replay_path = configuration["replay"]["path"]
+    replay_mode = configuration["replay"]["mode"]
+    replay_speed = configuration["replay"]["speed"]
 
     team_max_motor_speed = configuration["team"]["max-motor-speed"]
 
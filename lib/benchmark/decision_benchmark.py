@@ -0,0 +1,216 @@
+import time
+from typing import Callable, Iterable
+
+import numpy as np
+
+from configuration.configuration import Configuration
+from lib.command.team_command import TeamCommand
+from lib.domain.ball import Ball
+from lib.domain.enums.foul_enum import FoulEnum
+from lib.domain.field import Field
+from lib.domain.referee_message import RefereeMessage
+from lib.domain.robot import Robot
+from lib.state_machine.game_state_machine import GameStateMachine
+from lib.utils.firasim_utils import FIRASimUtils
+from lib.utils.geometry_utils import GeometryUtils
+
+# fouls that are given to one of the teams
+TEAM_FOULS = [
+    FoulEnum.FREE_KICK,
+    FoulEnum.PENALTY_KICK,
+    FoulEnum.GOAL_KICK,
+    FoulEnum.KICKOFF
+]
+
+# fouls that are given to no team
+NEUTRAL_FOULS = [
+    FoulEnum.FREE_BALL,
+    FoulEnum.STOP,
+    FoulEnum.GAME_ON,
+    FoulEnum.HALT
+]
+
+def _set_entity(
+    entity: 'Robot | Ball',
+    values: np.ndarray,
+    is_left_team: bool
+):
+    x, y, theta, v_x, v_y = values
+
+    entity.position.x, entity.position.y = FIRASimUtils.correct_position(x, y, is_left_team)
+    entity.position.theta = GeometryUtils.correct_angle(theta, is_left_team)
+    entity.velocity.x, entity.velocity.y = FIRASimUtils.correct_speed(v_x, v_y, is_left_team)
+
+def _get_team_field(
+    world: 'dict[str, np.ndarray]',
+    is_yellow_team: bool
+):
+    field = Field()
+    is_left_team = Configuration.firasim_team_is_yellow_left_team == is_yellow_team
+
+    def get_robots(values: np.ndarray):
+        robots = {}
+
+        for i, item in enumerate(values):
+            robot = Robot(i, True)
+            _set_entity(robot, item, is_left_team)
+            robots[i] = robot
+
+        return robots
+
+    team, foe_team = ("yellow", "blue") if is_yellow_team else ("blue", "yellow")
+
+    field.set_robots(get_robots(world[team]))
+    field.set_foes(get_robots(world[foe_team]))
+    _set_entity(field.ball, world["ball"], is_left_team)
+
+    return field
+
+def get_random_field_pair(
+    random: np.random.Generator,
+    max_x: float = .7,
+    max_y: float = .6,
+    max_speed: float = .5
+):
+    """
+    Returns the blue and the yellow field of one random situation, with the
+    robots of both teams and the ball at random positions, orientations and
+    velocities, each field seen by its team as the vision receiver fills it.
+    """
+
+    def get_values(count: int):
+        return np.column_stack([
+            random.uniform(-max_x, max_x, count),
+            random.uniform(-max_y, max_y, count),
+            random.uniform(-np.pi, np.pi, count),
+            random.uniform(-max_speed, max_speed, (count, 2))
+        ])
+
+    world = {
+        "blue": get_values(3),
+        "yellow": get_values(3),
+        "ball": get_values(1)[0]
+    }
+
+    return _get_team_field(world, False), _get_team_field(world, True)
+
+def get_referee_messages():
+    """
+    Returns a message for every foul, for each team when the foul is given
+    to one of them.
+    """
+
+    messages = []
+
+    def create_message(
+        foul_enum: FoulEnum,
+        is_yellow_team: 'bool | None'
+    ):
+        message = RefereeMessage()
+        message.foul_enum = foul_enum
+        message.is_yellow_team = is_yellow_team
+        message.foul_quadrant = 1
+        message.timestamp = 0
+
+        return message
+
+    for foul_enum in TEAM_FOULS:
+        for is_yellow_team in [False, True]:
+            messages.append(create_message(foul_enum, is_yellow_team))
+
+    for foul_enum in NEUTRAL_FOULS:
+        messages.append(create_message(foul_enum, None))
+
+    return messages
+
+def run_decision_benchmark(
+    perform_teams: 'Callable[[list[tuple[bool, Field, GameStateMachine]], RefereeMessage], list[TeamCommand | None]]',
+    fill_packet: 'Callable[[TeamCommand], object]',
+    field_pairs: 'Iterable[tuple[Field, Field]]',
+    messages: 'list[RefereeMessage]',
+    warmup_count: int = 10
+):
+    """
+    Runs perform_teams on the blue and yellow fields of every pair for every
+    message, as the control loop does, then fill_packet on the command of
+    each team, blue first. Returns the latencies in seconds grouped by team
+    and state of the team's state machine, as {"blue.game_on": {"perform":
+    [...], "fill_packet": [...], "total": [...]}, ...}.
+
+    perform is the time of the joint decision, which both teams wait for;
+    fill_packet is the time of the team's own packet and total the time
+    until it is filled. The first warmup_count calls of each group are not
+    timed.
+    """
+
+    latencies: 'dict[str, dict[str, list[float]]]' = {}
+    calls_counts: 'dict[str, int]' = {}
+
+    field_pairs = list(field_pairs)
+
+    for message in messages:
+        machines = [GameStateMachine(False), GameStateMachine(True)]
+
+        for blue_field, yellow_field in field_pairs:
+            teams = [
+                (False, blue_field, machines[0]),
+                (True, yellow_field, machines[1])
+            ]
+
+            start_time = time.perf_counter()
+            commands = perform_teams(teams, message)
+            perform_time = time.perf_counter()
+
+            fill_start_time = perform_time
+
+            for (is_yellow_team, _, machine), command in zip(teams, commands):
+                if command is not None:
+                    fill_packet(command)
+
+                end_time = time.perf_counter()
+
+                team = "yellow" if is_yellow_team else "blue"
+                key = f"{team}.{machine.get_state()}"
+
+                calls_count = calls_counts.get(key, 0)
+                calls_counts[key] = calls_count + 1
+
+                if calls_count >= warmup_count:
+                    state_latencies = latencies.setdefault(key, {
+                        "perform": [],
+                        "fill_packet": [],
+                        "total": []
+                    })
+
+                    state_latencies["perform"].append(perform_time - start_time)
+                    state_latencies["fill_packet"].append(end_time - fill_start_time)
+                    state_latencies["total"].append(end_time - start_time)
+
+                fill_start_time = end_time
+
+    return latencies
+
+def get_latency_distributions(latencies: 'dict[str, dict[str, list[float]]]'):
+    """
+    Returns count, mean, p50, p90, p99 and max, in milliseconds, of each
+    group and part returned by run_decision_benchmark.
+    """
+
+    distributions = {}
+
+    for key, parts in latencies.items():
+        distributions[key] = {}
+
+        for part, values in parts.items():
+            values = np.array(values) * 1000
+
+            distributions[key][part] = {
+                "count": len(values),
+                "mean_ms": float(np.mean(values)),
+                "p50_ms": float(np.percentile(values, 50)),
+                "p90_ms": float(np.percentile(values, 90)),
+                "p99_ms": float(np.percentile(values, 99)),
+                "max_ms": float(np.max(values))
+            }
+
+    return distributions
@@ -0,0 +1,175 @@
+import random
+import resource
+import time
+from typing import Callable
+
+import gymnasium as gym
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+
+SINGLE_ENV = "single"
+
+def _seed_everything(seed: int):
+    random.seed(seed)
+    np.random.seed(seed)
+
+def _get_rss_megabytes(pid: 'int | str' = "self"):
+    """
+    Current resident set size of a process, read from /proc (Linux only);
+    None where it cannot be read.
+    """
+
+    try:
+        with open(f"/proc/{pid}/statm") as file:
+            resident_pages = int(file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return resident_pages * resource.getpagesize() / (1024 * 1024)
+
+def _get_children_rss_megabytes(env: VecEnv):
+    processes = getattr(env, "processes", [])
+    values = [_get_rss_megabytes(process.pid) for process in processes]
+
+    if len(values) == 0 or None in values:
+        return None
+
+    return sum(values)
+
+def _get_rss_difference(
+    start_rss: 'float | None',
+    end_rss: 'float | None'
+):
+    if start_rss is None or end_rss is None:
+        return None
+
+    return end_rss - start_rss
+
+def _get_latency_statistics(latencies: 'list[float]'):
+    latencies = np.array(latencies) * 1000
+
+    return {
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "mean_ms": float(np.mean(latencies)),
+        "max_ms": float(np.max(latencies))
+    }
+
+def run_single_env_benchmark(
+    env_fn: 'Callable[[], gym.Env]',
+    steps_count: int,
+    seed: int = 0,
+    warmup_steps_count: int = 100
+):
+    """
+    Steps one environment with random actions. The latencies are the ones
+    of env.step; the resets after the end of an episode count in the
+    throughput but not in the latencies.
+    """
+
+    _seed_everything(seed)
+
+    start_rss = _get_rss_megabytes()
+
+    env = env_fn()
+    env.action_space.seed(seed)
+    env.reset(seed=seed)
+
+    latencies = []
+    episodes_count = 0
+
+    try:
+        for i in range(warmup_steps_count + steps_count):
+            if i == warmup_steps_count:
+                start_time = time.perf_counter()
+
+            action = env.action_space.sample()
+
+            step_start_time = time.perf_counter()
+            _, _, terminated, truncated, _ = env.step(action)
+            step_time = time.perf_counter() - step_start_time
+
+            if i >= warmup_steps_count:
+                latencies.append(step_time)
+
+            if terminated or truncated:
+                if i >= warmup_steps_count:
+                    episodes_count += 1
+
+                env.reset()
+
+        elapsed_time = time.perf_counter() - start_time
+        end_rss = _get_rss_megabytes()
+    finally:
+        env.close()
+
+    return {
+        "configuration": SINGLE_ENV,
+        "num_envs": 1,
+        "steps": steps_count,
+        "episodes": episodes_count,
+        "steps_per_second": steps_count / elapsed_time,
+        **_get_latency_statistics(latencies),
+        "rss_mb": end_rss,
+        "rss_increase_mb": _get_rss_difference(start_rss, end_rss)
+    }
+
+def run_vec_env_benchmark(
+    vec_env_class: 'type[VecEnv]',
+    env_fns: 'list[Callable[[], gym.Env]]',
+    steps_count: int,
+    seed: int = 0,
+    warmup_steps_count: int = 100
+):
+    """
+    Steps a VecEnv with random actions. steps_count is the number of calls
+    of step, so the throughput counts steps_count * num_envs environment
+    steps. The latencies are the ones of a call of step, automatic resets
+    included.
+    """
+
+    _seed_everything(seed)
+
+    start_rss = _get_rss_megabytes()
+
+    env = vec_env_class(env_fns)
+    env.seed(seed)
+    env.action_space.seed(seed)
+    env.reset()
+
+    latencies = []
+    episodes_count = 0
+
+    try:
+        for i in range(warmup_steps_count + steps_count):
+            if i == warmup_steps_count:
+                start_time = time.perf_counter()
+
+            actions = np.stack([env.action_space.sample() for _ in range(env.num_envs)])
+
+            step_start_time = time.perf_counter()
+            _, _, dones, _ = env.step(actions)
+            step_time = time.perf_counter() - step_start_time
+
+            if i >= warmup_steps_count:
+                latencies.append(step_time)
+                episodes_count += int(np.sum(dones))
+
+        elapsed_time = time.perf_counter() - start_time
+        end_rss = _get_rss_megabytes()
+        children_rss = _get_children_rss_megabytes(env)
+    finally:
+        env.close()
+
+    return {
+        "configuration": vec_env_class.__name__,
+        "num_envs": env.num_envs,
+        "steps": steps_count * env.num_envs,
+        "episodes": episodes_count,
+        "steps_per_second": steps_count * env.num_envs / elapsed_time,
+        **_get_latency_statistics(latencies),
+        # sampled at the end of the run, before the workers are closed
+        "rss_mb": end_rss,
+        "rss_increase_mb": _get_rss_difference(start_rss, end_rss),
+        "children_rss_mb": children_rss
+    }
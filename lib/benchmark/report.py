@@ -0,0 +1,34 @@
+import json
+import os
+import platform
+from datetime import datetime
+
+import numpy as np
+
+def get_metadata(**parameters):
+    """
+    Returns the machine and library versions of a run, along with the given
+    benchmark parameters.
+    """
+
+    return {
+        "date": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        **parameters
+    }
+
+def save_report(
+    report: dict,
+    file_path: str
+):
+    directory = os.path.dirname(file_path)
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(file_path, "w") as file:
+        json.dump(report, file, indent=4)
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+class _StepClock:
+    def __init__(self, rate: float):
+        self.period = 1 / rate if rate > 0 else 0
+        self._next_step_time = None
+
+    def get_delay(self):
+        if self.period == 0:
+            return 0
+
+        now = time.perf_counter()
+
+        if self._next_step_time is None or self._next_step_time < now - self.period:
+            self._next_step_time = now
+
+        delay = max(self._next_step_time - now, 0)
+        self._next_step_time += self.period
+
+        return delay
+
+class FrameScheduler:
+    """
+    Wakes the control loop up when a new vision frame arrives instead of
+    letting it spin. With a rate, steps are also spaced by a fixed period;
+    a loop waiting with get_timeout skips a period without a new frame.
+    """
+
+    def __init__(self, rate: float = 0):
+        self._clock = _StepClock(rate)
+
+        self._condition = threading.Condition()
+        self._frame_count = 0
+        self._last_frame_count = 0
+
+    def notify_frame(self):
+        with self._condition:
+            self._frame_count += 1
+            self._condition.notify_all()
+
+    def get_frame_count(self):
+        with self._condition:
+            return self._frame_count
+
+    def get_timeout(self):
+        """
+        Timeout of wait_for_frame for one period, None without a rate.
+        """
+
+        return self._clock.period if self._clock.period > 0 else None
+
+    def wait_for_frame(self, timeout: 'float | None' = None):
+        delay = self._clock.get_delay()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        with self._condition:
+            has_new_frame = self._condition.wait_for(
+                lambda: self._frame_count != self._last_frame_count,
+                timeout)
+
+            if has_new_frame:
+                self._last_frame_count = self._frame_count
+
+            return has_new_frame
+
+class AsyncFrameScheduler:
+    """
+    FrameScheduler for a control loop running on an asyncio event loop.
+    """
+
+    def __init__(self, rate: float = 0):
+        self._clock = _StepClock(rate)
+        self._event = asyncio.Event()
+
+    def notify_frame(self):
+        self._event.set()
+
+    def get_timeout(self):
+        return self._clock.period if self._clock.period > 0 else None
+
+    async def wait_for_frame(self, timeout: 'float | None' = None):
+        delay = self._clock.get_delay()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        self._event.clear()
+
+        return True
@@ -1,6 +1,8 @@
 import os
 from stable_baselines3.common.callbacks import BaseCallback
 from lib.curriculum.curriculum_task import CurriculumTask
+from lib.curriculum.metrics_writer import JSONL_FORMAT, MetricsWriter
+from lib.inference.shared_policy import SHARED_POLICY_EXTENSION, SharedPolicyPublisher
 
 class BehaviorCallback(BaseCallback):
     def __init__(
@@ -12,7 +14,9 @@ class BehaviorCallback(BaseCallback):
         log_path: str,
         tasks: 'list[CurriculumTask]',
         log_count=10000,
-        verbose=1
+        verbose=1,
+        shared_directory: 'str | None' = None,
+        metrics_format: str = JSONL_FORMAT
     ):
         super(BehaviorCallback, self).__init__(verbose)
 
@@ -29,8 +33,14 @@ class BehaviorCallback(BaseCallback):
         self.current_task_index = 0
         self.current_task = self.tasks[self.current_task_index]
         self.opponent_model_path = None
+        # task id and update count of the opponent model snapshot
+        self.opponent_model_key: 'tuple[str, int] | None' = None
 
-        self.log_file_name = "log.txt"
+        self.shared_directory = shared_directory
+        self.opponent_publisher: 'SharedPolicyPublisher | None' = None
+
+        self.metrics_format = metrics_format
+        self.metrics_writer: 'MetricsWriter | None' = None
 
     def _get_total_num_on_step_calls(self):
         return self.total_timesteps // self.training_env.num_envs
@@ -44,7 +54,29 @@ class BehaviorCallback(BaseCallback):
         if self._get_num_on_step_calls() % num_calls_to_update == 0:
             self._save_model()
         
+    def _publish_opponent_model(self):
+        if self.opponent_publisher is None:
+            self.opponent_publisher = SharedPolicyPublisher(
+                os.path.join(
+                    self.shared_directory,
+                    f"opponent_model{SHARED_POLICY_EXTENSION}"))
+
+        self.opponent_publisher.publish(self.model.policy)
+        self.opponent_model_path = self.opponent_publisher.file_path
+
     def _save_temporary_opponent_model(self):
+        opponent_model_key = (self.current_task.id, self.current_task.update_count)
+
+        # the opponent plays the snapshot taken when the task or its update changed
+        if opponent_model_key == self.opponent_model_key:
+            return
+
+        self.opponent_model_key = opponent_model_key
+
+        if self.shared_directory is not None:
+            self._publish_opponent_model()
+            return
+
         if self.opponent_model_path is not None:
             os.remove(self.opponent_model_path)
 
@@ -93,38 +125,53 @@ class BehaviorCallback(BaseCallback):
 
     def _try_update_scores(self):
         dones = self.locals["dones"]
-        last_games_scores = self.training_env.get_attr("last_game_score")
+        infos = self.locals["infos"]
 
         scores = []
 
         for i in range(len(dones)):
             if dones[i]:
-                last_score = last_games_scores[i]
+                last_score = infos[i].get("last_game_score", None)
 
                 if last_score is not None:
                     scores.append(last_score)
 
         self.current_task.set_scores(scores)
 
-    def _log(self, text: str):
-        with open(f"{self.log_path}/{self.log_file_name}", 'a') as file:
-            file.write(text)
+    def _log(self, event: str):
+        task = self.current_task
+        games_count = len(task.scores)
+        score_mean = float(task.get_scores_mean()) if games_count > 0 else None
+        wins_count, draws_count, losses_count = task.get_results_counts()
+
+        self.metrics_writer.write({
+            "event": event,
+            "timesteps": self.num_timesteps,
+            "task": task.id,
+            "update": task.update_count,
+            "games": games_count,
+            "score_mean": score_mean,
+            "wins": wins_count,
+            "draws": draws_count,
+            "losses": losses_count,
+            "threshold": task.get_update_threshold()
+        })
+
+        # kept in memory by the SB3 logger until its next dump
+        self.logger.record("curriculum/task_index", self.current_task_index)
+        self.logger.record("curriculum/update_count", task.update_count)
+        self.logger.record("curriculum/games", games_count)
+
+        if score_mean is not None:
+            self.logger.record("curriculum/score_mean", score_mean)
 
     def _try_log(self):
         num_calls_to_log = self._get_total_num_on_step_calls() // self.log_count
         if self._get_num_on_step_calls() % num_calls_to_log == 0:
-            self._log(
-                f"Task: {self.current_task.id}; "
-                f"Update: {self.current_task.update_count}; "
-                f"{self.current_task.get_scores_log_text()}.\n")
+            self._log("log")
             
     def _log_on_update(self):
-        self._log(
-            f"UPDATED; "
-            f"Timesteps: {self.num_timesteps}; "
-            f"Task: {self.current_task.id}; "
-            f"Update: {self.current_task.update_count}; "
-            f"{self.current_task.get_scores_log_text()}.\n")
+        self._log("update")
 
     def _on_step(self) -> bool:
         if self.num_timesteps > self.total_timesteps:
@@ -152,7 +199,15 @@ class BehaviorCallback(BaseCallback):
         return True
     
     def _on_training_start(self):
+        self.metrics_writer = MetricsWriter(
+            os.path.join(self.log_path, f"metrics.{self.metrics_format}"),
+            self.metrics_format)
+
         self._set_task()
 
     def _on_training_end(self):
-        self._save_model()
\ No newline at end of file
+        self._save_model()
+        self.metrics_writer.close()
+
+        if self.opponent_publisher is not None:
+            self.opponent_publisher.remove()
\ No newline at end of file
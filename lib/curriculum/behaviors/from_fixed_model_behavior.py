@@ -20,9 +20,23 @@ class FromFixedModelBehavior(Behavior):
 
         self.role_enum = role_enum
         self.model_id = ModelUtils.get_id()
-        self.model = ModelUtils.get_model(self.model_id, model_path)
+        self.model_path = model_path
+        self.model = None
         self.deterministic = deterministic
 
+    def __getstate__(self):
+        # the model is resolved by path in the process that steps the
+        # environment, where ModelUtils may hand out a remote or shared one
+        state = self.__dict__.copy()
+        state["model"] = None
+        return state
+
+    def _get_model(self):
+        if self.model is None:
+            self.model = ModelUtils.get_model(self.model_id, self.model_path)
+
+        return self.model
+
     def get_speeds(
         self,
         environment,
@@ -34,7 +48,7 @@ class FromFixedModelBehavior(Behavior):
             self.robot_id,
             self.is_yellow,
             not self.is_yellow,
-            self.model,
+            self._get_model(),
             self.deterministic
         )
 
@@ -19,18 +19,35 @@ class FromPreviousModelBehavior(Behavior):
 
         self.role_enum = role_enum
         self.model_id = ModelUtils.get_id()
+        self.model_path = None
         self.model = None
         self.deterministic = deterministic
 
+    def __getstate__(self):
+        # the model is resolved by path in the process that steps the
+        # environment, where ModelUtils may hand out a remote or shared one
+        state = self.__dict__.copy()
+        state["model"] = None
+        return state
+
     def set_model_path(self, model_path: str):
-        self.model = ModelUtils.get_model(self.model_id, model_path)
+        self.model_path = model_path
+        self.model = None
+
+    def _get_model(self):
+        if self.model is None and self.model_path is not None:
+            self.model = ModelUtils.get_model(self.model_id, self.model_path)
+
+        return self.model
 
     def get_speeds(
         self,
         environment,
         args: 'BehaviorArgs | None' = None
     ):
-        if self.model is None:
+        model = self._get_model()
+
+        if model is None:
             return 0, 0
         
         left_speed, right_speed = RoleUtils.get_speeds(
@@ -39,11 +56,12 @@ class FromPreviousModelBehavior(Behavior):
             self.robot_id,
             self.is_yellow,
             not self.is_yellow,
-            self.model,
+            model,
             self.deterministic
         )
 
         return self._get_final_speeds(left_speed, right_speed)
 
     def reset(self):
+        self.model_path = None
         self.model = None
\ No newline at end of file
@@ -1,8 +1,8 @@
-from collections import deque
-import numpy as np
+from statistics import NormalDist
 from lib.curriculum.behaviors.from_previous_model_behavior import FromPreviousModelBehavior
 from lib.curriculum.ball_curriculum_behavior import BallCurriculumBehavior
 from lib.curriculum.robot_curriculum_behavior import RobotCurriculumBehavior
+from lib.curriculum.score_statistics import RunningScores, ThresholdSchedule
 
 class CurriculumTask:
     def __init__(
@@ -14,7 +14,8 @@ class CurriculumTask:
         updates_per_task: int=100,
         games_count: int=100,
         threshold_intervals: 'list[tuple[int, float]]'=[],
-        default_threshold: float=.7
+        default_threshold: float=.7,
+        promotion_confidence: 'float | None'=None
     ):
         self.id = id
         self.behaviors = behaviors
@@ -25,7 +26,17 @@ class CurriculumTask:
         self.default_threshold=default_threshold
         self.threshold_intervals = threshold_intervals
 
-        self.scores = deque(maxlen=games_count)
+        self.threshold_schedule = ThresholdSchedule(threshold_intervals, default_threshold)
+        self._update_threshold = default_threshold
+
+        # with a confidence, the lower bound of the one-sided confidence
+        # interval of the mean must be over the threshold, not the mean
+        self.promotion_confidence = promotion_confidence
+        self._promotion_z = None if promotion_confidence is None \
+            else NormalDist().inv_cdf(promotion_confidence)
+
+        self.running_scores = RunningScores(games_count)
+        self.scores = self.running_scores.scores
 
         self.update(update_count)
 
@@ -36,7 +47,8 @@ class CurriculumTask:
         self.ball_behavior.update(times)
         self.update_count += times
 
-        self.scores.clear()
+        self._update_threshold = self.threshold_schedule.get_threshold(self.update_count)
+        self.running_scores.clear()
 
     def reset(self):
         for item in self.behaviors:
@@ -45,31 +57,36 @@ class CurriculumTask:
         self.ball_behavior.reset()
         self.update_count = 0
 
+        self._update_threshold = self.threshold_schedule.get_threshold(self.update_count)
+
     def set_scores(self, scores: 'list[int]'):
-        self.scores.extend(scores)
+        self.running_scores.extend(scores)
+
+    def get_update_threshold(self):
+        return self._update_threshold
 
-    def get_scores_log_text(self):
-        return f"Last {len(self.scores)} games score: {self.get_scores_mean()}"
-    
     def is_limit_reached(self):
-        if len(self.scores) < self.scores.maxlen:
+        if not self.running_scores.is_full():
             return False
-        
-        update_threshold = None
 
-        for item in self.threshold_intervals:
-            if item[0] > self.update_count:
-                break
+        mean = self.running_scores.get_mean()
 
-            update_threshold = item[1]
+        if self._promotion_z is None:
+            return mean > self._update_threshold
+
+        return mean - self.running_scores.get_margin(self._promotion_z) > self._update_threshold
 
-        if update_threshold is None:
-            update_threshold = self.default_threshold
-        
-        return self.get_scores_mean() > update_threshold
-    
     def get_scores_mean(self):
-        return np.mean(self.scores)
+        return self.running_scores.get_mean()
+
+    def get_scores_variance(self):
+        return self.running_scores.get_variance()
+
+    def get_scores_confidence_interval(self, confidence: float = .95):
+        return self.running_scores.get_confidence_interval(confidence)
+
+    def get_results_counts(self):
+        return self.running_scores.get_results_counts()
 
     def set_opponent_model_path(self, model_path: str):
         yellow_behaviors = self.get_yellow_behaviors()
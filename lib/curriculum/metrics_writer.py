@@ -0,0 +1,111 @@
+import csv
+import json
+import os
+import queue
+import threading
+import time
+
+JSONL_FORMAT = "jsonl"
+CSV_FORMAT = "csv"
+
+_CLOSE = object()
+
+class MetricsWriter:
+    """
+    Writes metric records (flat dictionaries) to a JSONL or CSV file from a
+    background thread.
+
+    write only puts the record in a bounded queue and never blocks: when
+    the queue is full, the record is dropped and counted in dropped_count.
+    The thread writes the queued records in batches and flushes the file
+    after each batch, so the file is opened once and flushed at most once
+    every flush_interval seconds.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        file_format: str = JSONL_FORMAT,
+        queue_size: int = 10000,
+        flush_interval: float = 1.0
+    ):
+        if file_format not in (JSONL_FORMAT, CSV_FORMAT):
+            raise ValueError(f"Unknown metrics format {file_format}")
+
+        directory = os.path.dirname(file_path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.file_path = file_path
+        self.file_format = file_format
+        self.flush_interval = flush_interval
+
+        self.queue: 'queue.Queue[dict]' = queue.Queue(queue_size)
+        self.dropped_count = 0
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, record: dict):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def close(self):
+        """
+        Writes the queued records and stops the thread.
+        """
+
+        self.queue.put(_CLOSE)
+        self.thread.join()
+
+    def _get_batch(self):
+        batch = [self.queue.get()]
+
+        # gathers the records that come within flush_interval of the first
+        deadline = time.monotonic() + self.flush_interval
+
+        try:
+            while batch[-1] is not _CLOSE:
+                timeout = deadline - time.monotonic()
+
+                if timeout <= 0:
+                    break
+
+                batch.append(self.queue.get(timeout=timeout))
+        except queue.Empty:
+            pass
+
+        return batch
+
+    def _run(self):
+        with open(self.file_path, "a", newline="") as file:
+            csv_writer = None
+
+            # a CSV file that already has rows keeps its header
+            has_header = file.tell() > 0
+
+            while True:
+                batch = self._get_batch()
+                closed = batch[-1] is _CLOSE
+                records = batch[:-1] if closed else batch
+
+                for record in records:
+                    if self.file_format == JSONL_FORMAT:
+                        file.write(json.dumps(record) + "\n")
+                        continue
+
+                    if csv_writer is None:
+                        csv_writer = csv.DictWriter(file, fieldnames=list(record.keys()), extrasaction="ignore")
+
+                        if not has_header:
+                            csv_writer.writeheader()
+
+                    csv_writer.writerow(record)
+
+                file.flush()
+
+                if closed:
+                    break
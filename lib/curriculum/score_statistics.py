@@ -0,0 +1,117 @@
+import bisect
+from collections import deque
+from statistics import NormalDist
+
+import numpy as np
+
+class RunningScores:
+    """
+    Deque of the last game scores with running sums, so the mean, the
+    variance and the win, draw and loss counts take O(1) per score instead
+    of a pass over the deque. Positive scores are wins, zero scores draws
+    and negative scores losses.
+    """
+
+    def __init__(self, maxlen: int):
+        self.scores = deque(maxlen=maxlen)
+        self.clear()
+
+    def __len__(self):
+        return len(self.scores)
+
+    def is_full(self):
+        return len(self.scores) == self.scores.maxlen
+
+    def clear(self):
+        self.scores.clear()
+        self.sum = 0.0
+        self.squares_sum = 0.0
+        self.wins_count = 0
+        self.draws_count = 0
+        self.losses_count = 0
+
+    def _count(
+        self,
+        score: float,
+        sign: int
+    ):
+        self.sum += sign * score
+        self.squares_sum += sign * score * score
+
+        if score > 0:
+            self.wins_count += sign
+        elif score < 0:
+            self.losses_count += sign
+        else:
+            self.draws_count += sign
+
+    def extend(self, scores: 'list[float]'):
+        for score in scores:
+            if self.is_full():
+                self._count(self.scores[0], -1)
+
+            self.scores.append(score)
+            self._count(score, 1)
+
+    def get_mean(self):
+        if len(self.scores) == 0:
+            return np.nan
+
+        return self.sum / len(self.scores)
+
+    def get_variance(self):
+        """
+        Sample variance of the scores.
+        """
+
+        count = len(self.scores)
+
+        if count < 2:
+            return np.nan
+
+        mean = self.sum / count
+        variance = (self.squares_sum - count * mean * mean) / (count - 1)
+
+        # the running sums can leave a tiny negative value for equal scores
+        return max(variance, 0.0)
+
+    def get_margin(self, z: float):
+        return z * np.sqrt(self.get_variance() / len(self.scores))
+
+    def get_confidence_interval(self, confidence: float = .95):
+        """
+        Two-sided normal approximation interval of the mean.
+        """
+
+        if len(self.scores) < 2:
+            return np.nan, np.nan
+
+        mean = self.get_mean()
+        margin = self.get_margin(NormalDist().inv_cdf((1 + confidence) / 2))
+
+        return mean - margin, mean + margin
+
+    def get_results_counts(self):
+        return self.wins_count, self.draws_count, self.losses_count
+
+class ThresholdSchedule:
+    """
+    Threshold of each update count: the one of the last interval starting
+    at or before it, or the default before the first one. The intervals are
+    sorted once and searched with bisect.
+    """
+
+    def __init__(
+        self,
+        threshold_intervals: 'list[tuple[int, float]]',
+        default_threshold: float
+    ):
+        sorted_intervals = sorted(threshold_intervals, key=lambda item: item[0])
+
+        self.updates = [item[0] for item in sorted_intervals]
+        self.thresholds = [item[1] for item in sorted_intervals]
+        self.default_threshold = default_threshold
+
+    def get_threshold(self, update_count: int):
+        index = bisect.bisect_right(self.updates, update_count) - 1
+        return self.default_threshold if index < 0 else self.thresholds[index]
@@ -0,0 +1,139 @@
+import numpy as np
+
+X = 0
+Y = 1
+THETA = 2
+V_X = 3
+V_Y = 4
+V_THETA = 5
+ROBOT_FEATURES_COUNT = 6
+
+BALL_X = 0
+BALL_Y = 1
+BALL_Z = 2
+BALL_V_X = 3
+BALL_V_Y = 4
+BALL_FEATURES_COUNT = 5
+
+class RobotView:
+    __slots__ = ("_robots", "_index", "id", "yellow")
+
+    def __init__(
+        self,
+        robots: np.ndarray,
+        index: int,
+        id: int,
+        yellow: bool
+    ):
+        self._robots = robots
+        self._index = index
+        self.id = id
+        self.yellow = yellow
+
+    @property
+    def x(self):
+        return float(self._robots[self._index, X])
+
+    @property
+    def y(self):
+        return float(self._robots[self._index, Y])
+
+    @property
+    def theta(self):
+        return float(self._robots[self._index, THETA])
+
+    @property
+    def v_x(self):
+        return float(self._robots[self._index, V_X])
+
+    @property
+    def v_y(self):
+        return float(self._robots[self._index, V_Y])
+
+    @property
+    def v_theta(self):
+        return float(self._robots[self._index, V_THETA])
+
+    def __repr__(self):
+        return f'RobotView(id: {self.id}, yellow: {self.yellow}, x: {self.x:.02f}, y: {self.y:.02f})'
+
+class BallView:
+    __slots__ = ("_ball",)
+
+    def __init__(self, ball: np.ndarray):
+        self._ball = ball
+
+    @property
+    def x(self):
+        return float(self._ball[BALL_X])
+
+    @property
+    def y(self):
+        return float(self._ball[BALL_Y])
+
+    @property
+    def z(self):
+        return float(self._ball[BALL_Z])
+
+    @property
+    def v_x(self):
+        return float(self._ball[BALL_V_X])
+
+    @property
+    def v_y(self):
+        return float(self._ball[BALL_V_Y])
+
+    def __repr__(self):
+        return f'BallView(x: {self.x:.02f}, y: {self.y:.02f})'
+
+class ArrayFrame:
+    """
+    Structure-of-arrays replacement for the rSoccer frame.
+
+    Robots are stored as rows of a single array (blue robots first, then
+    yellow robots) and the ball as a separate array. The views in
+    robots_blue, robots_yellow and ball are created once and read the
+    arrays on access, so refilling the frame does not allocate objects.
+    """
+
+    def __init__(
+        self,
+        n_robots_blue: int,
+        n_robots_yellow: int
+    ):
+        self.n_robots_blue = n_robots_blue
+        self.n_robots_yellow = n_robots_yellow
+
+        self.robots = np.zeros(
+            (n_robots_blue + n_robots_yellow, ROBOT_FEATURES_COUNT),
+            dtype=np.float32)
+
+        self.ball_array = np.zeros(BALL_FEATURES_COUNT, dtype=np.float32)
+
+        self.ball = BallView(self.ball_array)
+
+        self.robots_blue = {
+            i: RobotView(self.robots, i, i, False)
+            for i in range(n_robots_blue)
+        }
+
+        self.robots_yellow = {
+            i: RobotView(self.robots, n_robots_blue + i, i, True)
+            for i in range(n_robots_yellow)
+        }
+
+    def set_by_rsim_state(self, state):
+        state = np.asarray(state)
+        robots_end = BALL_FEATURES_COUNT + len(self.robots) * ROBOT_FEATURES_COUNT
+
+        self.ball_array[:] = state[:BALL_FEATURES_COUNT]
+        self.robots[:] = state[BALL_FEATURES_COUNT:robots_end]\
+            .reshape(-1, ROBOT_FEATURES_COUNT)
+
+        # the rendering frame has the y axis inverted; as in the previous
+        # frame conversion, only the ball position is inverted
+        self.ball_array[BALL_Y] *= -1
+        self.robots[:, [Y, V_Y]] *= -1
+        self.robots[:, THETA] = (360 - self.robots[:, THETA] % 360) % 360
+
+        return self
@@ -0,0 +1,50 @@
+from math import floor
+from lib.domain.univector_field_navigation.obstacle import Obstacle
+
+class ObstacleGrid:
+    """
+    Uniform grid over obstacles. A query only visits the cells around a
+    position, so obstacles far from it are skipped without computing their
+    distances.
+    """
+
+    def __init__(
+        self,
+        cell_size: float,
+        obstacles: 'list[Obstacle]' = ()
+    ):
+        self.cell_size = cell_size
+        self.cells: 'dict[tuple[int, int], list[Obstacle]]' = {}
+
+        for obstacle in obstacles:
+            self.add(obstacle)
+
+    def _get_cell_index(self, value: float):
+        return floor(value / self.cell_size)
+
+    def add(self, obstacle: Obstacle):
+        cell = (
+            self._get_cell_index(obstacle.position[0]),
+            self._get_cell_index(obstacle.position[1]))
+
+        self.cells.setdefault(cell, []).append(obstacle)
+
+    def get_obstacles_near(
+        self,
+        position: 'tuple[float, float]',
+        radius: float
+    ):
+        """
+        Returns the obstacles of the cells touched by the square of side
+        2 radius around the position. Some of them may be farther than the
+        radius.
+        """
+
+        x, y = position
+        obstacles = []
+
+        for i in range(self._get_cell_index(x - radius), self._get_cell_index(x + radius) + 1):
+            for j in range(self._get_cell_index(y - radius), self._get_cell_index(y + radius) + 1):
+                obstacles.extend(self.cells.get((i, j), ()))
+
+        return obstacles
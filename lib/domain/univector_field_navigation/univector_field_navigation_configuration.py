@@ -13,10 +13,15 @@ class UnivectorFieldNavigationConfiguration:
         kr: float = KR,
         k_0: float = K_0,
         d_min: float = D_MIN,
-        gaussian_delta: float = GAUSSIAN_DELTA
+        gaussian_delta: float = GAUSSIAN_DELTA,
+        influence_radius: 'float | None' = None
     ):
         self.de = de
         self.kr = kr
         self.k_0 = k_0
         self.d_min = d_min
         self.gaussian_delta = gaussian_delta
+
+        # past this distance the gaussian weight of an obstacle is below 4e-4
+        self.influence_radius = d_min + 4 * gaussian_delta \
+            if influence_radius is None else influence_radius
@@ -1,11 +1,8 @@
 import math
 import numpy as np
 from gymnasium.spaces import Box
-from rsoccer_gym.Entities import Robot
 from lib.curriculum.curriculum_task import CurriculumTask
 from lib.environment.base_curriculum_environment import BaseCurriculumEnvironment
-from lib.utils.geometry_utils import GeometryUtils
-from lib.utils.rsoccer.rsoccer_utils import RSoccerUtils
 
 class AttackerEnvironment(BaseCurriculumEnvironment):
     def __init__(
@@ -38,72 +35,11 @@ class AttackerEnvironment(BaseCurriculumEnvironment):
         return False
 
     def _frame_to_observations(self):
-        observation = []
-
-        current_robot = self._get_robot_by_id(self.robot_id, False)
-        ball = self._get_ball()
-
-        def get_normalized_distance(distance: float):
-            return distance / self._get_max_distance()
-
-        def extend_observation_by_ball():
-            current_robot_position = current_robot.x, current_robot.y
-            ball_position = ball.x, ball.y
-
-            distance = GeometryUtils.distance(current_robot_position, ball_position)
-            angle = GeometryUtils.angle_between_points(current_robot_position, ball_position)
-
-            observation.extend([
-                get_normalized_distance(distance),
-                angle / np.pi,
-                self.norm_v(ball.v_x),
-                self.norm_v(ball.v_y)
-            ])
-
-        def extend_observation_by_current_robot():
-            theta = RSoccerUtils.get_corrected_angle(current_robot.theta) / np.pi
-
-            observation.extend([
-                self.norm_x(current_robot.x),
-                self.norm_y(current_robot.y),
-                theta,
-                self.norm_v(current_robot.v_x),
-                self.norm_v(current_robot.v_y)
-            ])
-
-        def extend_observation_by_robot(robot: Robot):
-            if self._is_inside_field((robot.x, robot.y)):
-                theta = RSoccerUtils.get_corrected_angle(robot.theta) / np.pi
-
-                current_robot_position = current_robot.x, current_robot.y
-                robot_position = robot.x, robot.y
-
-                distance = GeometryUtils.distance(current_robot_position, robot_position)
-                angle = GeometryUtils.angle_between_points(current_robot_position, robot_position)
-
-                observation.extend([
-                    get_normalized_distance(distance),
-                    angle / np.pi,
-                    theta,
-                    self.norm_v(robot.v_x),
-                    self.norm_v(robot.v_y)
-                ])
-            else:
-                observation.extend([0, 0, 0, 0, 0])
-
-        extend_observation_by_ball()
-        extend_observation_by_current_robot()
-
-        frame = self.frame
-
-        for i in range(self.n_robots_blue):
-            if i != self.robot_id:
-                extend_observation_by_robot(frame.robots_blue[i])
-
-        for i in range(self.n_robots_yellow):
-            extend_observation_by_robot(frame.robots_yellow[i])
-
-        return np.array(observation, dtype=np.float32)
+        return self.observation_builder.get_attacker_observation(
+            self.robot_id,
+            False,
+            True
+        ).copy()
 
     def _ball_gradient_reward(
         self,
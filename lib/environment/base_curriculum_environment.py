@@ -1,4 +1,7 @@
+import os
 import random
+import time
+import uuid
 import numpy as np
 
 from rsoccer_gym.Entities import Frame, Robot, Ball
@@ -10,6 +13,8 @@ from lib.curriculum.curriculum_task import CurriculumTask
 from lib.domain.enums.role_enum import RoleEnum
 from lib.curriculum.robot_curriculum_behavior import RobotCurriculumBehavior
 from lib.environment.base_environment import BaseEnvironment
+from lib.environment.step_profiler import StepProfiler
+from lib.environment.trajectory_recorder import TrajectoryRecorder
 from lib.domain.position_setup_args import PositionSetupArgs
 
 from configuration.configuration import Configuration
@@ -52,6 +57,29 @@ class BaseCurriculumEnvironment(BaseEnvironment):
         self.is_yellow_team = False
         self.is_left_team = True
 
+        if Configuration.rsoccer_training_profiling_enabled:
+            self.profiler = StepProfiler(
+                Configuration.rsoccer_training_profiling_capacity,
+                Configuration.rsoccer_training_profiling_report_interval,
+                Configuration.rsoccer_training_profiling_directory)
+
+        if Configuration.rsoccer_training_trajectory_recording_enabled:
+            self.trajectory_recorder = TrajectoryRecorder(
+                os.path.join(
+                    Configuration.rsoccer_training_trajectory_recording_directory,
+                    f"env_{uuid.uuid4().hex[:8]}"),
+                Configuration.rsoccer_training_trajectory_recording_chunk_size)
+
+    def step(self, action):
+        observation, reward, terminated, truncated, info = super().step(action)
+
+        # the VecEnvs reset the environment at the end of an episode, which
+        # clears last_game_score before the callback could read it
+        if terminated or truncated:
+            info["last_game_score"] = self.last_game_score
+
+        return observation, reward, terminated, truncated, info
+
     def reset(
         self,
         *,
@@ -67,7 +95,13 @@ class BaseCurriculumEnvironment(BaseEnvironment):
         role_enum: 'RoleEnum | None' = None
     ):
         args = BehaviorArgs(role_enum)
-        left_speed, right_speed = behavior.behavior.get_speeds(self, args)
+
+        if self.profiler is None:
+            left_speed, right_speed = behavior.behavior.get_speeds(self, args)
+        else:
+            start_time = time.perf_counter()
+            left_speed, right_speed = behavior.behavior.get_speeds(self, args)
+            self.profiler.add("opponent_get_speeds", time.perf_counter() - start_time)
 
         return self._create_robot_command(
             behavior.robot_id,
@@ -192,5 +226,8 @@ class BaseCurriculumEnvironment(BaseEnvironment):
 
         return frame
 
+    def _get_trajectory_task(self):
+        return self.task.id, self.task.update_count
+
     def set_task(self, task: CurriculumTask):
         self.task = task
@@ -9,7 +9,11 @@ from rsoccer_gym.Render import COLORS, VSSRenderField, VSSRobot, Ball
 from rsoccer_gym.Simulators.rsim import RSimVSS
 from rsoccer_gym.Utils import KDTree
 
+from lib.domain.array_frame import ArrayFrame
 from lib.domain.field import Field
+from lib.environment.step_profiler import StepProfiler
+from lib.environment.trajectory_recorder import TrajectoryRecorder
+from lib.observation.observation_builder import ObservationBuilder
 from lib.utils.geometry_utils import GeometryUtils
 from lib.utils.field_utils import FieldUtils
 from lib.utils.rsoccer.rsoccer_utils import RSoccerUtils
@@ -56,14 +60,23 @@ class BaseEnvironment(gym.Env):
         # 0.04 = robot radius (0.0375) + wheel thicknees (0.0025)
         self.max_w = np.rad2deg(self.max_v / 0.04)
 
-        self.frame: Frame = None
-        self.last_frame: Frame = None
+        self.frame: ArrayFrame = None
+        self.last_frame: ArrayFrame = None
 
-        self.rendering_frame: Frame = None
+        self._frames = [
+            ArrayFrame(n_robots_blue, n_robots_yellow),
+            ArrayFrame(n_robots_blue, n_robots_yellow)
+        ]
 
         self.steps = 0
         self.sent_commands = None
 
+        # timings of the phases of step and reset, off when None
+        self.profiler: 'StepProfiler | None' = None
+
+        # transitions streamed to disk, off when None
+        self.trajectory_recorder: 'TrajectoryRecorder | None' = None
+
         self.field_renderer = VSSRenderField()
         self.window_surface = None
         self.window_size = self.field_renderer.window_size
@@ -72,26 +85,87 @@ class BaseEnvironment(gym.Env):
         self.field = Field()
         self.opponent_field = Field()
 
+        self.observation_builder = ObservationBuilder(
+            self.get_max_x(),
+            self.get_max_y(),
+            self.max_v,
+            self._get_max_distance(),
+            self.get_field_length(),
+            self.get_field_width(),
+            self.get_goal_width(),
+            self.get_goal_depth(),
+            clip_distance=False,
+            robots_count=n_robots_blue)
+
     def step(self, action):
+        profiler = self.profiler
+
+        if profiler is not None:
+            profiler.start()
+
         self.steps += 1
         commands: List[Robot] = self._get_commands(action)
+
+        if profiler is not None:
+            profiler.mark("get_commands")
+
         self.rsim.send_commands(commands)
         self.sent_commands = commands
 
+        if profiler is not None:
+            profiler.mark("send_commands")
+
         self.last_frame = self.frame
 
         self._set_frame()
 
         observation = self._frame_to_observations()
+
+        if profiler is not None:
+            profiler.mark("frame_to_observations")
+
         reward, done = self._calculate_reward_and_done()
 
+        if profiler is not None:
+            profiler.mark("calculate_reward_and_done")
+
+        if self.trajectory_recorder is not None:
+            task_id, update_count = self._get_trajectory_task()
+
+            self.trajectory_recorder.record(
+                self.frame,
+                observation,
+                action,
+                reward,
+                done,
+                task_id,
+                update_count)
+
+            if profiler is not None:
+                profiler.mark("record_trajectory")
+
         if self.render_mode == "human":
             self.render()
 
-        return observation, reward, done, False, {}
+        info = {}
+
+        if profiler is not None:
+            profiler.mark("render")
+            summary = profiler.finish()
+
+            if summary is not None:
+                info["profile"] = summary
+
+        return observation, reward, done, False, info
 
     def reset(self, *, seed=None, options=None):
         super().reset(seed=seed, options=options)
+
+        profiler = self.profiler
+
+        if profiler is not None:
+            profiler.start("reset.")
+
         self.steps = 0
         self.last_frame = None
         self.sent_commands = None
@@ -100,33 +174,48 @@ class BaseEnvironment(gym.Env):
             self._get_initial_positions_frame()
         )
 
+        if profiler is not None:
+            profiler.mark("get_initial_positions_frame")
+
         self.rsim.reset(initial_pos_frame)
+
+        if profiler is not None:
+            profiler.mark("rsim_reset")
+
         self._set_frame()
 
         obs = self._frame_to_observations()
 
+        if self.trajectory_recorder is not None:
+            self.trajectory_recorder.set_observation(obs)
+
+        if profiler is not None:
+            profiler.mark("frame_to_observations")
+
         if self.render_mode == "human":
             self.render()
 
+        if profiler is not None:
+            profiler.mark("render")
+            profiler.finish(counted=False)
+
         return obs, {}
     
     def _set_frame(self):
-        self.rendering_frame = self._get_rendering_frame_from_rsim()
-        self.frame = RSoccerUtils._get_frame_by_rendering_frame(self.rendering_frame)
+        frame = self._frames[0] if self._frames[0] is not self.frame else self._frames[1]
 
-        RSoccerUtils.set_field_by_frame(self.field, self.frame, False)
-        RSoccerUtils.set_field_by_frame(self.opponent_field, self.frame, True)
-    
-    def _get_rendering_frame_from_rsim(self):
-        rendering_frame = self.rsim.get_frame()
+        self.frame = frame.set_by_rsim_state(self.rsim.simulator.get_state())
+
+        if self.profiler is not None:
+            self.profiler.mark("frame_copy")
 
-        for item in rendering_frame.robots_blue:
-            rendering_frame.robots_blue[item].yellow = False
+        RSoccerUtils.set_field_by_array_frame(self.field, self.frame, False)
+        RSoccerUtils.set_field_by_array_frame(self.opponent_field, self.frame, True)
 
-        for item in rendering_frame.robots_yellow:
-            rendering_frame.robots_yellow[item].yellow = True
+        self.observation_builder.set_array_frame(self.frame)
 
-        return rendering_frame
+        if self.profiler is not None:
+            self.profiler.mark("set_frame")
 
     def _render(self):
         def pos_transform(pos_x, pos_y):
@@ -136,19 +225,19 @@ class BaseEnvironment(gym.Env):
             )
 
         ball = Ball(
-            *pos_transform(self.rendering_frame.ball.x, self.rendering_frame.ball.y),
+            *pos_transform(self.frame.ball.x, -self.frame.ball.y),
             self.field_renderer.scale
         )
 
         self.field_renderer.draw(self.window_surface)
 
         for i in range(self.n_robots_blue):
-            robot = self.rendering_frame.robots_blue[i]
-            x, y = pos_transform(robot.x, robot.y)
+            robot = self.frame.robots_blue[i]
+            x, y = pos_transform(robot.x, -robot.y)
             rbt = VSSRobot(
                 x,
                 y,
-                robot.theta,
+                RSoccerUtils.get_angle_inverted_y_axis(robot.theta),
                 self.field_renderer.scale,
                 robot.id,
                 COLORS["BLUE"],
@@ -156,12 +245,12 @@ class BaseEnvironment(gym.Env):
             rbt.draw(self.window_surface)
 
         for i in range(self.n_robots_yellow):
-            robot = self.rendering_frame.robots_yellow[i]
-            x, y = pos_transform(robot.x, robot.y)
+            robot = self.frame.robots_yellow[i]
+            x, y = pos_transform(robot.x, -robot.y)
             rbt = VSSRobot(
                 x,
                 y,
-                robot.theta,
+                RSoccerUtils.get_angle_inverted_y_axis(robot.theta),
                 self.field_renderer.scale,
                 robot.id,
                 COLORS["YELLOW"],
@@ -218,6 +307,9 @@ class BaseEnvironment(gym.Env):
             pygame.quit()
         self.rsim.stop()
 
+        if self.trajectory_recorder is not None:
+            self.trajectory_recorder.close()
+
     def _get_commands(self, action):
         """returns a list of commands of type List[Robot] from type action_space action"""
         raise NotImplementedError
@@ -233,6 +325,10 @@ class BaseEnvironment(gym.Env):
     def _get_initial_positions_frame(self) -> Frame:
         """returns frame with robots initial positions"""
         raise NotImplementedError
+
+    def _get_trajectory_task(self) -> 'tuple[str, int]':
+        """returns the task id and update count stored with the recorded transitions"""
+        return "", 0
     
     def _get_episode_elapsed_time(self):
         return int(self.steps * self.time_step)
@@ -1,10 +1,8 @@
 import numpy as np
 from gymnasium.spaces import Box
-from rsoccer_gym.Entities import Robot
 from lib.curriculum.curriculum_task import CurriculumTask
 from lib.environment.base_curriculum_environment import BaseCurriculumEnvironment
 from lib.utils.geometry_utils import GeometryUtils
-from lib.utils.rsoccer.rsoccer_utils import RSoccerUtils
 
 class GoalkeeperEnvironment(BaseCurriculumEnvironment):
     def __init__(
@@ -56,43 +54,11 @@ class GoalkeeperEnvironment(BaseCurriculumEnvironment):
         return False
 
     def _frame_to_observations(self):
-        observation = []
-
-        current_robot = self._get_robot_by_id(
+        return self.observation_builder.get_goalkeeper_observation(
             self.robot_id,
-            self.is_yellow_team
-        )
-        ball = self._get_ball()
-
-        def extend_observation_by_ball():
-            observation.extend([
-                self.norm_x(ball.x),
-                self.norm_y(ball.y),
-                self.norm_v(ball.v_x),
-                self.norm_v(ball.v_y)
-            ])
-
-        def extend_observation_by_robot(robot: Robot):
-            theta = RSoccerUtils.get_corrected_angle(current_robot.theta) / np.pi
-
-            if self._is_inside_field((robot.x, robot.y)): 
-                observation.extend([
-                    self.norm_x(robot.x),
-                    self.norm_y(robot.y),
-                    theta,
-                    self.norm_v(robot.v_x),
-                    self.norm_v(robot.v_y)
-                ])
-            else:
-                observation.extend([0, 0, 0, 0, 0])
-
-        extend_observation_by_ball()
-
-        frame = self.frame
-
-        extend_observation_by_robot(frame.robots_blue[0])
-
-        return np.array(observation, dtype=np.float32)
+            self.is_yellow_team,
+            True
+        ).copy()
 
     def _ball_gradient_reward_by_positions(
         self,
@@ -0,0 +1,443 @@
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, List, Optional, Sequence, Type
+
+import gymnasium as gym
+import numpy as np
+from stable_baselines3.common.vec_env.base_vec_env import (
+    CloudpickleWrapper,
+    VecEnv,
+    VecEnvIndices,
+    VecEnvObs,
+    VecEnvStepReturn,
+)
+from stable_baselines3.common.vec_env.patch_gym import _patch_env
+from lib.inference.batched_inference import BatchedInference
+from lib.utils.model_utils import ModelUtils
+
+# command written in the shared commands array before waking a worker
+STEP_COMMAND = 1
+PIPE_COMMAND = 2
+
+# message left by a worker after a step
+NO_MESSAGE = 0
+INFO_MESSAGE = 1
+ERROR_MESSAGE = 2
+
+def _get_specs(
+    n_envs: int,
+    n_workers: int,
+    observation_space: gym.spaces.Space,
+    action_space: gym.spaces.Space
+):
+    return {
+        "observations": ((n_envs, *observation_space.shape), observation_space.dtype),
+        "actions": ((n_envs, *action_space.shape), action_space.dtype),
+        "rewards": ((n_envs,), np.float64),
+        "dones": ((n_envs,), np.bool_),
+        "truncated": ((n_envs,), np.bool_),
+        "messages": ((n_envs,), np.int8),
+        "commands": ((n_workers,), np.int8)
+    }
+
+class _SharedArrays:
+    def __init__(
+        self,
+        specs: 'dict[str, tuple[tuple, np.dtype]]',
+        names: 'dict[str, str] | None' = None
+    ):
+        self.memories: 'dict[str, SharedMemory]' = {}
+        self.arrays: 'dict[str, np.ndarray]' = {}
+
+        for key, (shape, dtype) in specs.items():
+            if names is None:
+                size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+                memory = SharedMemory(create=True, size=size)
+            else:
+                memory = SharedMemory(name=names[key])
+
+            self.memories[key] = memory
+            self.arrays[key] = np.ndarray(shape, dtype, buffer=memory.buf)
+
+    def get_names(self):
+        return {key: memory.name for key, memory in self.memories.items()}
+
+    def close(self, unlink: bool = False):
+        self.arrays = {}
+
+        for memory in self.memories.values():
+            memory.close()
+
+            if unlink:
+                memory.unlink()
+
+class _Worker:
+    def __init__(
+        self,
+        indices: 'list[int]',
+        remote,
+        envs: 'list[gym.Env]',
+        batched_inference: 'BatchedInference | None' = None
+    ):
+        self.indices = indices
+        self.remote = remote
+        self.envs = dict(zip(indices, envs))
+        self.batched_inference = batched_inference
+        self.shared_arrays: '_SharedArrays | None' = None
+        self.executor: 'ThreadPoolExecutor | None' = None
+
+        if batched_inference is not None:
+            self.executor = ThreadPoolExecutor(len(indices))
+
+    def _step_env(self, index: int):
+        """
+        Steps one environment and returns the message to send for it, if
+        any. The messages are sent by step in the order of the indices.
+        """
+
+        arrays = self.shared_arrays.arrays
+        env = self.envs[index]
+
+        try:
+            observation, reward, terminated, truncated, info = env.step(arrays["actions"][index].copy())
+
+            has_info = len(info) > 0
+            done = terminated or truncated
+            info["TimeLimit.truncated"] = truncated and not terminated
+
+            arrays["rewards"][index] = reward
+            arrays["dones"][index] = done
+            arrays["truncated"][index] = info["TimeLimit.truncated"]
+            arrays["messages"][index] = NO_MESSAGE
+
+            message = None
+
+            if done:
+                info["terminal_observation"] = observation
+                observation, reset_info = env.reset()
+
+                message = (info, reset_info)
+                arrays["messages"][index] = INFO_MESSAGE
+            elif has_info:
+                message = (info, {})
+                arrays["messages"][index] = INFO_MESSAGE
+
+            arrays["observations"][index] = observation
+
+            return message
+        except Exception as exception:
+            arrays["messages"][index] = ERROR_MESSAGE
+            return exception
+        finally:
+            if self.batched_inference is not None:
+                self.batched_inference.finish()
+
+    def step(self):
+        if self.executor is None:
+            messages = [self._step_env(index) for index in self.indices]
+        else:
+            # the environments are stepped in threads so that the predict
+            # calls of their opponents are batched
+            self.batched_inference.begin(len(self.indices))
+            messages = list(self.executor.map(self._step_env, self.indices))
+
+        for message in messages:
+            if message is not None:
+                self.remote.send(message)
+
+    def run_pipe_command(self):
+        # Import here to avoid a circular import
+        from stable_baselines3.common.env_util import is_wrapped
+
+        command, index, data = self.remote.recv()
+        env = self.envs[index]
+
+        if command == "reset":
+            maybe_options = {"options": data[1]} if data[1] else {}
+            result = env.reset(seed=data[0], **maybe_options)
+        elif command == "attach":
+            self.shared_arrays = _SharedArrays(data[1], data[0])
+            result = None
+        elif command == "get_spaces":
+            result = (env.observation_space, env.action_space)
+        elif command == "render":
+            result = env.render()
+        elif command == "env_method":
+            result = env.get_wrapper_attr(data[0])(*data[1], **data[2])
+        elif command == "get_attr":
+            result = env.get_wrapper_attr(data)
+        elif command == "set_attr":
+            result = setattr(env.unwrapped, data[0], data[1])
+        elif command == "is_wrapped":
+            result = is_wrapped(env, data)
+        elif command == "close":
+            for item in self.envs.values():
+                item.close()
+
+            if self.executor is not None:
+                self.executor.shutdown()
+
+            if self.shared_arrays is not None:
+                self.shared_arrays.close()
+
+            self.remote.send(None)
+            return False
+        else:
+            raise NotImplementedError(f"`{command}` is not implemented in the worker")
+
+        self.remote.send(result)
+
+        return True
+
+def _worker(
+    worker_index: int,
+    indices: 'list[int]',
+    remote,
+    parent_remote,
+    env_fns_wrapper: CloudpickleWrapper,
+    command_semaphore,
+    result_semaphore,
+    batch_inference: bool
+):
+    parent_remote.close()
+
+    batched_inference = None
+
+    if batch_inference and len(indices) > 1:
+        batched_inference = BatchedInference()
+        ModelUtils.set_batched_inference(batched_inference)
+
+    envs = [_patch_env(env_fn()) for env_fn in env_fns_wrapper.var]
+    worker = _Worker(indices, remote, envs, batched_inference)
+
+    while True:
+        command_semaphore.acquire()
+
+        shared_arrays = worker.shared_arrays
+        is_step = shared_arrays is not None \
+            and shared_arrays.arrays["commands"][worker_index] == STEP_COMMAND
+
+        if is_step:
+            worker.step()
+            result_semaphore.release()
+            continue
+
+        try:
+            if not worker.run_pipe_command():
+                break
+        except EOFError:
+            break
+        except Exception as exception:
+            remote.send(exception)
+
+    remote.close()
+
+class SharedMemoryVecEnv(VecEnv):
+    """
+    Drop-in replacement of SubprocVecEnv that exchanges the actions,
+    observations, rewards and dones of every step through shared memory.
+
+    A step only writes the actions into the shared arrays and wakes the
+    workers through semaphores; the pipes are used for the infos of the
+    steps that end an episode or that have entries of their own, and for
+    the other VecEnv methods.
+
+    The environments are split among n_workers processes (one per
+    environment by default). With batch_inference, a process hosting more
+    than one environment steps them in threads and the predict calls of the
+    models loaded through ModelUtils are batched across them.
+    """
+
+    def __init__(
+        self,
+        env_fns: 'List[Callable[[], gym.Env]]',
+        start_method: Optional[str] = None,
+        n_workers: Optional[int] = None,
+        batch_inference: bool = True
+    ):
+        self.waiting = False
+        self.closed = False
+
+        n_envs = len(env_fns)
+        n_workers = n_envs if n_workers is None else min(n_workers, n_envs)
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+
+        ctx = mp.get_context(start_method)
+
+        # the workers share the tracker of this process, so attaching to the
+        # shared arrays does not make them clean the arrays up on exit
+        resource_tracker.ensure_running()
+
+        self.worker_indices = [
+            [int(index) for index in indices]
+            for indices in np.array_split(np.arange(n_envs), n_workers)
+        ]
+        self.env_workers = [
+            worker_index
+            for worker_index, indices in enumerate(self.worker_indices)
+            for _ in indices
+        ]
+
+        self.result_semaphore = ctx.Semaphore(0)
+        self.command_semaphores = [ctx.Semaphore(0) for _ in range(n_workers)]
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_workers)])
+        self.processes = []
+        self.shared_arrays: '_SharedArrays | None' = None
+
+        for worker_index, indices in enumerate(self.worker_indices):
+            work_remote = self.work_remotes[worker_index]
+
+            args = (
+                worker_index,
+                indices,
+                work_remote,
+                self.remotes[worker_index],
+                CloudpickleWrapper([env_fns[index] for index in indices]),
+                self.command_semaphores[worker_index],
+                self.result_semaphore,
+                batch_inference)
+
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        observation_space, action_space = self._request([0], "get_spaces", None)[0]
+
+        super().__init__(n_envs, observation_space, action_space)
+
+        specs = _get_specs(
+            n_envs,
+            n_workers,
+            observation_space,
+            action_space)
+
+        shared_arrays = _SharedArrays(specs)
+        self._request(self._get_first_indices(), "attach", (shared_arrays.get_names(), specs))
+
+        self.shared_arrays = shared_arrays
+
+    def _get_first_indices(self):
+        return [indices[0] for indices in self.worker_indices]
+
+    def _send(
+        self,
+        index: int,
+        command: str,
+        data: Any
+    ):
+        worker_index = self.env_workers[index]
+
+        if self.shared_arrays is not None:
+            self.shared_arrays.arrays["commands"][worker_index] = PIPE_COMMAND
+
+        self.command_semaphores[worker_index].release()
+        self.remotes[worker_index].send((command, index, data))
+
+    def _receive(self, index: int):
+        result = self.remotes[self.env_workers[index]].recv()
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def _request(
+        self,
+        indices: 'Sequence[int]',
+        command: str,
+        data: Any
+    ):
+        for index in indices:
+            self._send(index, command, data)
+
+        return [self._receive(index) for index in indices]
+
+    def step_async(self, actions: np.ndarray) -> None:
+        arrays = self.shared_arrays.arrays
+
+        arrays["actions"][:] = np.asarray(actions).reshape(arrays["actions"].shape)
+        arrays["commands"][:] = STEP_COMMAND
+
+        for semaphore in self.command_semaphores:
+            semaphore.release()
+
+        self.waiting = True
+
+    def step_wait(self) -> VecEnvStepReturn:
+        for _ in self.command_semaphores:
+            self.result_semaphore.acquire()
+
+        self.waiting = False
+
+        arrays = self.shared_arrays.arrays
+        messages = arrays["messages"]
+        truncated = arrays["truncated"]
+
+        infos = []
+        reset_infos = []
+
+        for index in range(self.num_envs):
+            if messages[index] == NO_MESSAGE:
+                infos.append({"TimeLimit.truncated": bool(truncated[index])})
+                reset_infos.append({})
+                continue
+
+            info, reset_info = self._receive(index)
+
+            infos.append(info)
+            reset_infos.append(reset_info)
+
+        self.reset_infos = reset_infos
+
+        return arrays["observations"].copy(), arrays["rewards"].copy(), arrays["dones"].copy(), infos
+
+    def reset(self) -> VecEnvObs:
+        for index in range(self.num_envs):
+            self._send(index, "reset", (self._seeds[index], self._options[index]))
+
+        results = [self._receive(index) for index in range(self.num_envs)]
+        observations, self.reset_infos = zip(*results)
+
+        self._reset_seeds()
+        self._reset_options()
+
+        return np.stack(observations)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        if self.waiting:
+            self.step_wait()
+
+        self._request(self._get_first_indices(), "close", None)
+
+        for process in self.processes:
+            process.join()
+
+        self.shared_arrays.close(unlink=True)
+        self.closed = True
+
+    def get_images(self) -> 'Sequence[Optional[np.ndarray]]':
+        return self._request(range(self.num_envs), "render", None)
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> 'List[Any]':
+        return self._request(self._get_indices(indices), "get_attr", attr_name)
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        self._request(self._get_indices(indices), "set_attr", (attr_name, value))
+
+    def env_method(self, method_name: str, *method_args, indices: VecEnvIndices = None, **method_kwargs) -> 'List[Any]':
+        return self._request(
+            self._get_indices(indices),
+            "env_method",
+            (method_name, method_args, method_kwargs))
+
+    def env_is_wrapped(self, wrapper_class: 'Type[gym.Wrapper]', indices: VecEnvIndices = None) -> 'List[bool]':
+        return self._request(self._get_indices(indices), "is_wrapped", wrapper_class)
@@ -0,0 +1,161 @@
+import bisect
+import json
+import os
+import time
+
+import numpy as np
+
+# histogram bin edges, in seconds, from 1 us to 1 s
+DEFAULT_BIN_EDGES = tuple(float(value) for value in np.logspace(-6, 0, 25))
+
+class _PhaseRecord:
+    def __init__(
+        self,
+        capacity: int,
+        bins_count: int
+    ):
+        self.values = np.zeros(capacity)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * bins_count
+
+    def add(
+        self,
+        value: float,
+        bin_edges: 'tuple[float, ...]'
+    ):
+        self.values[self.count % len(self.values)] = value
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.histogram[bisect.bisect_right(bin_edges, value)] += 1
+
+    def get_summary(self, bin_edges: 'tuple[float, ...]'):
+        values = self.values[:min(self.count, len(self.values))]
+
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "max": self.max,
+            "p50": float(np.percentile(values, 50)),
+            "p99": float(np.percentile(values, 99)),
+            "histogram": {
+                "edges": list(bin_edges),
+                "counts": list(self.histogram)
+            }
+        }
+
+class StepProfiler:
+    """
+    Per-phase timings of environment steps and resets.
+
+    start opens a sample and every mark closes the phase that ran since the
+    previous mark (or since start). add records the time of a phase measured
+    apart, such as the opponent speeds nested in another phase; its time is
+    summed over the sample and also counted in the enclosing phase. finish
+    commits the sample, with its total, to the records of the phases.
+
+    Each phase keeps its last capacity timings in a ring buffer, used for the
+    percentiles, and a histogram of every timing with bin_edges. Every
+    report_interval counted samples (the steps, not the resets) finish
+    returns the summary, which is also written to directory as JSON when one
+    is given.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        report_interval: int = 10000,
+        directory: 'str | None' = None,
+        bin_edges: 'tuple[float, ...]' = DEFAULT_BIN_EDGES,
+        clock = time.perf_counter
+    ):
+        self.capacity = capacity
+        self.report_interval = report_interval
+        self.directory = directory
+        self.bin_edges = tuple(bin_edges)
+        self.clock = clock
+
+        self.records: 'dict[str, _PhaseRecord]' = {}
+        self.samples_count = 0
+
+        self.prefix = ""
+        self.start_time = 0.0
+        self.last_time = 0.0
+        self.sample: 'dict[str, float]' = {}
+
+    def start(self, prefix: str = ""):
+        self.prefix = prefix
+        self.sample = {}
+        self.start_time = self.last_time = self.clock()
+
+    def mark(self, name: str):
+        now = self.clock()
+        self._add_to_sample(name, now - self.last_time)
+        self.last_time = now
+
+    def add(
+        self,
+        name: str,
+        value: float
+    ):
+        self._add_to_sample(name, value)
+
+    def _add_to_sample(
+        self,
+        name: str,
+        value: float
+    ):
+        key = self.prefix + name
+        self.sample[key] = self.sample.get(key, 0.0) + value
+
+    def finish(self, counted: bool = True):
+        """
+        Commits the sample. Returns the summary every report_interval
+        counted samples and None otherwise.
+        """
+
+        self.sample[self.prefix + "total"] = self.clock() - self.start_time
+
+        for key, value in self.sample.items():
+            record = self.records.get(key, None)
+
+            if record is None:
+                record = _PhaseRecord(self.capacity, len(self.bin_edges) + 1)
+                self.records[key] = record
+
+            record.add(value, self.bin_edges)
+
+        self.sample = {}
+
+        if not counted:
+            return None
+
+        self.samples_count += 1
+
+        if self.samples_count % self.report_interval != 0:
+            return None
+
+        summary = self.get_summary()
+
+        if self.directory is not None:
+            self.dump(summary)
+
+        return summary
+
+    def get_summary(self):
+        return {
+            key: record.get_summary(self.bin_edges)
+            for key, record in self.records.items()
+        }
+
+    def dump(self, summary: 'dict | None' = None):
+        os.makedirs(self.directory, exist_ok=True)
+
+        file_path = os.path.join(
+            self.directory,
+            f"step_profile_{os.getpid()}_{id(self)}.json")
+
+        with open(file_path, "w") as file:
+            json.dump(self.get_summary() if summary is None else summary, file)
@@ -0,0 +1,185 @@
+import json
+import os
+
+import numpy as np
+
+from lib.domain.array_frame import ArrayFrame
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+# longest task id stored
+TASK_ID_LENGTH = 16
+
+def _get_chunk_path(
+    directory: str,
+    chunk_index: int,
+    name: str
+):
+    return os.path.join(directory, f"chunk_{chunk_index:05d}_{name}.npy")
+
+class TrajectoryRecorder:
+    """
+    Streams the transitions of an environment into chunks of memory-mapped
+    .npy files, one file per field. A chunk holds chunk_size transitions
+    and its files are opened once, when the first transition of the chunk
+    is recorded; the writes go to the mapped pages and the OS writes them
+    back. manifest.json lists the chunks with their transition counts and
+    is rewritten when a chunk is opened, at the end of every episode and on
+    close, so a process that is killed only loses its last episode.
+
+    Each transition has the frame after the step (ball and robots arrays
+    of the ArrayFrame), the observation the action was taken on, the next
+    observation, the action, the reward, done, and the task id and update
+    count of the curriculum.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        chunk_size: int = 100000
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.chunk_size = chunk_size
+
+        self.chunks: 'list[dict]' = []
+        self.chunk_index = -1
+        self.arrays: 'dict[str, np.memmap]' = {}
+        self.count = 0
+
+        self.observation: 'np.ndarray | None' = None
+
+    def set_observation(self, observation: np.ndarray):
+        """
+        Sets the observation of the next transition, as after a reset.
+        """
+
+        self.observation = np.array(observation, copy=True)
+
+    def _get_specs(
+        self,
+        frame: ArrayFrame,
+        observation: np.ndarray,
+        action: np.ndarray
+    ):
+        return {
+            "ball": (frame.ball_array.shape, frame.ball_array.dtype),
+            "robots": (frame.robots.shape, frame.robots.dtype),
+            "observation": (observation.shape, observation.dtype),
+            "next_observation": (observation.shape, observation.dtype),
+            "action": (action.shape, np.float32),
+            "reward": ((), np.float32),
+            "done": ((), np.bool_),
+            "task_id": ((), f"<U{TASK_ID_LENGTH}"),
+            "update_count": ((), np.int32)
+        }
+
+    def _open_chunk(self, specs: 'dict[str, tuple[tuple, np.dtype]]'):
+        self._close_chunk()
+
+        self.chunk_index += 1
+        self.count = 0
+
+        self.arrays = {
+            name: np.lib.format.open_memmap(
+                _get_chunk_path(self.directory, self.chunk_index, name),
+                mode="w+",
+                dtype=dtype,
+                shape=(self.chunk_size, *shape))
+            for name, (shape, dtype) in specs.items()
+        }
+
+        self.chunks.append({"index": self.chunk_index, "count": 0})
+
+        self._write_manifest()
+
+    def _close_chunk(self):
+        if len(self.arrays) == 0:
+            return
+
+        for array in self.arrays.values():
+            array.flush()
+
+        self.chunks[-1]["count"] = self.count
+        self.arrays = {}
+
+        self._write_manifest()
+
+    def _write_manifest(self):
+        manifest_path = os.path.join(self.directory, MANIFEST_FILE_NAME)
+        temporary_path = f"{manifest_path}.tmp"
+
+        with open(temporary_path, "w") as file:
+            json.dump({"chunk_size": self.chunk_size, "chunks": self.chunks}, file)
+
+        os.replace(temporary_path, manifest_path)
+
+    def record(
+        self,
+        frame: ArrayFrame,
+        next_observation: np.ndarray,
+        action: np.ndarray,
+        reward: float,
+        done: bool,
+        task_id: str = "",
+        update_count: int = 0
+    ):
+        if len(task_id) > TASK_ID_LENGTH:
+            raise ValueError(f"task id {task_id!r} is longer than {TASK_ID_LENGTH} characters")
+
+        action = np.asarray(action)
+
+        if self.observation is None:
+            self.observation = np.zeros_like(next_observation)
+
+        if len(self.arrays) == 0 or self.count == self.chunk_size:
+            self._open_chunk(self._get_specs(frame, next_observation, action))
+
+        arrays = self.arrays
+        i = self.count
+
+        arrays["ball"][i] = frame.ball_array
+        arrays["robots"][i] = frame.robots
+        arrays["observation"][i] = self.observation
+        arrays["next_observation"][i] = next_observation
+        arrays["action"][i] = action
+        arrays["reward"][i] = reward
+        arrays["done"][i] = done
+        arrays["task_id"][i] = task_id
+        arrays["update_count"][i] = update_count
+
+        self.count += 1
+        self.observation[...] = next_observation
+
+        if done:
+            self.chunks[-1]["count"] = self.count
+            self._write_manifest()
+
+    def close(self):
+        self._close_chunk()
+
+def load_trajectories(directory: str):
+    """
+    Returns the fields recorded by a TrajectoryRecorder in directory, each
+    as a list of read-only memory-mapped arrays, one per chunk.
+    """
+
+    with open(os.path.join(directory, MANIFEST_FILE_NAME)) as file:
+        manifest = json.load(file)
+
+    trajectories: 'dict[str, list[np.ndarray]]' = {}
+
+    for chunk in manifest["chunks"]:
+        prefix = f"chunk_{chunk['index']:05d}_"
+
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.startswith(prefix) or not file_name.endswith(".npy"):
+                continue
+
+            name = file_name[len(prefix):-len(".npy")]
+            array = np.load(os.path.join(directory, file_name), mmap_mode="r")
+
+            trajectories.setdefault(name, []).append(array[:chunk["count"]])
+
+    return trajectories
@@ -0,0 +1,127 @@
+import threading
+
+import numpy as np
+
+class _Request:
+    def __init__(
+        self,
+        model,
+        observation: np.ndarray,
+        deterministic: bool
+    ):
+        self.model = model
+        self.observation = np.asarray(observation)
+        self.deterministic = deterministic
+        self.action = None
+        self.error: 'Exception | None' = None
+        self.done = False
+
+class BatchedInference:
+    """
+    Batches the predict calls of threads that step environments of the same
+    process. begin sets how many threads take part in a round; a thread
+    calling predict waits until every thread still in the round is either
+    waiting for a prediction or finished, and then all pending observations
+    of the same model are predicted in one call.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.active_count = 0
+        self.pending: 'list[_Request]' = []
+
+    def begin(self, count: int):
+        with self.condition:
+            self.active_count = count
+
+    def finish(self):
+        with self.condition:
+            self.active_count -= 1
+            self._try_run()
+
+    def predict(
+        self,
+        model,
+        observation: np.ndarray,
+        deterministic: bool
+    ):
+        request = _Request(model, observation, deterministic)
+
+        with self.condition:
+            self.pending.append(request)
+            self._try_run()
+
+            while not request.done:
+                self.condition.wait()
+
+        if request.error is not None:
+            raise request.error
+
+        return request.action
+
+    def _try_run(self):
+        if len(self.pending) == 0 or len(self.pending) < self.active_count:
+            return
+
+        groups: 'dict[tuple[int, bool], list[_Request]]' = {}
+
+        for request in self.pending:
+            groups.setdefault((id(request.model), request.deterministic), []).append(request)
+
+        self.pending = []
+
+        for requests in groups.values():
+            BatchedInference._run(requests)
+
+        self.condition.notify_all()
+
+    @staticmethod
+    def _run(requests: 'list[_Request]'):
+        first = requests[0]
+
+        try:
+            observations = np.concatenate([
+                item.observation.reshape(-1, item.observation.shape[-1])
+                for item in requests
+            ])
+
+            actions, _ = first.model.predict(observations, deterministic=first.deterministic)
+
+            offset = 0
+
+            for item in requests:
+                if item.observation.ndim > 1:
+                    count = len(item.observation)
+                    item.action = actions[offset:offset + count]
+                else:
+                    count = 1
+                    item.action = actions[offset]
+
+                offset += count
+        except Exception as exception:
+            for item in requests:
+                item.error = exception
+
+        for item in requests:
+            item.done = True
+
+class BatchedModel:
+    """
+    Stands in for a model in a process with a BatchedInference; predict
+    takes part in the current batch instead of calling the model directly.
+    """
+
+    def __init__(
+        self,
+        batched_inference: BatchedInference,
+        model
+    ):
+        self.batched_inference = batched_inference
+        self.model = model
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        deterministic: bool = False
+    ):
+        return self.batched_inference.predict(self.model, observation, deterministic), None
@@ -0,0 +1,67 @@
+from multiprocessing.connection import Client
+
+import numpy as np
+
+class InferenceClient:
+    def __init__(
+        self,
+        address,
+        authkey: bytes
+    ):
+        self.address = address
+        self.authkey = authkey
+        self._connection = None
+
+    def connect(self):
+        if self._connection is None:
+            self._connection = Client(self.address, authkey=self.authkey)
+
+    def predict(
+        self,
+        model_path: str,
+        observation: np.ndarray,
+        deterministic: bool
+    ):
+        self.connect()
+
+        self._connection.send((
+            model_path,
+            np.asarray(observation, dtype=np.float32),
+            deterministic))
+
+        result = self._connection.recv()
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+class RemoteModel:
+    """
+    Stands in for a PPO model whose forward passes run on an InferenceServer.
+    """
+
+    def __init__(
+        self,
+        client: InferenceClient,
+        model_path: str
+    ):
+        self.client = client
+        self.model_path = model_path
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        deterministic: bool = False
+    ):
+        action = self.client.predict(
+            self.model_path,
+            observation,
+            deterministic)
+
+        return action, None
@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.connection import Client, Listener, wait
+
+import numpy as np
+from stable_baselines3 import PPO
+
+def _load_ppo_model(model_path: str):
+    return PPO.load(model_path, device="cpu")
+
+class InferenceServer:
+    """
+    Runs the opponent policies of every environment in batched forward passes.
+
+    Each environment process connects through an InferenceClient and blocks on
+    its request. The server waits until every connected client has a pending
+    request (or max_wait seconds have passed since the first one), then runs a
+    single predict per model path and deterministic flag.
+    """
+
+    def __init__(
+        self,
+        max_wait: float = 0.002,
+        max_models: int = 8,
+        load_model = _load_ppo_model
+    ):
+        self.max_wait = max_wait
+        self.max_models = max_models
+        self.load_model = load_model
+
+        self.authkey = os.urandom(16)
+        self.address = None
+
+        self._listener: Listener = None
+        self._connections = []
+        self._lock = threading.Lock()
+        self._models: 'OrderedDict[str, PPO]' = OrderedDict()
+        self._stopped = False
+        self._threads: 'list[threading.Thread]' = []
+
+    def start(self):
+        self._listener = Listener(authkey=self.authkey)
+        self.address = self._listener.address
+
+        self._threads = [
+            threading.Thread(target=self._accept, daemon=True),
+            threading.Thread(target=self._serve, daemon=True)
+        ]
+
+        for thread in self._threads:
+            thread.start()
+
+        return self
+
+    def stop(self):
+        self._stopped = True
+
+        # wakes the accept thread up
+        Client(self.address, authkey=self.authkey).close()
+        self._listener.close()
+
+        for thread in self._threads:
+            thread.join(1)
+
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+
+    def get_client_arguments(self):
+        return self.address, self.authkey
+
+    def get_connections_count(self):
+        with self._lock:
+            return len(self._connections)
+
+    def _accept(self):
+        while not self._stopped:
+            try:
+                connection = self._listener.accept()
+            except OSError:
+                break
+
+            if self._stopped:
+                connection.close()
+                break
+
+            with self._lock:
+                self._connections.append(connection)
+
+    def _remove_connection(self, connection):
+        with self._lock:
+            self._connections.remove(connection)
+
+        connection.close()
+
+    def _serve(self):
+        pending = {}
+        deadline = None
+
+        while not self._stopped:
+            with self._lock:
+                connections = list(self._connections)
+
+            if len(connections) == 0:
+                time.sleep(0.01)
+                continue
+
+            timeout = 0.1 if deadline is None else max(deadline - time.perf_counter(), 0)
+            waiting = [item for item in connections if item not in pending]
+
+            for connection in wait(waiting, timeout):
+                try:
+                    pending[connection] = connection.recv()
+                except (EOFError, OSError):
+                    self._remove_connection(connection)
+                    continue
+
+                if deadline is None:
+                    deadline = time.perf_counter() + self.max_wait
+
+            if len(pending) == 0:
+                continue
+
+            if len(pending) >= len(self._connections) or time.perf_counter() >= deadline:
+                self._flush(pending)
+                pending = {}
+                deadline = None
+
+    def _flush(self, pending: dict):
+        groups: 'dict[tuple[str, bool], list]' = {}
+
+        for connection, (model_path, observation, deterministic) in pending.items():
+            groups.setdefault((model_path, deterministic), []).append((connection, observation))
+
+        for (model_path, deterministic), items in groups.items():
+            try:
+                model = self._get_model(model_path)
+                observations = np.stack([observation for _, observation in items])
+                actions, _ = model.predict(observations, deterministic=deterministic)
+                results = list(actions)
+            except Exception as exception:
+                results = [exception] * len(items)
+
+            for (connection, _), result in zip(items, results):
+                try:
+                    connection.send(result)
+                except (EOFError, OSError):
+                    self._remove_connection(connection)
+
+    def _get_model(self, model_path: str):
+        model = self._models.get(model_path, None)
+
+        if model is None:
+            model = self.load_model(model_path)
+            self._models[model_path] = model
+
+            if len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+        else:
+            self._models.move_to_end(model_path)
+
+        return model
@@ -0,0 +1,127 @@
+import numpy as np
+
+NUMPY_POLICY_EXTENSION = ".npz"
+
+BOX_ACTION_TYPE = "box"
+MULTI_DISCRETE_ACTION_TYPE = "multi_discrete"
+
+_ACTIVATIONS = {
+    "tanh": np.tanh,
+    "relu": lambda x: np.maximum(x, 0)
+}
+
+class NumpyPolicy:
+    """
+    Actor of an MlpPolicy PPO model evaluated with NumPy only.
+
+    The weights are read from an .npz written by export_numpy_policy. predict
+    takes a single observation or a batch of observations and returns the
+    same actions as PPO.predict.
+    """
+
+    def __init__(
+        self,
+        weights: 'list[np.ndarray]',
+        biases: 'list[np.ndarray]',
+        activation: str,
+        action_weights: np.ndarray,
+        action_bias: np.ndarray,
+        action_type: str,
+        log_std: 'np.ndarray | None' = None,
+        action_low: 'np.ndarray | None' = None,
+        action_high: 'np.ndarray | None' = None,
+        nvec: 'np.ndarray | None' = None
+    ):
+        # transposed so that a batch of observations is multiplied on the left
+        self.weights = [np.ascontiguousarray(item.T, dtype=np.float32) for item in weights]
+        self.biases = [np.asarray(item, dtype=np.float32) for item in biases]
+        self.activation = _ACTIVATIONS[activation]
+
+        self.action_weights = np.ascontiguousarray(action_weights.T, dtype=np.float32)
+        self.action_bias = np.asarray(action_bias, dtype=np.float32)
+        self.action_type = action_type
+
+        self.std = None if log_std is None else np.exp(log_std).astype(np.float32)
+        self.action_low = action_low
+        self.action_high = action_high
+
+        self.nvec = nvec
+        self.splits = None if nvec is None else np.cumsum(nvec)[:-1]
+
+    @staticmethod
+    def load(path: str):
+        with np.load(path) as data:
+            layers_count = int(data["layers_count"])
+
+            def get_optional(key: str):
+                return data[key] if key in data else None
+
+            return NumpyPolicy(
+                [data[f"weights_{i}"] for i in range(layers_count)],
+                [data[f"biases_{i}"] for i in range(layers_count)],
+                str(data["activation"]),
+                data["action_weights"],
+                data["action_bias"],
+                str(data["action_type"]),
+                get_optional("log_std"),
+                get_optional("action_low"),
+                get_optional("action_high"),
+                get_optional("nvec"))
+
+    def forward(self, observations: np.ndarray):
+        values = observations
+
+        for weights, biases in zip(self.weights, self.biases):
+            values = self.activation(values @ weights + biases)
+
+        return values @ self.action_weights + self.action_bias
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        deterministic: bool = True
+    ):
+        observation = np.asarray(observation, dtype=np.float32)
+        is_batch = observation.ndim > 1
+
+        outputs = self.forward(observation.reshape(-1, observation.shape[-1]))
+
+        if self.action_type == BOX_ACTION_TYPE:
+            actions = self._get_box_actions(outputs, deterministic)
+        else:
+            actions = self._get_multi_discrete_actions(outputs, deterministic)
+
+        if not is_batch:
+            actions = actions[0]
+
+        return actions, None
+
+    def _get_box_actions(
+        self,
+        means: np.ndarray,
+        deterministic: bool
+    ):
+        actions = means
+
+        if not deterministic:
+            noise = np.random.standard_normal(means.shape).astype(np.float32)
+            actions = means + self.std * noise
+
+        return np.clip(actions, self.action_low, self.action_high)
+
+    def _get_multi_discrete_actions(
+        self,
+        logits: np.ndarray,
+        deterministic: bool
+    ):
+        def sample(values: np.ndarray):
+            if deterministic:
+                return np.argmax(values, axis=1)
+
+            # Gumbel-max sampling of the categorical distribution
+            gumbel = -np.log(-np.log(np.random.uniform(size=values.shape)))
+            return np.argmax(values + gumbel, axis=1)
+
+        return np.stack(
+            [sample(item) for item in np.split(logits, self.splits, axis=1)],
+            axis=1)
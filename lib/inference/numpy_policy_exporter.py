@@ -0,0 +1,58 @@
+import os
+
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3 import PPO
+from torch import nn
+
+from lib.inference.numpy_policy import BOX_ACTION_TYPE, MULTI_DISCRETE_ACTION_TYPE, NUMPY_POLICY_EXTENSION
+
+_ACTIVATION_NAMES = {
+    nn.Tanh: "tanh",
+    nn.ReLU: "relu"
+}
+
+def _to_numpy(tensor):
+    return tensor.detach().cpu().numpy()
+
+def get_numpy_policy_path(model_path: str):
+    return f"{os.path.splitext(model_path)[0]}{NUMPY_POLICY_EXTENSION}"
+
+def export_numpy_policy(
+    model_path: str,
+    output_path: 'str | None' = None
+):
+    if output_path is None:
+        output_path = get_numpy_policy_path(model_path)
+
+    policy = PPO.load(model_path, device="cpu").policy
+    layers = [item for item in policy.mlp_extractor.policy_net if isinstance(item, nn.Linear)]
+    activation_name = _ACTIVATION_NAMES[policy.activation_fn]
+
+    data = {
+        "layers_count": np.array(len(layers)),
+        "activation": np.array(activation_name),
+        "action_weights": _to_numpy(policy.action_net.weight),
+        "action_bias": _to_numpy(policy.action_net.bias)
+    }
+
+    for i, layer in enumerate(layers):
+        data[f"weights_{i}"] = _to_numpy(layer.weight)
+        data[f"biases_{i}"] = _to_numpy(layer.bias)
+
+    action_space = policy.action_space
+
+    if isinstance(action_space, spaces.Box):
+        data["action_type"] = np.array(BOX_ACTION_TYPE)
+        data["log_std"] = _to_numpy(policy.log_std)
+        data["action_low"] = action_space.low
+        data["action_high"] = action_space.high
+    elif isinstance(action_space, spaces.MultiDiscrete):
+        data["action_type"] = np.array(MULTI_DISCRETE_ACTION_TYPE)
+        data["nvec"] = action_space.nvec
+    else:
+        raise ValueError(f"Unsupported action space: {action_space}")
+
+    np.savez(output_path, **data)
+
+    return output_path
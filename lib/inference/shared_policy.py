@@ -0,0 +1,204 @@
+import fcntl
+import hashlib
+import os
+import time
+import warnings
+
+import numpy as np
+import torch
+from stable_baselines3 import PPO
+from stable_baselines3.common.policies import BasePolicy
+
+SHARED_POLICY_EXTENSION = ".shared"
+
+# the file starts with an int64 version (odd while the weights are written)
+# followed by the float32 weights in state_dict order
+_HEADER_SIZE = 8
+
+_attached_policies: 'dict[str, _AttachedPolicy]' = {}
+
+def _get_meta_path(file_path: str):
+    return f"{file_path}.meta"
+
+def _get_lock_path(file_path: str):
+    return f"{file_path}.lock"
+
+def _get_tensors(policy: BasePolicy):
+    return list(policy.state_dict(keep_vars=True).values())
+
+def _get_weights(policy: BasePolicy):
+    return np.concatenate([
+        tensor.detach().cpu().numpy().ravel()
+        for tensor in _get_tensors(policy)
+    ]).astype(np.float32)
+
+def _wait_for_file(
+    file_path: str,
+    timeout: float = 60
+):
+    start_time = time.time()
+
+    while not os.path.exists(file_path):
+        if time.time() - start_time > timeout:
+            raise FileNotFoundError(file_path)
+
+        time.sleep(0.01)
+
+class SharedPolicyPublisher:
+    """
+    Writes the weights of a policy into a memory-mapped file. The first
+    publish creates the file; the next ones overwrite the weights in place.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._memmap: np.memmap = None
+
+    def publish(self, policy: BasePolicy):
+        weights = _get_weights(policy)
+
+        if self._memmap is None:
+            self._create(policy, weights)
+            return
+
+        version = self._memmap[:_HEADER_SIZE].view(np.int64)
+
+        version[0] += 1
+        self._memmap[_HEADER_SIZE:].view(np.float32)[:] = weights
+        version[0] += 1
+
+    def _create(
+        self,
+        policy: BasePolicy,
+        weights: np.ndarray
+    ):
+        directory = os.path.dirname(self.file_path)
+
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+
+        torch.save(
+            {
+                "policy_class": type(policy),
+                "data": policy._get_constructor_parameters()
+            },
+            _get_meta_path(self.file_path))
+
+        temporary_path = f"{self.file_path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(np.array([0], dtype=np.int64).tobytes())
+            file.write(weights.tobytes())
+
+        os.replace(temporary_path, self.file_path)
+
+        self._memmap = np.memmap(self.file_path, mode="r+")
+
+    def remove(self):
+        """
+        Deletes the weights file with its metadata and lock files.
+        """
+
+        self._memmap = None
+
+        for file_path in (self.file_path, _get_meta_path(self.file_path), _get_lock_path(self.file_path)):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+class _AttachedPolicy:
+    def __init__(self, file_path: str):
+        _wait_for_file(file_path)
+
+        saved = torch.load(
+            _get_meta_path(file_path),
+            map_location="cpu",
+            weights_only=False)
+
+        self.policy: BasePolicy = saved["policy_class"](**saved["data"])
+        self.policy.set_training_mode(False)
+
+        self._memmap = np.memmap(file_path, mode="r")
+        self._version = self._memmap[:_HEADER_SIZE].view(np.int64)
+
+        weights = self._memmap[_HEADER_SIZE:].view(np.float32)
+        offset = 0
+
+        # the tensors are read-only views of the mapped file
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+
+            for tensor in _get_tensors(self.policy):
+                count = tensor.numel()
+                tensor.data = torch.from_numpy(weights[offset:offset + count]).view(tensor.shape)
+                offset += count
+
+    def get_version(self):
+        return int(self._version[0])
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        deterministic: bool
+    ):
+        while True:
+            version = self.get_version()
+
+            if version % 2 == 1:
+                time.sleep(0)
+                continue
+
+            action, state = self.policy.predict(observation, deterministic=deterministic)
+
+            if self.get_version() == version:
+                return action, state
+
+class SharedPolicyModel:
+    """
+    Stands in for a PPO model whose weights live in a file written by a
+    SharedPolicyPublisher. Only the file path is pickled; each process maps
+    the file once and always reads the last published weights.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def _get_attached_policy(self):
+        attached_policy = _attached_policies.get(self.file_path, None)
+
+        if attached_policy is None:
+            attached_policy = _AttachedPolicy(self.file_path)
+            _attached_policies[self.file_path] = attached_policy
+
+        return attached_policy
+
+    def get_version(self):
+        return self._get_attached_policy().get_version()
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        deterministic: bool = False
+    ):
+        return self._get_attached_policy().predict(observation, deterministic)
+
+def get_shared_policy_model(
+    model_path: str,
+    directory: str
+):
+    name = hashlib.sha1(os.path.abspath(model_path).encode()).hexdigest()
+    file_path = os.path.join(directory, f"{name}{SHARED_POLICY_EXTENSION}")
+
+    if not os.path.exists(file_path):
+        os.makedirs(directory, exist_ok=True)
+
+        # the first process to take the lock publishes the model while the
+        # others wait for it; the lock goes away with a process that dies
+        # holding it, so a crashed run does not leave the model unpublished
+        with open(_get_lock_path(file_path), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            if not os.path.exists(file_path):
+                policy = PPO.load(model_path, device="cpu").policy
+                SharedPolicyPublisher(file_path).publish(policy)
+
+    return SharedPolicyModel(file_path)
@@ -0,0 +1,326 @@
+import numpy as np
+
+from configuration.configuration import Configuration
+from lib.domain.array_frame import ArrayFrame, BALL_X, BALL_Y, BALL_V_X, BALL_V_Y
+from lib.utils.field_utils import FieldUtils
+from lib.utils.geometry_utils import GeometryUtils
+
+X = 0
+Y = 1
+THETA = 2
+V_X = 3
+V_Y = 4
+FEATURES_COUNT = 5
+
+BALL_INDEX = 0
+
+BALL_OBSERVATION_SIZE = 4
+ROBOT_OBSERVATION_SIZE = 5
+
+class ObservationBuilder:
+    """
+    Builds the role observations from a packed frame.
+
+    The frame is packed as an (entities, features) array where the first row
+    is the ball, followed by the blue robots and then the yellow robots. The
+    features are x, y, theta (radians, in [-pi, pi]), v_x and v_y, the same
+    leading columns as the robots of an ArrayFrame.
+
+    Every observation is written into a buffer owned by the builder, so the
+    returned array is overwritten by the next call for the same role.
+    """
+
+    _configuration_builder = None
+
+    def __init__(
+        self,
+        max_x: float,
+        max_y: float,
+        max_v: float,
+        max_distance: float,
+        field_length: float,
+        field_width: float,
+        goal_width: float,
+        goal_depth: float,
+        clip_distance: bool = True,
+        robots_count: int = 3
+    ):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.max_v = max_v
+        self.max_distance = max_distance
+        self.clip_distance = clip_distance
+        self.robots_count = robots_count
+
+        self.field_length = field_length
+        self.field_width = field_width
+        self.goal_width = goal_width
+        self.goal_depth = goal_depth
+
+        entities_count = 1 + 2 * robots_count
+
+        self.entities = np.zeros((entities_count, FEATURES_COUNT))
+
+        self._ordered = np.zeros((entities_count, FEATURES_COUNT))
+        self._normalized = np.zeros((entities_count, FEATURES_COUNT))
+        self._inside = np.zeros(entities_count, dtype=bool)
+        self._delta = np.zeros((entities_count, 2))
+        self._distances = np.zeros(entities_count)
+        self._angles = np.zeros(entities_count)
+
+        self._orders = {
+            False: self._get_order(False),
+            True: self._get_order(True)
+        }
+
+        self._robot_rows = np.arange(1, entities_count)
+
+        self._robot_orders = [
+            self._get_robot_order(robot_id)
+            for robot_id in range(robots_count)
+        ]
+
+        robots_observation_size = 2 * robots_count * ROBOT_OBSERVATION_SIZE
+
+        self._attacker_observation = np.zeros(
+            BALL_OBSERVATION_SIZE + robots_observation_size,
+            dtype=np.float32)
+
+        self._defender_observation = np.zeros(
+            BALL_OBSERVATION_SIZE + robots_observation_size,
+            dtype=np.float32)
+
+        self._goalkeeper_observation = np.zeros(
+            BALL_OBSERVATION_SIZE + ROBOT_OBSERVATION_SIZE,
+            dtype=np.float32)
+
+        self._team_observation = np.zeros(
+            1 + BALL_OBSERVATION_SIZE + robots_observation_size,
+            dtype=np.float32)
+
+    @staticmethod
+    def get_configuration_builder():
+        if ObservationBuilder._configuration_builder is None:
+            ObservationBuilder._configuration_builder = ObservationBuilder(
+                Configuration.rsoccer_training_max_x,
+                Configuration.rsoccer_training_max_y,
+                Configuration.rsoccer_training_max_v,
+                Configuration.rsoccer_training_max_distance,
+                Configuration.field_length,
+                Configuration.field_width,
+                Configuration.field_goal_width,
+                Configuration.field_goal_depth)
+
+        return ObservationBuilder._configuration_builder
+
+    def _get_order(self, is_yellow: bool):
+        blue = list(range(1, 1 + self.robots_count))
+        yellow = list(range(1 + self.robots_count, 1 + 2 * self.robots_count))
+
+        if is_yellow:
+            return np.array([BALL_INDEX] + yellow + blue)
+
+        return np.array([BALL_INDEX] + blue + yellow)
+
+    def _get_robot_order(self, robot_id: int):
+        team = [
+            1 + i
+            for i in range(self.robots_count)
+            if i != robot_id
+        ]
+
+        foes = list(range(1 + self.robots_count, 1 + 2 * self.robots_count))
+
+        return np.array([1 + robot_id] + team + foes)
+
+    def set_rsoccer_frame(self, frame):
+        entities = self.entities
+        ball = frame.ball
+
+        entities[BALL_INDEX] = (ball.x, ball.y, 0, ball.v_x, ball.v_y)
+
+        for i in range(self.robots_count):
+            robot = frame.robots_blue[i]
+            entities[1 + i] = (robot.x, robot.y, robot.theta, robot.v_x, robot.v_y)
+
+        for i in range(self.robots_count):
+            robot = frame.robots_yellow[i]
+            entities[1 + self.robots_count + i] = \
+                (robot.x, robot.y, robot.theta, robot.v_x, robot.v_y)
+
+        entities[1:, THETA] = GeometryUtils.normalize_array_in_pi(np.deg2rad(entities[1:, THETA]))
+
+    def set_array_frame(self, frame: ArrayFrame):
+        entities = self.entities
+        ball = frame.ball_array
+
+        entities[BALL_INDEX] = (ball[BALL_X], ball[BALL_Y], 0, ball[BALL_V_X], ball[BALL_V_Y])
+        entities[1:] = frame.robots[:, :FEATURES_COUNT]
+        entities[1:, THETA] = GeometryUtils.normalize_array_in_pi(np.deg2rad(entities[1:, THETA]))
+
+    def set_field(self, field):
+        entities = self.entities
+        ball = field.ball
+
+        entities[BALL_INDEX] = (
+            ball.position.x,
+            ball.position.y,
+            0,
+            ball.velocity.x,
+            ball.velocity.y)
+
+        for i in range(self.robots_count):
+            robot = field.get_robot_by_id(i)
+            entities[1 + i] = (
+                robot.position.x,
+                robot.position.y,
+                robot.position.theta,
+                robot.velocity.x,
+                robot.velocity.y)
+
+        for i in range(self.robots_count):
+            robot = field.get_foe_by_id(i)
+            entities[1 + self.robots_count + i] = (
+                robot.position.x,
+                robot.position.y,
+                robot.position.theta,
+                robot.velocity.x,
+                robot.velocity.y)
+
+    def _prepare(
+        self,
+        is_yellow: bool,
+        is_left_team: bool
+    ):
+        ordered = self._ordered
+        normalized = self._normalized
+
+        np.take(self.entities, self._orders[is_yellow], axis=0, out=ordered)
+
+        if not is_left_team:
+            ordered[:, X:Y + 1] *= -1
+            ordered[:, V_X:V_Y + 1] *= -1
+            ordered[1:, THETA] -= np.pi * np.sign(ordered[1:, THETA])
+
+        np.clip(ordered[:, X] / self.max_x, -1, 1, out=normalized[:, X])
+        np.clip(ordered[:, Y] / self.max_y, -1, 1, out=normalized[:, Y])
+        np.divide(ordered[:, THETA], np.pi, out=normalized[:, THETA])
+        np.clip(ordered[:, V_X:V_Y + 1] / self.max_v, -1, 1, out=normalized[:, V_X:V_Y + 1])
+
+        np.copyto(
+            self._inside,
+            FieldUtils.are_inside_field(
+                ordered[:, X],
+                ordered[:, Y],
+                self.field_length,
+                self.field_width,
+                self.goal_width,
+                self.goal_depth))
+
+    def _set_relative_to_robot(self, robot_id: int):
+        ordered = self._ordered
+        delta = self._delta
+
+        np.subtract(ordered[:, X:Y + 1], ordered[1 + robot_id, X:Y + 1], out=delta)
+        np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1], out=self._distances)
+        np.arctan2(delta[:, 1], delta[:, 0], out=self._angles)
+
+        self._distances /= self.max_distance
+        self._angles /= np.pi
+
+        if self.clip_distance:
+            np.clip(self._distances, -1, 1, out=self._distances)
+
+    def _set_robots(
+        self,
+        observation: np.ndarray,
+        start: int,
+        rows: np.ndarray
+    ):
+        block = observation[start:].reshape(-1, ROBOT_OBSERVATION_SIZE)
+        block[:] = self._normalized[rows]
+        block[~self._inside[rows]] = 0
+
+    def _set_ball(
+        self,
+        observation: np.ndarray,
+        start: int
+    ):
+        normalized = self._normalized[BALL_INDEX]
+
+        observation[start] = normalized[X]
+        observation[start + 1] = normalized[Y]
+        observation[start + 2] = normalized[V_X]
+        observation[start + 3] = normalized[V_Y]
+
+    def get_attacker_observation(
+        self,
+        robot_id: int,
+        is_yellow: bool,
+        is_left_team: bool
+    ):
+        observation = self._attacker_observation
+        rows = self._robot_orders[robot_id]
+        others = rows[1:]
+
+        self._prepare(is_yellow, is_left_team)
+        self._set_relative_to_robot(robot_id)
+
+        normalized = self._normalized
+
+        observation[0] = self._distances[BALL_INDEX]
+        observation[1] = self._angles[BALL_INDEX]
+        observation[2:4] = normalized[BALL_INDEX, V_X:V_Y + 1]
+        observation[4:9] = normalized[rows[0]]
+
+        block = observation[9:].reshape(-1, ROBOT_OBSERVATION_SIZE)
+        block[:, 0] = self._distances[others]
+        block[:, 1] = self._angles[others]
+        block[:, 2:] = normalized[others, THETA:]
+        block[~self._inside[others]] = 0
+
+        return observation
+
+    def get_defender_observation(
+        self,
+        robot_id: int,
+        is_yellow: bool,
+        is_left_team: bool
+    ):
+        observation = self._defender_observation
+
+        self._prepare(is_yellow, is_left_team)
+        self._set_ball(observation, 0)
+        self._set_robots(observation, BALL_OBSERVATION_SIZE, self._robot_orders[robot_id])
+
+        return observation
+
+    def get_goalkeeper_observation(
+        self,
+        robot_id: int,
+        is_yellow: bool,
+        is_left_team: bool
+    ):
+        observation = self._goalkeeper_observation
+
+        self._prepare(is_yellow, is_left_team)
+        self._set_ball(observation, 0)
+        self._set_robots(observation, BALL_OBSERVATION_SIZE, self._robot_orders[robot_id][:1])
+
+        return observation
+
+    def get_team_observation(
+        self,
+        time_factor: float,
+        is_yellow: bool,
+        is_left_team: bool
+    ):
+        observation = self._team_observation
+
+        self._prepare(is_yellow, is_left_team)
+
+        observation[0] = time_factor
+        self._set_ball(observation, 1)
+        self._set_robots(observation, 1 + BALL_OBSERVATION_SIZE, self._robot_rows)
+
+        return observation
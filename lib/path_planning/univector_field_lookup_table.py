@@ -0,0 +1,208 @@
+import hashlib
+import os
+
+import numpy as np
+from configuration.configuration import Configuration
+from lib.domain.univector_field_navigation.univector_field_navigation_configuration import UnivectorFieldNavigationConfiguration
+from lib.path_planning.vectorized_univector_field_navigation import phi_tuf, wrap_to_pi
+
+LOOKUP_TABLE_EXTENSION = ".npy"
+
+COS = 0
+SIN = 1
+
+_configuration_tables: 'dict[tuple, PhiTufLookupTable]' = {}
+
+def _get_exact_values(
+    vector_x: np.ndarray,
+    vector_y: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration
+):
+    return phi_tuf(
+        np.arctan2(vector_y, vector_x),
+        vector_x,
+        vector_y,
+        configuration)
+
+def _get_key(
+    configuration: UnivectorFieldNavigationConfiguration,
+    max_x: float,
+    max_y: float,
+    resolution: float
+):
+    return (
+        configuration.de,
+        configuration.kr,
+        max_x,
+        max_y,
+        resolution)
+
+class PhiTufLookupTable:
+    """
+    Move-to-goal angles (phi_tuf) precomputed on a grid of vectors from the
+    target to the robot. The grid stores the cosine and the sine of the angle,
+    which are interpolated bilinearly, so the angle has no seam at +-pi.
+
+    The field is not smooth around the spiral centers, at (0, +-de), nor on
+    the lines y = +-de. Vectors closer to the target than exact_radius (2 de
+    by default), less than one cell away from those lines or outside the
+    grid use the exact function.
+    """
+
+    def __init__(
+        self,
+        configuration: UnivectorFieldNavigationConfiguration,
+        max_x: float,
+        max_y: float,
+        resolution: float,
+        directory: 'str | None' = None,
+        exact_radius: 'float | None' = None
+    ):
+        self.configuration = configuration
+        self.resolution = resolution
+        self.exact_radius = 2 * configuration.de if exact_radius is None else exact_radius
+
+        self.x_count = int(np.ceil(2 * max_x / resolution)) + 1
+        self.y_count = int(np.ceil(2 * max_y / resolution)) + 1
+
+        self.max_x = (self.x_count - 1) * resolution / 2
+        self.max_y = (self.y_count - 1) * resolution / 2
+
+        if directory is None:
+            self.table = self._create_table()
+        else:
+            self.table = self._load_table(directory)
+
+    @staticmethod
+    def get_configuration_table(configuration: UnivectorFieldNavigationConfiguration):
+        """
+        Returns the table of the configuration built with the lookup table
+        parameters of the configuration file. Each table is built and checked
+        against the maximum error once.
+        """
+
+        max_x = Configuration.field_length
+        max_y = Configuration.field_width
+        resolution = Configuration.univector_field_navigation_lookup_table_resolution
+
+        key = _get_key(configuration, max_x, max_y, resolution)
+        table = _configuration_tables.get(key, None)
+
+        if table is None:
+            directory = Configuration.univector_field_navigation_lookup_table_directory
+
+            table = PhiTufLookupTable(
+                configuration,
+                max_x,
+                max_y,
+                resolution,
+                directory)
+
+            table.check_error(Configuration.univector_field_navigation_lookup_table_max_error)
+
+            _configuration_tables[key] = table
+
+        return table
+
+    def _create_table(self):
+        xs = np.linspace(-self.max_x, self.max_x, self.x_count)
+        ys = np.linspace(-self.max_y, self.max_y, self.y_count)
+        vector_x, vector_y = np.meshgrid(xs, ys)
+
+        values = _get_exact_values(vector_x, vector_y, self.configuration)
+
+        return np.stack([np.cos(values), np.sin(values)]).astype(np.float32)
+
+    def _load_table(self, directory: str):
+        key = _get_key(self.configuration, self.max_x, self.max_y, self.resolution)
+        name = hashlib.sha1(repr(key).encode()).hexdigest()
+        file_path = os.path.join(directory, f"phi_tuf_{name}{LOOKUP_TABLE_EXTENSION}")
+
+        if not os.path.exists(file_path):
+            os.makedirs(directory, exist_ok=True)
+
+            temporary_path = f"{file_path}.{os.getpid()}.tmp"
+
+            with open(temporary_path, "wb") as file:
+                np.save(file, self._create_table())
+
+            os.replace(temporary_path, file_path)
+
+        return np.load(file_path, mmap_mode="r")
+
+    def get_phi_tuf_values(
+        self,
+        vector_x: np.ndarray,
+        vector_y: np.ndarray
+    ):
+        vector_x = np.asarray(vector_x, dtype=np.float64)
+        vector_y = np.asarray(vector_y, dtype=np.float64)
+
+        grid_x = (vector_x + self.max_x) / self.resolution
+        grid_y = (vector_y + self.max_y) / self.resolution
+
+        is_exact = (grid_x < 0) | (grid_x > self.x_count - 1) \
+            | (grid_y < 0) | (grid_y > self.y_count - 1) \
+            | (vector_x ** 2 + vector_y ** 2 < self.exact_radius ** 2) \
+            | (np.abs(np.abs(vector_y) - self.configuration.de) < self.resolution)
+
+        i = np.clip(np.floor(grid_x).astype(np.int64), 0, self.x_count - 2)
+        j = np.clip(np.floor(grid_y).astype(np.int64), 0, self.y_count - 2)
+
+        t_x = grid_x - i
+        t_y = grid_y - j
+
+        w_00 = (1 - t_x) * (1 - t_y)
+        w_10 = t_x * (1 - t_y)
+        w_01 = (1 - t_x) * t_y
+        w_11 = t_x * t_y
+
+        def interpolate(channel: np.ndarray):
+            return w_00 * channel[j, i] + w_10 * channel[j, i + 1] \
+                + w_01 * channel[j + 1, i] + w_11 * channel[j + 1, i + 1]
+
+        values = np.asarray(np.arctan2(
+            interpolate(self.table[SIN]),
+            interpolate(self.table[COS])))
+
+        if np.any(is_exact):
+            values[is_exact] = _get_exact_values(
+                vector_x[is_exact],
+                vector_y[is_exact],
+                self.configuration)
+
+        return values
+
+    def get_max_error(
+        self,
+        samples_count: int = 100000,
+        seed: int = 0
+    ):
+        """
+        Returns the largest angle difference, in radians, between the table
+        and the exact function on random vectors inside the grid.
+        """
+
+        random = np.random.default_rng(seed)
+
+        vector_x = random.uniform(-self.max_x, self.max_x, samples_count)
+        vector_y = random.uniform(-self.max_y, self.max_y, samples_count)
+
+        differences = wrap_to_pi(
+            self.get_phi_tuf_values(vector_x, vector_y)
+            - _get_exact_values(vector_x, vector_y, self.configuration))
+
+        return float(np.max(np.abs(differences)))
+
+    def check_error(
+        self,
+        max_error: float,
+        samples_count: int = 100000
+    ):
+        error = self.get_max_error(samples_count)
+
+        if error > max_error:
+            raise ValueError(
+                f"Lookup table error {error:.6f} rad is larger than {max_error:.6f} rad")
+
+        return error
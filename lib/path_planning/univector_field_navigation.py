@@ -1,6 +1,7 @@
 from math import cos, pi, sin, sqrt, atan2, exp
 import numpy as np
 from lib.domain.univector_field_navigation.obstacle import Obstacle
+from lib.domain.univector_field_navigation.obstacle_grid import ObstacleGrid
 from lib.domain.univector_field_navigation.univector_field_navigation_configuration import UnivectorFieldNavigationConfiguration
 
 default_configuration = UnivectorFieldNavigationConfiguration()
@@ -37,14 +38,11 @@ def get_closest_obstacle(
     returned_obstacle = None
 
     for obstacle in obstacles:
-        vector = get_vector(position, obstacle.position)
-    
-        if not count:
-            last_ro = get_vector_norm(vector)
-    
-        if get_vector_norm(vector) <= last_ro:
+        ro = get_vector_norm(get_vector(position, obstacle.position))
+
+        if not count or ro <= last_ro:
             returned_obstacle = obstacle
-            last_ro = get_vector_norm(vector)
+            last_ro = ro
 
         count += 1
 
@@ -218,3 +216,94 @@ def get_phi_composed_value_when_there_exists_obstacle(
         obstacle_point_distance,
         obstacle,
         configuration)
+
+
+def get_univector_field_point_theta_by_all_obstacles(
+    robot_position: 'tuple[float, float]',
+    robot_velocity: 'tuple[float, float]',
+    desired_position: 'tuple[float, float]',
+    obstacles: 'list[Obstacle]',
+    obstacle_grid: 'ObstacleGrid | None' = None,
+    configuration: UnivectorFieldNavigationConfiguration = default_configuration
+):
+    point_desired_vector = get_vector(
+        desired_position,
+        robot_position)
+
+    theta = phi_r(point_desired_vector)
+
+    phi_tuf_value = phi_tuf(
+        theta,
+        point_desired_vector,
+        configuration)
+
+    return get_phi_composed_value_by_all_obstacles(
+        phi_tuf_value,
+        robot_position,
+        robot_velocity,
+        obstacles,
+        obstacle_grid,
+        configuration)
+
+def get_phi_composed_value_by_all_obstacles(
+    phi_tuf_value: float,
+    robot_position: 'tuple[float, float]',
+    robot_velocity: 'tuple[float, float]',
+    obstacles: 'list[Obstacle]',
+    obstacle_grid: 'ObstacleGrid | None',
+    configuration: UnivectorFieldNavigationConfiguration
+):
+    """
+    Blends the avoidance fields of every obstacle closer than the influence
+    radius, from the obstacles list and from the cells of the obstacle grid
+    around the robot. Each obstacle is weighted by the same gaussian as the
+    closest obstacle composition, and the weights are scaled down when they
+    add up to more than one. Inside d_min of an obstacle, the avoidance field
+    of the closest one is followed.
+
+    With a single obstacle in range, the result is the same as
+    get_phi_composed_value.
+    """
+
+    influence_radius = configuration.influence_radius
+
+    if obstacle_grid is not None:
+        obstacles = list(obstacles) + obstacle_grid.get_obstacles_near(
+            robot_position,
+            influence_radius)
+
+    weights_sum = 0
+    weighted_difference_sum = 0
+    closest_distance = configuration.d_min
+    closest_phi_auf_value = None
+
+    for obstacle in obstacles:
+        distance = get_vector_norm(get_vector(obstacle.position, robot_position))
+
+        if distance > influence_radius:
+            continue
+
+        phi_auf_value = phi_auf(
+            obstacle,
+            robot_position,
+            robot_velocity,
+            distance,
+            configuration)
+
+        if distance <= closest_distance:
+            closest_distance = distance
+            closest_phi_auf_value = phi_auf_value
+            continue
+
+        weight = gaussian(distance - configuration.d_min, configuration)
+
+        weights_sum += weight
+        weighted_difference_sum += weight * wrap_to_pi(phi_auf_value - phi_tuf_value)
+
+    if closest_phi_auf_value is not None:
+        return wrap_to_pi(closest_phi_auf_value)
+
+    if weights_sum > 1:
+        weighted_difference_sum /= weights_sum
+
+    return wrap_to_pi(wrap_to_pi(weighted_difference_sum + phi_tuf_value))
@@ -0,0 +1,221 @@
+import numpy as np
+from lib.domain.univector_field_navigation.obstacle import Obstacle
+from lib.domain.univector_field_navigation.univector_field_navigation_configuration import UnivectorFieldNavigationConfiguration
+from lib.path_planning.univector_field_navigation import default_configuration
+
+# NumPy version of univector_field_navigation. Every function takes arrays
+# of points and follows the same operations as the scalar functions, so the
+# angles match get_univector_field_point_theta point by point.
+
+def _to_points(values):
+    return np.asarray(values, dtype=np.float64).reshape(-1, 2)
+
+def wrap_to_pi(angles: np.ndarray):
+    # single correction, as the scalar wrap_to_pi
+    return np.where(
+        angles > np.pi,
+        angles - 2 * np.pi,
+        np.where(angles < -np.pi, 2 * np.pi + angles, angles))
+
+def gaussian(
+    r: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration
+):
+    return np.exp(-(r ** 2 / (2 * configuration.gaussian_delta ** 2)))
+
+def get_spiral_angle(
+    rho: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration
+):
+    de = configuration.de
+    kr = configuration.kr
+
+    return np.where(
+        rho > de,
+        (np.pi / 2) * (2 - ((de + kr) / (rho + kr))),
+        (np.pi / 2) * np.sqrt(rho / de))
+
+def phi_tuf(
+    theta: np.ndarray,
+    vector_x: np.ndarray,
+    vector_y: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration
+):
+    de = configuration.de
+
+    y_l = vector_y + de
+    y_r = vector_y - de
+
+    ro_l = np.sqrt(vector_x ** 2 + (vector_y - de) ** 2)
+    ro_r = np.sqrt(vector_x ** 2 + (vector_y + de) ** 2)
+
+    angle_l = get_spiral_angle(ro_l, configuration)
+    angle_r = get_spiral_angle(ro_r, configuration)
+
+    phi_counter_clockwise = wrap_to_pi(theta - angle_l)
+    phi_clockwise = wrap_to_pi(theta + angle_r)
+
+    abs_y_l = np.abs(y_l)
+    abs_y_r = np.abs(y_r)
+
+    spiral_merge_x = (abs_y_l * np.cos(phi_counter_clockwise) + abs_y_r * np.cos(phi_clockwise)) / (2 * de)
+    spiral_merge_y = (abs_y_l * np.sin(phi_counter_clockwise) + abs_y_r * np.sin(phi_clockwise)) / (2 * de)
+
+    phi_tuf_values = np.where(
+        (-de <= vector_y) & (vector_y < de),
+        np.arctan2(spiral_merge_y, spiral_merge_x),
+        np.where(
+            vector_y < -de,
+            wrap_to_pi(theta + angle_l),
+            wrap_to_pi(theta - angle_r)))
+
+    return wrap_to_pi(phi_tuf_values)
+
+def get_phi_tuf_values(
+    robot_positions: np.ndarray,
+    desired_positions: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration = default_configuration,
+    lookup_table: 'PhiTufLookupTable | None' = None
+):
+    vectors = _to_points(robot_positions) - _to_points(desired_positions)
+    vector_x = vectors[:, 0]
+    vector_y = vectors[:, 1]
+
+    if lookup_table is not None:
+        return lookup_table.get_phi_tuf_values(vector_x, vector_y)
+
+    return phi_tuf(
+        np.arctan2(vector_y, vector_x),
+        vector_x,
+        vector_y,
+        configuration)
+
+def obstacles_to_arrays(obstacles: 'list[Obstacle]'):
+    positions = np.array([item.position for item in obstacles], dtype=np.float64).reshape(-1, 2)
+    velocities = np.array([item.velocities for item in obstacles], dtype=np.float64).reshape(-1, 2)
+
+    return positions, velocities
+
+def get_phi_composed_values(
+    phi_tuf_values: np.ndarray,
+    robot_positions: np.ndarray,
+    robot_velocities: np.ndarray,
+    obstacle_positions: np.ndarray,
+    obstacle_velocities: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration = default_configuration
+):
+    """
+    Composes the move-to-goal angles with the closest obstacle of each point.
+    The obstacles are either shared by every point, with shape (M, 2), or
+    given per point, with shape (N, M, 2).
+    """
+
+    robot_positions = _to_points(robot_positions)
+    points_count = len(robot_positions)
+
+    obstacle_positions = np.asarray(obstacle_positions, dtype=np.float64)
+
+    if obstacle_positions.size == 0:
+        return wrap_to_pi(phi_tuf_values)
+
+    obstacles_count = obstacle_positions.shape[-2]
+    shape = (points_count, obstacles_count, 2)
+
+    obstacle_positions = np.broadcast_to(obstacle_positions, shape)
+    obstacle_velocities = np.broadcast_to(np.asarray(obstacle_velocities, dtype=np.float64), shape)
+    robot_velocities = np.broadcast_to(_to_points(robot_velocities), (points_count, 2))
+
+    vectors = robot_positions[:, None, :] - obstacle_positions
+    distances = np.sqrt(vectors[..., 0] ** 2 + vectors[..., 1] ** 2)
+
+    # the scalar scan keeps the last of the closest obstacles
+    indexes = obstacles_count - 1 - np.argmin(distances[:, ::-1], axis=1)
+    rows = np.arange(points_count)
+
+    distance = distances[rows, indexes]
+    obstacle_position = obstacle_positions[rows, indexes]
+    obstacle_velocity = obstacle_velocities[rows, indexes]
+
+    shifting_vectors = configuration.k_0 * (obstacle_velocity - robot_velocities)
+    shifting_norms = np.sqrt(shifting_vectors[:, 0] ** 2 + shifting_vectors[:, 1] ** 2)
+
+    is_far = distance >= shifting_norms
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near_shifting_vectors = distance[:, None] * shifting_vectors / shifting_norms[:, None]
+
+    virtual_obstacle_positions = obstacle_position + np.where(
+        is_far[:, None],
+        shifting_vectors,
+        near_shifting_vectors)
+
+    auf_vectors = robot_positions - virtual_obstacle_positions
+    phi_auf_values = wrap_to_pi(np.arctan2(auf_vectors[:, 1], auf_vectors[:, 0]))
+
+    gaussian_values = gaussian(distance - configuration.d_min, configuration)
+    differences = wrap_to_pi(phi_auf_values - phi_tuf_values)
+
+    phi_composed_values = np.where(
+        distance <= configuration.d_min,
+        phi_auf_values,
+        wrap_to_pi(gaussian_values * differences + phi_tuf_values))
+
+    return wrap_to_pi(phi_composed_values)
+
+def get_univector_field_points_theta(
+    robot_positions: np.ndarray,
+    robot_velocities: np.ndarray,
+    desired_positions: np.ndarray,
+    obstacle_positions: np.ndarray,
+    obstacle_velocities: np.ndarray,
+    configuration: UnivectorFieldNavigationConfiguration = default_configuration,
+    lookup_table: 'PhiTufLookupTable | None' = None
+):
+    """
+    Returns the angle of the field at N points. The velocities and desired
+    positions are (N, 2) arrays or a single point shared by all of them.
+    When a PhiTufLookupTable of the configuration is given, the move-to-goal
+    angles are read from it.
+    """
+
+    robot_positions = _to_points(robot_positions)
+
+    phi_tuf_values = get_phi_tuf_values(
+        robot_positions,
+        desired_positions,
+        configuration,
+        lookup_table)
+
+    return get_phi_composed_values(
+        phi_tuf_values,
+        robot_positions,
+        robot_velocities,
+        obstacle_positions,
+        obstacle_velocities,
+        configuration)
+
+def get_univector_field_grid(
+    x_values: np.ndarray,
+    y_values: np.ndarray,
+    desired_position: 'tuple[float, float]',
+    obstacles: 'list[Obstacle]',
+    robot_velocity: 'tuple[float, float]' = (0, 0),
+    configuration: UnivectorFieldNavigationConfiguration = default_configuration
+):
+    """
+    Evaluates the field on the grid given by x_values and y_values. Returns
+    a (len(y_values), len(x_values)) array of angles.
+    """
+
+    xs, ys = np.meshgrid(x_values, y_values)
+    obstacle_positions, obstacle_velocities = obstacles_to_arrays(obstacles)
+
+    thetas = get_univector_field_points_theta(
+        np.stack([xs.ravel(), ys.ravel()], axis=1),
+        robot_velocity,
+        desired_position,
+        obstacle_positions,
+        obstacle_velocities,
+        configuration)
+
+    return thetas.reshape(xs.shape)
@@ -1,8 +1,7 @@
+import weakref
 import numpy as np
 from configuration.configuration import Configuration
 from lib.domain.field import Field
-from lib.domain.robot import Robot
-from lib.path_planning.univector_field_navigation import get_univector_field_point_theta
 from lib.domain.univector_field_navigation.univector_field_navigation_configuration import UnivectorFieldNavigationConfiguration
 from lib.utils.field_utils import FieldUtils
 from lib.utils.geometry_utils import GeometryUtils
@@ -30,6 +29,17 @@ W_DISTANCE_TO_POSITION = Configuration.supporter_weights_distance_to_position
 W_DISTANCE_TO_BALL = Configuration.supporter_weights_distance_to_ball
 W_DISTANCE_TO_GOAL = Configuration.supporter_weights_distance_to_goal
 
+TRACKING_ENABLED = Configuration.supporter_tracking_enabled
+TRACKING_WINDOW_RADIUS = Configuration.supporter_tracking_window_radius
+TRACKING_FULL_SEARCH_INTERVAL = Configuration.supporter_tracking_full_search_interval
+TRACKING_SCORE_CHANGE_THRESHOLD = Configuration.supporter_tracking_score_change_threshold
+TRACKING_HYSTERESIS = Configuration.supporter_tracking_hysteresis
+
+MULTIRESOLUTION_ENABLED = Configuration.supporter_multiresolution_enabled
+MULTIRESOLUTION_LEVELS = Configuration.supporter_multiresolution_levels
+MULTIRESOLUTION_TOP_K = Configuration.supporter_multiresolution_top_k
+MULTIRESOLUTION_REFINEMENT = Configuration.supporter_multiresolution_refinement
+
 univector_field_navigation_configuration = UnivectorFieldNavigationConfiguration(
     Configuration.supporter_univector_field_navigation_de,
     Configuration.supporter_univector_field_navigation_kr,
@@ -38,181 +48,348 @@ univector_field_navigation_configuration = UnivectorFieldNavigationConfiguration
     Configuration.supporter_univector_field_navigation_gaussian_delta
 )
 
-def _get_distance(
-    position1: 'tuple[float, float]',
-    position2: 'tuple[float, float]'
+def _get_distances(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    reference_position: 'tuple[float, float]'
 ):
-    return GeometryUtils.distance(
-        position1,
-        position2)
+    x, y = reference_position
+    return np.sqrt((x - xs) ** 2 + (y - ys) ** 2)
 
-def _get_attraction_distance_score(
-    current_position: 'tuple[float, float]',
+def _get_attraction_distance_scores(
+    xs: np.ndarray,
+    ys: np.ndarray,
     reference_position: 'tuple[float, float]',
     min_distance: float
 ):
-    distance = _get_distance(
-        current_position,
-        reference_position)
+    distances = _get_distances(xs, ys, reference_position)
 
-    if distance < min_distance:
-        return 0
-    
-    return 1 - ((distance - min_distance) / (MAX_DISTANCE - min_distance))
+    return np.where(
+        distances < min_distance,
+        0,
+        1 - ((distances - min_distance) / (MAX_DISTANCE - min_distance)))
 
-def _get_repulsive_distance_score(
-    current_position: 'tuple[float, float]',
+def _get_repulsive_distance_scores(
+    xs: np.ndarray,
+    ys: np.ndarray,
     reference_position: 'tuple[float, float]',
     min_distance: float
 ):
-    distance = _get_distance(
-        current_position,
-        reference_position)
+    distances = _get_distances(xs, ys, reference_position)
 
-    if distance < min_distance:
-        return 0
-    
-    return (distance - min_distance) / (MAX_DISTANCE - min_distance)
+    return np.where(
+        distances < min_distance,
+        0,
+        (distances - min_distance) / (MAX_DISTANCE - min_distance))
 
-def _get_ball_distance_score(
-    position: 'tuple[float, float]',
+def _get_considered_robot_positions(
+    robot_id: int,
     field: Field
 ):
-    return _get_attraction_distance_score(
-        position,
-        field.ball.get_position_tuple(),
-        BALL_MIN_DISTANCE)
-
-def _get_distance_to_robot_score(
-    position: 'tuple[float, float]',
+    ball_position = field.ball.get_position_tuple()
+    robots = [item for item in field.get_active_robots() if item.id != robot_id]
+    robots.extend(field.get_active_foes())
+
+    return [
+        robot.get_position_tuple()
+        for robot in robots
+        if GeometryUtils.distance(robot.get_position_tuple(), ball_position) <= CONSIDERED_ROBOT_DISTANCE
+    ]
+
+def _get_distance_to_robot_scores(
+    xs: np.ndarray,
+    ys: np.ndarray,
     robot_id: int,
     field: Field
 ):
-    distance_scores = []
-    ball_position = field.ball.get_position_tuple()
-    robots = field.get_active_robots()
-    foes = field.get_active_foes()
-
-    def append_score(robot: Robot):
-        distance = _get_distance(
-            robot.get_position_tuple(),
-            ball_position
-        )
-
-        if distance > CONSIDERED_ROBOT_DISTANCE:
-            return
+    robot_positions = _get_considered_robot_positions(robot_id, field)
 
-        distance_score = _get_repulsive_distance_score(
-            position,
-            robot.get_position_tuple(),
-            ROBOT_MIN_DISTANCE)
+    if len(robot_positions) == 0:
+        return np.ones_like(xs)
 
-        distance_scores.append(distance_score)
+    return np.mean(
+        [
+            _get_repulsive_distance_scores(xs, ys, item, ROBOT_MIN_DISTANCE)
+            for item in robot_positions
+        ],
+        axis=0)
 
-    for item in robots:
-        if item.id == robot_id:
-            continue
+def _get_distance_to_goal_scores(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    field: Field
+):
+    ball = field.ball
 
-        append_score(item)
+    if ball.position.x < 0:
+        return _get_attraction_distance_scores(xs, ys, (-FIELD_LENGTH / 2, 0), 0)
 
-    for item in foes:
-        append_score(item)
+    return np.where(
+        xs > (ball.position.x - DISTANCE_BEHIND_BALL),
+        0,
+        _get_attraction_distance_scores(xs, ys, (FIELD_LENGTH / 2, 0), 0))
 
-    return 1 if len(distance_scores) == 0 else np.mean(distance_scores)
+def _are_inside_goal_area(
+    xs: np.ndarray,
+    ys: np.ndarray
+):
+    return (np.abs(xs) > FIELD_LENGTH / 2 - GOAL_AREA_LENGTH) & (np.abs(ys) < GOAL_AREA_WIDTH / 2)
 
-def _get_distance_to_position_score(
-    position: 'tuple[float, float]',
+def _get_scores(
     robot_id: int,
-    field: Field
+    field: Field,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    inside_goal_area: 'np.ndarray | None' = None
 ):
-    robot = field.get_robot_by_id(robot_id)
-    return _get_attraction_distance_score(
-        position,
-        robot.get_position_tuple(),
+    """
+    Scores of the positions (xs[i], ys[i]) as a supporter target.
+    """
+
+    if inside_goal_area is None:
+        inside_goal_area = _are_inside_goal_area(xs, ys)
+
+    distance_to_ball_scores = _get_attraction_distance_scores(
+        xs,
+        ys,
+        field.ball.get_position_tuple(),
+        BALL_MIN_DISTANCE)
+
+    distance_to_position_scores = _get_attraction_distance_scores(
+        xs,
+        ys,
+        field.get_robot_by_id(robot_id).get_position_tuple(),
         0)
 
-def _get_distance_to_goal_score(
-    position: 'tuple[float, float]',
-    field: Field
+    distance_to_robot_scores = _get_distance_to_robot_scores(
+        xs,
+        ys,
+        robot_id,
+        field)
+
+    distance_to_goal_scores = _get_distance_to_goal_scores(
+        xs,
+        ys,
+        field)
+
+    scores = W_DISTANCE_TO_ROBOT * distance_to_robot_scores +\
+        W_DISTANCE_TO_POSITION * distance_to_position_scores +\
+            W_DISTANCE_TO_BALL * distance_to_ball_scores +\
+            W_DISTANCE_TO_GOAL * distance_to_goal_scores
+
+    return np.where(inside_goal_area, 0, scores)
+
+X_STEP = CONSIDERED_LENGTH / (X_STEP_COUNT + 1)
+Y_STEP = CONSIDERED_WIDTH / (Y_STEP_COUNT + 1)
+
+def _get_grid_positions():
+    x_step = X_STEP
+    y_step = Y_STEP
+    max_x, max_y = CONSIDERED_LENGTH / 2, CONSIDERED_WIDTH / 2
+    min_x, min_y = -max_x, -max_y
+
+    # x major, the order in which the grid used to be visited
+    xs, ys = np.meshgrid(
+        np.arange(min_x, max_x, x_step),
+        np.arange(min_y, max_y, y_step),
+        indexing="ij")
+
+    return xs.ravel(), ys.ravel(), xs.shape
+
+GRID_XS, GRID_YS, GRID_SHAPE = _get_grid_positions()
+GRID_INSIDE_GOAL_AREA = _are_inside_goal_area(GRID_XS, GRID_YS)
+
+def _get_best_position(
+    scores: np.ndarray,
+    xs: np.ndarray,
+    ys: np.ndarray
 ):
-    ball = field.ball
-    is_ball_inside_defensive_area = ball.position.x < 0
-    
-    if is_ball_inside_defensive_area:
-        reference_position = (-FIELD_LENGTH / 2, 0)
-    else:
-        if position[0] > (ball.position.x - DISTANCE_BEHIND_BALL):
-            return 0
+    # first position with the highest score, or (0, 0) as when no score
+    # beats the initial -1
+    index = np.argmax(scores)
+
+    if scores[index] <= -1:
+        return (0, 0)
+
+    return (xs[index], ys[index])
+
+class SupporterTracker:
+    """
+    Keeps the target cell of one supporter between calls.
+
+    Each call scores only the cells within window_radius of the current
+    cell. A full grid search runs on the first call, every
+    full_search_interval calls, and whenever the score of the current cell
+    moves more than score_change_threshold from its last value. The target
+    only moves to another cell that scores more than hysteresis above the
+    current one, so it does not jitter between cells with equal scores.
+    """
+
+    def __init__(
+        self,
+        window_radius: int = TRACKING_WINDOW_RADIUS,
+        full_search_interval: int = TRACKING_FULL_SEARCH_INTERVAL,
+        score_change_threshold: float = TRACKING_SCORE_CHANGE_THRESHOLD,
+        hysteresis: float = TRACKING_HYSTERESIS
+    ):
+        self.window_radius = window_radius
+        self.full_search_interval = full_search_interval
+        self.score_change_threshold = score_change_threshold
+        self.hysteresis = hysteresis
+
+        self.index: 'int | None' = None
+        self.score: float = 0
+        self.steps_since_full_search = 0
+
+    def reset(self):
+        self.index = None
+
+    def _get_window_indexes(self):
+        x_count, y_count = GRID_SHAPE
+        i, j = divmod(self.index, y_count)
+        r = self.window_radius
+
+        rows = np.arange(max(i - r, 0), min(i + r + 1, x_count))
+        columns = np.arange(max(j - r, 0), min(j + r + 1, y_count))
+
+        return (rows[:, None] * y_count + columns[None, :]).ravel()
+
+    def _set_best(
+        self,
+        indexes: np.ndarray,
+        scores: np.ndarray
+    ):
+        best = np.argmax(scores)
+        current = np.flatnonzero(indexes == self.index)
+
+        if len(current) == 0 or scores[best] > scores[current[0]] + self.hysteresis:
+            self.index = int(indexes[best])
+            self.score = float(scores[best])
         else:
-            reference_position = (FIELD_LENGTH / 2, 0)
+            self.score = float(scores[current[0]])
 
-    return _get_attraction_distance_score(
-        position,
-        reference_position,
-        0)
+        return (GRID_XS[self.index], GRID_YS[self.index])
+
+    def _search_grid(
+        self,
+        robot_id: int,
+        field: Field
+    ):
+        self.steps_since_full_search = 0
+
+        scores = _get_scores(
+            robot_id,
+            field,
+            GRID_XS,
+            GRID_YS,
+            GRID_INSIDE_GOAL_AREA)
+
+        return self._set_best(np.arange(len(GRID_XS)), scores)
 
-def _is_inside_goal_area(
-    position: 'tuple[float, float]'
+    def get_position(
+        self,
+        robot_id: int,
+        field: Field
+    ):
+        if self.index is None or self.steps_since_full_search >= self.full_search_interval:
+            return self._search_grid(robot_id, field)
+
+        indexes = self._get_window_indexes()
+
+        scores = _get_scores(
+            robot_id,
+            field,
+            GRID_XS[indexes],
+            GRID_YS[indexes],
+            GRID_INSIDE_GOAL_AREA[indexes])
+
+        current_score = scores[np.flatnonzero(indexes == self.index)[0]]
+
+        if abs(current_score - self.score) > self.score_change_threshold:
+            return self._search_grid(robot_id, field)
+
+        self.steps_since_full_search += 1
+
+        return self._set_best(indexes, scores)
+
+_refinement_offsets: 'dict[tuple[int, int], tuple[np.ndarray, np.ndarray]]' = {}
+
+def _get_refinement_offsets(
+    level: int,
+    refinement: int
 ):
-    return FieldUtils.is_inside_goal_area(
-        position,
-        FIELD_LENGTH,
-        GOAL_AREA_LENGTH,
-        GOAL_AREA_WIDTH)
+    key = (level, refinement)
+
+    if key not in _refinement_offsets:
+        # cells of the level cover the neighbours of a cell of the previous one
+        steps = np.arange(-refinement, refinement + 1) / refinement ** level
+        x_offsets, y_offsets = np.meshgrid(X_STEP * steps, Y_STEP * steps, indexing="ij")
+        _refinement_offsets[key] = (x_offsets.ravel(), y_offsets.ravel())
+
+    return _refinement_offsets[key]
 
-def _get_score(
+def get_supporter_position_by_multiresolution(
     robot_id: int,
     field: Field,
-    position: 'tuple[float, float]'
+    levels: int = MULTIRESOLUTION_LEVELS,
+    top_k: int = MULTIRESOLUTION_TOP_K,
+    refinement: int = MULTIRESOLUTION_REFINEMENT
 ):
-    if _is_inside_goal_area(position):
-        return 0
+    """
+    Coarse to fine search. The base grid is scored first; at each of the
+    next levels, the top_k positions of the previous one are refined with a
+    grid refinement times denser around each of them.
+    """
 
-    distance_to_ball_score = _get_ball_distance_score(
-        position,
-        field)
+    xs, ys = GRID_XS, GRID_YS
 
-    distance_to_position_score = _get_distance_to_position_score(
-        position,
+    scores = _get_scores(
         robot_id,
-        field)
+        field,
+        xs,
+        ys,
+        GRID_INSIDE_GOAL_AREA)
 
-    distance_to_robot_score = _get_distance_to_robot_score(
-        position,
-        robot_id,
-        field)
-    
-    distance_to_goal_score = _get_distance_to_goal_score(
-        position,
-        field)
+    max_x, max_y = CONSIDERED_LENGTH / 2, CONSIDERED_WIDTH / 2
 
-    return W_DISTANCE_TO_ROBOT * distance_to_robot_score +\
-        W_DISTANCE_TO_POSITION * distance_to_position_score +\
-            W_DISTANCE_TO_BALL * distance_to_ball_score +\
-            W_DISTANCE_TO_GOAL * distance_to_goal_score
+    for level in range(1, levels):
+        count = min(top_k, len(scores))
+        best = np.argpartition(-scores, count - 1)[:count]
+        x_offsets, y_offsets = _get_refinement_offsets(level, refinement)
 
-def get_supporter_position(robot_id: int, field: Field):
-    x_step = CONSIDERED_LENGTH / (X_STEP_COUNT + 1)
-    y_step = CONSIDERED_WIDTH / (Y_STEP_COUNT + 1)
-    max_x, max_y = CONSIDERED_LENGTH / 2, CONSIDERED_WIDTH / 2
-    min_x, min_y = -max_x, -max_y
+        xs = np.clip((xs[best][:, None] + x_offsets).ravel(), -max_x, max_x)
+        ys = np.clip((ys[best][:, None] + y_offsets).ravel(), -max_y, max_y)
 
-    max_score = -1
-    best_position = (0, 0)
+        scores = _get_scores(robot_id, field, xs, ys)
 
-    for x in np.arange(min_x, max_x, x_step):
-        for y in np.arange(min_y, max_y, y_step):
-            position = (x, y)
-            score = _get_score(
-                robot_id,
-                field,
-                (x, y))
+    return _get_best_position(scores, xs, ys)
 
-            if score > max_score:
-                max_score = score
-                best_position = position
+# one tracker per robot of each field, released with the field
+_trackers: 'weakref.WeakKeyDictionary[Field, dict[int, SupporterTracker]]' = weakref.WeakKeyDictionary()
 
-    return best_position
+def get_supporter_tracker(robot_id: int, field: Field):
+    field_trackers = _trackers.setdefault(field, {})
+
+    if robot_id not in field_trackers:
+        field_trackers[robot_id] = SupporterTracker()
+
+    return field_trackers[robot_id]
+
+def get_supporter_position(robot_id: int, field: Field):
+    if TRACKING_ENABLED:
+        return get_supporter_tracker(robot_id, field).get_position(robot_id, field)
+
+    if MULTIRESOLUTION_ENABLED:
+        return get_supporter_position_by_multiresolution(robot_id, field)
+
+    scores = _get_scores(
+        robot_id,
+        field,
+        GRID_XS,
+        GRID_YS,
+        GRID_INSIDE_GOAL_AREA)
+
+    return _get_best_position(scores, GRID_XS, GRID_YS)
 
 def get_supporter_speeds(
     robot_id: int,
@@ -234,9 +411,8 @@ def get_supporter_speeds(
         robot_id
     )
 
-    theta = get_univector_field_point_theta(
-        robot.get_position_tuple(),
-        robot.get_velocity_tuple(),
+    theta = MotionUtils.get_univector_field_theta(
+        robot,
         target_position,
         obstacles,
         univector_field_navigation_configuration
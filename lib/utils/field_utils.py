@@ -1,10 +1,12 @@
 import random
 import math
+import numpy as np
 
 from lib.domain.ball import Ball
 from lib.domain.field import Field
 from lib.domain.robot import Robot
 from lib.domain.univector_field_navigation.obstacle import Obstacle
+from lib.domain.univector_field_navigation.obstacle_grid import ObstacleGrid
 from lib.utils.geometry_utils import GeometryUtils
 
 class FieldUtils:
@@ -26,6 +28,23 @@ class FieldUtils:
 
         return abs(x) < field_length / 2 and abs(y) < field_width / 2
     
+    @staticmethod
+    def are_inside_field(
+        x: np.ndarray,
+        y: np.ndarray,
+        field_length: float,
+        field_width: float,
+        goal_width: float,
+        goal_depth: float
+    ):
+        abs_x = np.abs(x)
+        abs_y = np.abs(y)
+
+        return np.where(
+            abs_y < goal_width / 2,
+            abs_x < (field_length / 2 + goal_depth),
+            (abs_x < field_length / 2) & (abs_y < field_width / 2))
+
     @staticmethod
     def is_inside_playable_field(
         x: float,
@@ -324,12 +343,24 @@ class FieldUtils:
 
         return (abs(x) > field_length / 2 - goal_area_length) and (abs(y) < goal_area_width / 2)
     
-    # _goal_obstacles = [
-    #     Obstacle((.8, .25), (0, 0)),
-    #     Obstacle((.8, -.25), (0, 0)),
-    #     Obstacle((-.8, .25), (0, 0)),
-    #     Obstacle((-.8, -.25), (0, 0))
-    # ]
+    _goal_obstacles = [
+        Obstacle((.8, .25), (0, 0)),
+        Obstacle((.8, -.25), (0, 0)),
+        Obstacle((-.8, .25), (0, 0)),
+        Obstacle((-.8, -.25), (0, 0))
+    ]
+
+    _goal_obstacle_grids: 'dict[float, ObstacleGrid]' = {}
+
+    @staticmethod
+    def get_goal_obstacle_grid(cell_size: float):
+        obstacle_grid = FieldUtils._goal_obstacle_grids.get(cell_size, None)
+
+        if obstacle_grid is None:
+            obstacle_grid = ObstacleGrid(cell_size, FieldUtils._goal_obstacles)
+            FieldUtils._goal_obstacle_grids[cell_size] = obstacle_grid
+
+        return obstacle_grid
     
     @staticmethod
     def to_obstacles(
@@ -343,8 +374,6 @@ class FieldUtils:
             for item in objects
         ]
 
-        #obstacles.extend(FieldUtils._goal_obstacles)
-
         return obstacles
     
     @staticmethod
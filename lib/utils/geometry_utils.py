@@ -29,6 +29,11 @@ class GeometryUtils:
     @staticmethod
     def normalize_in_pi(radians: float):
         return GeometryUtils.normalize_angle(radians, 0, math.pi)
+
+    @staticmethod
+    def normalize_array_in_pi(radians: np.ndarray):
+        angles = radians % (2 * np.pi)
+        return np.where(angles > np.pi, angles - 2 * np.pi, angles)
     
     @staticmethod
     def correct_angle(
@@ -1,27 +1,55 @@
-from stable_baselines3 import PPO
+import threading
 import uuid
 from configuration.configuration import Configuration
 from lib.domain.enums.role_enum import RoleEnum
+from lib.inference.batched_inference import BatchedInference, BatchedModel
+from lib.inference.inference_client import InferenceClient, RemoteModel
+from lib.inference.numpy_policy import NUMPY_POLICY_EXTENSION, NumpyPolicy
 
 def _load_ppo_model(model_path: str):
+    from stable_baselines3 import PPO
+
     return PPO.load(model_path)
 
+def _get_unbatched_model(model_path: str):
+    if model_path.endswith(NUMPY_POLICY_EXTENSION):
+        return NumpyPolicy.load(model_path)
+
+    # imported here so that a NumPy-only deployment starts without torch and SB3
+    from lib.inference.shared_policy import SHARED_POLICY_EXTENSION, SharedPolicyModel, get_shared_policy_model
+
+    if model_path.endswith(SHARED_POLICY_EXTENSION):
+        return SharedPolicyModel(model_path)
+    if ModelUtils._inference_client is not None:
+        return RemoteModel(ModelUtils._inference_client, model_path)
+    if ModelUtils._shared_directory is not None:
+        return get_shared_policy_model(model_path, ModelUtils._shared_directory)
+    return _load_ppo_model(model_path)
+
+def _get_model(model_path: str):
+    model = _get_unbatched_model(model_path)
+
+    if ModelUtils._batched_inference is not None:
+        return BatchedModel(ModelUtils._batched_inference, model)
+
+    return model
+
 def _get_attacker_model():
-    return _load_ppo_model(Configuration.model_attacker_path)
+    return _get_model(Configuration.model_attacker_path)
 
 def _get_defender_model():
-    return _load_ppo_model(Configuration.model_defender_path)
+    return _get_model(Configuration.model_defender_path)
 
 def _get_goalkeeper_model():
-    return _load_ppo_model(Configuration.model_goalkeeper_path)
+    return _get_model(Configuration.model_goalkeeper_path)
 
 def _get_team_model():
-    return _load_ppo_model(Configuration.model_team_path)
+    return _get_model(Configuration.model_team_path)
 
 class StoredModel:
     def __init__(self):
         self.path: str = None
-        self.model: PPO = None
+        self.model: 'PPO | NumpyPolicy | RemoteModel | SharedPolicyModel | BatchedModel' = None
 
 class ModelUtils:
     _attacker_model = None
@@ -29,30 +57,51 @@ class ModelUtils:
     _goalkeeper_model = None
     _team_model = None
     _model_dictionary: 'dict[str, StoredModel]' = {}
+    _inference_client: 'InferenceClient | None' = None
+    _shared_directory: 'str | None' = None
+    _batched_inference: 'BatchedInference | None' = None
+    # environments stepped in threads share the models of their process
+    _lock = threading.RLock()
+
+    @staticmethod
+    def set_inference_client(inference_client: 'InferenceClient | None'):
+        ModelUtils._inference_client = inference_client
+
+    @staticmethod
+    def set_shared_directory(shared_directory: 'str | None'):
+        ModelUtils._shared_directory = shared_directory
+
+    @staticmethod
+    def set_batched_inference(batched_inference: 'BatchedInference | None'):
+        ModelUtils._batched_inference = batched_inference
 
     @staticmethod
     def attacker_model():
-        if ModelUtils._attacker_model is None:
-            ModelUtils._attacker_model = _get_attacker_model()
-        return ModelUtils._attacker_model
+        with ModelUtils._lock:
+            if ModelUtils._attacker_model is None:
+                ModelUtils._attacker_model = _get_attacker_model()
+            return ModelUtils._attacker_model
 
     @staticmethod
     def defender_model():
-        if ModelUtils._defender_model is None:
-            ModelUtils._defender_model = _get_defender_model()
-        return ModelUtils._defender_model
+        with ModelUtils._lock:
+            if ModelUtils._defender_model is None:
+                ModelUtils._defender_model = _get_defender_model()
+            return ModelUtils._defender_model
     
     @staticmethod
     def goalkeeper_model():
-        if ModelUtils._goalkeeper_model is None:
-            ModelUtils._goalkeeper_model = _get_goalkeeper_model()
-        return ModelUtils._goalkeeper_model
+        with ModelUtils._lock:
+            if ModelUtils._goalkeeper_model is None:
+                ModelUtils._goalkeeper_model = _get_goalkeeper_model()
+            return ModelUtils._goalkeeper_model
 
     @staticmethod
     def team_model():
-        if ModelUtils._team_model is None:
-            ModelUtils._team_model = _get_team_model()
-        return ModelUtils._team_model
+        with ModelUtils._lock:
+            if ModelUtils._team_model is None:
+                ModelUtils._team_model = _get_team_model()
+            return ModelUtils._team_model
     
     @staticmethod
     def get_model_by_role_enum(role_enum: RoleEnum):
@@ -75,14 +124,14 @@ class ModelUtils:
         id: str,
         path: str 
     ):
-        item = ModelUtils._model_dictionary.get(id, None)
-
-        if item is None:
-            return None
+        with ModelUtils._lock:
+            # ids taken in the training process are first seen here in the
+            # environment processes the behaviors are pickled to
+            item = ModelUtils._model_dictionary.setdefault(id, StoredModel())
 
-        if item.path != path:
-            item.path = path
-            del item.model
-            item.model = _load_ppo_model(path)
+            if item.path != path:
+                item.path = path
+                del item.model
+                item.model = _get_model(path)
 
-        return item.model
+            return item.model
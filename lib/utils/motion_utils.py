@@ -1,7 +1,11 @@
 import numpy as np
 from lib.domain.robot import Robot
 from lib.domain.univector_field_navigation.obstacle import Obstacle
-from lib.path_planning.univector_field_navigation import get_univector_field_point_theta
+from lib.domain.univector_field_navigation.univector_field_navigation_configuration import UnivectorFieldNavigationConfiguration
+from lib.path_planning.univector_field_lookup_table import PhiTufLookupTable
+from lib.path_planning.univector_field_navigation import default_configuration, get_univector_field_point_theta, get_univector_field_point_theta_by_all_obstacles
+from lib.path_planning.vectorized_univector_field_navigation import get_univector_field_points_theta, obstacles_to_arrays
+from lib.utils.field_utils import FieldUtils
 from lib.utils.geometry_utils import GeometryUtils
 from configuration.configuration import Configuration
 from lib.utils.robot_utils import RobotUtils
@@ -29,7 +33,50 @@ def _is_close(robot: Robot, position: 'tuple[float, float]'):
         position,
         .05)
 
+def _get_lookup_table(configuration: UnivectorFieldNavigationConfiguration):
+    if not Configuration.univector_field_navigation_lookup_table_enabled:
+        return None
+
+    return PhiTufLookupTable.get_configuration_table(configuration)
+
 class MotionUtils:
+    @staticmethod
+    def get_univector_field_theta(
+        robot: Robot,
+        target_position: 'tuple[float, float]',
+        obstacles: 'list[Obstacle]',
+        configuration: UnivectorFieldNavigationConfiguration = default_configuration
+    ):
+        if Configuration.univector_field_navigation_multi_obstacle:
+            return get_univector_field_point_theta_by_all_obstacles(
+                robot.get_position_tuple(),
+                robot.get_velocity_tuple(),
+                target_position,
+                obstacles,
+                FieldUtils.get_goal_obstacle_grid(configuration.influence_radius),
+                configuration)
+
+        lookup_table = _get_lookup_table(configuration)
+
+        if lookup_table is None:
+            return get_univector_field_point_theta(
+                robot.get_position_tuple(),
+                robot.get_velocity_tuple(),
+                target_position,
+                obstacles,
+                configuration)
+
+        obstacle_positions, obstacle_velocities = obstacles_to_arrays(obstacles)
+
+        return float(get_univector_field_points_theta(
+            robot.get_position_tuple(),
+            robot.get_velocity_tuple(),
+            target_position,
+            obstacle_positions,
+            obstacle_velocities,
+            configuration,
+            lookup_table)[0])
+
     @staticmethod
     def go_to_point(
         robot: Robot, 
@@ -156,18 +203,63 @@ class MotionUtils:
             else:
                 return MotionUtils.spin_to_theta(robot, desired_theta, base_speed)
 
-        theta = get_univector_field_point_theta(
-            robot.get_position_tuple(),
-            robot.get_velocity_tuple(),
+        theta = MotionUtils.get_univector_field_theta(
+            robot,
             target_position,
-            obstacles
-        )
+            obstacles)
 
         return MotionUtils.go_to_point_by_theta(
             robot,
             theta,
             base_speed)
 
+    @staticmethod
+    def go_to_points_univector(
+        robots: 'list[Robot]',
+        target_positions: 'list[tuple[float, float]]',
+        obstacles: 'list[list[Obstacle]]',
+        base_speed: float = BASE_SPEED,
+        desired_theta: float = None
+    ):
+        """
+        Same as go_to_point_univector for several robots, evaluating the
+        field of all of them in a single call.
+        """
+
+        if len(robots) == 0:
+            return []
+
+        if Configuration.univector_field_navigation_multi_obstacle \
+                or len(set(len(item) for item in obstacles)) > 1:
+            return [
+                MotionUtils.go_to_point_univector(robot, target_position, robot_obstacles, base_speed, desired_theta)
+                for robot, target_position, robot_obstacles in zip(robots, target_positions, obstacles)
+            ]
+
+        obstacle_arrays = [obstacles_to_arrays(item) for item in obstacles]
+
+        thetas = get_univector_field_points_theta(
+            [robot.get_position_tuple() for robot in robots],
+            [robot.get_velocity_tuple() for robot in robots],
+            target_positions,
+            np.stack([item[0] for item in obstacle_arrays]),
+            np.stack([item[1] for item in obstacle_arrays]),
+            lookup_table=_get_lookup_table(default_configuration))
+
+        speeds = []
+
+        for robot, target_position, theta in zip(robots, target_positions, thetas):
+            if _is_close(robot, target_position):
+                if desired_theta is None:
+                    speeds.append((0, 0))
+                else:
+                    speeds.append(MotionUtils.spin_to_theta(robot, desired_theta, base_speed))
+                continue
+
+            speeds.append(MotionUtils.go_to_point_by_theta(robot, float(theta), base_speed))
+
+        return speeds
+
     @staticmethod
     def _get_speeds(
         motor_speed: float,
@@ -1,5 +1,3 @@
-import json
-from google.protobuf.json_format import MessageToJson
 from communication.protobuf.referee import vssref_common_pb2
 from lib.domain.enums.foul_enum import FoulEnum
 from lib.domain.enums.half_enum import HalfEnum
@@ -8,24 +6,23 @@ from lib.domain.referee_message import RefereeMessage
 class RefereeUtils:
     @staticmethod
     def set_referee_message(referee_message: RefereeMessage, packet):
-        referee_data: dict = json.loads(MessageToJson(packet))
-        foul = referee_data.get('foul', None)
-        team_color = referee_data.get('teamcolor', None)
-        foul_quadrant = referee_data.get('foulquadrant', None)
-        timestamp = referee_data.get('timestamp', None)
-        game_half = referee_data.get('gameHalf', None)
+        # zero is the proto3 default value, which was absent from the JSON
+        # the message used to be decoded from and therefore read as None.
+        # The foul and the team color are always sent, and zero is a valid
+        # value for both (FREE_KICK and BLUE), so they are read as they are
+        def get_value(value):
+            return None if value == 0 else value
 
-        referee_message.foul_enum = RefereeUtils.get_fould_enum(foul)
-        referee_message.is_yellow_team = RefereeUtils.get_is_yellow_team(team_color)
+        foul_quadrant = get_value(packet.foulQuadrant)
+        timestamp = get_value(packet.timestamp)
+        game_half = get_value(packet.gameHalf)
+
+        referee_message.foul_enum = FoulEnum(packet.foul)
+        referee_message.is_yellow_team = RefereeUtils.get_is_yellow_team(
+            vssref_common_pb2.Color.Name(packet.teamcolor))
         referee_message.foul_quadrant = None if foul_quadrant is None else int(foul_quadrant)
         referee_message.timestamp = None if timestamp is None else float(timestamp)
-        referee_message.game_half_enum = RefereeUtils.get_half_enum(game_half)
-
-    @staticmethod
-    def get_fould_enum(value):
-        if value is None:
-            return None
-        return FoulEnum[value]
+        referee_message.game_half_enum = None if game_half is None else HalfEnum(game_half)
 
     @staticmethod
     def get_is_yellow_team(value):
@@ -39,13 +36,6 @@ class RefereeUtils:
 
         return True
     
-    @staticmethod
-    def get_half_enum(value):
-        if value is None:
-            return None
-
-        return HalfEnum[value]
-    
     @staticmethod
     def get_protobuf_color_enum(is_yellow_team: 'bool | None'):
         if is_yellow_team is None:
@@ -0,0 +1,99 @@
+import time
+import numpy as np
+
+from lib.domain.enums.role_enum import RoleEnum
+from lib.domain.field import Field
+from lib.observation.observation_builder import ObservationBuilder
+from lib.supporter.default_supporter import get_supporter_speeds
+from lib.utils.rsoccer.rsoccer_utils import RSoccerUtils
+
+# roles in the order of the team model actions
+TEAM_ACTION_ROLES = [
+    RoleEnum.ATTACKER,
+    RoleEnum.DEFENDER,
+    RoleEnum.GOALKEEPER,
+    RoleEnum.SUPPORTER
+]
+
+def _get_role_observation(
+    observation_builder: ObservationBuilder,
+    role_enum: RoleEnum,
+    robot_id: int
+):
+    if role_enum == RoleEnum.ATTACKER:
+        return observation_builder.get_attacker_observation(robot_id, False, True)
+    elif role_enum == RoleEnum.DEFENDER:
+        return observation_builder.get_defender_observation(robot_id, False, True)
+    return observation_builder.get_goalkeeper_observation(robot_id, False, True)
+
+class FusedRoleUtils:
+    @staticmethod
+    def get_roles_by_team_actions(actions: np.ndarray):
+        return [TEAM_ACTION_ROLES[min(int(action), 3)] for action in actions]
+
+    @staticmethod
+    def get_team_roles_by_fields(
+        fields: 'list[Field]',
+        model,
+        start_time: float,
+        deterministic: bool = True
+    ):
+        if len(fields) == 0:
+            return []
+
+        observation_builder = ObservationBuilder.get_configuration_builder()
+        time_factor = ((time.time() - start_time) % 40) / 40
+
+        observations = []
+
+        for field in fields:
+            observation_builder.set_field(field)
+            observations.append(
+                observation_builder.get_team_observation(time_factor, False, True).copy())
+
+        actions, _ = model.predict(np.stack(observations), deterministic=deterministic)
+
+        return [
+            FusedRoleUtils.get_roles_by_team_actions(item)
+            for item in actions
+        ]
+
+    @staticmethod
+    def get_speeds_by_fields(
+        fields: 'list[Field]',
+        roles: 'list[list[RoleEnum]]',
+        models: 'dict[RoleEnum, object]',
+        deterministic: bool = True
+    ):
+        """
+        Returns the wheel speeds of every robot of every field. The
+        observations of all robots playing the same role are stacked and
+        their model is called once.
+        """
+
+        observation_builder = ObservationBuilder.get_configuration_builder()
+
+        speeds = [[(0, 0)] * len(item) for item in roles]
+        observations: 'dict[RoleEnum, list[np.ndarray]]' = {}
+        owners: 'dict[RoleEnum, list[tuple[int, int]]]' = {}
+
+        for field_index, field in enumerate(fields):
+            observation_builder.set_field(field)
+
+            for robot_id, role_enum in enumerate(roles[field_index]):
+                if role_enum == RoleEnum.SUPPORTER:
+                    speeds[field_index][robot_id] = get_supporter_speeds(robot_id, field)
+                    continue
+
+                observation = _get_role_observation(observation_builder, role_enum, robot_id)
+
+                observations.setdefault(role_enum, []).append(observation.copy())
+                owners.setdefault(role_enum, []).append((field_index, robot_id))
+
+        for role_enum, items in observations.items():
+            actions, _ = models[role_enum].predict(np.stack(items), deterministic=deterministic)
+
+            for (field_index, robot_id), action in zip(owners[role_enum], actions):
+                speeds[field_index][robot_id] = RSoccerUtils.actions_to_v_wheels(action)
+
+        return speeds
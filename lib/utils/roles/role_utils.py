@@ -1,13 +1,16 @@
+from typing import TYPE_CHECKING
 from lib.domain.enums.role_enum import RoleEnum
-from lib.environment.base_environment import BaseEnvironment
 from lib.utils.roles.attacker_utils import AttackerUtils
 from lib.utils.roles.defender_utils import DefenderUtils
 from lib.utils.roles.goalkeeper_utils import GoalkeeperUtils
 
+if TYPE_CHECKING:
+    from lib.environment.base_environment import BaseEnvironment
+
 class RoleUtils:    
     @staticmethod
     def get_speeds(
-        environment: BaseEnvironment,
+        environment: 'BaseEnvironment',
         role_enum: RoleEnum,
         robot_id: int,
         is_yellow: bool,
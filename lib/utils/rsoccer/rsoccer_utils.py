@@ -1,15 +1,21 @@
+from typing import TYPE_CHECKING
 from configuration.configuration import Configuration
+from lib.domain.array_frame import ArrayFrame, X, Y, THETA, V_X, V_Y, V_THETA
 from lib.domain.field import Field
 from lib.domain.robot import Robot
 from lib.domain.ball import Ball
 from lib.utils.domain_utils import DomainUtils
 from lib.utils.field_utils import FieldUtils
 from lib.utils.geometry_utils import GeometryUtils
-from rsoccer_gym.Entities import Robot as RSoccerRobot, Ball as RSoccerBall
-from rsoccer_gym.Entities.Frame import Frame
 import numpy as np
 
-def _is_inside_field(robot: RSoccerRobot):
+# rsoccer_gym is imported where its entities are created, so that the
+# control process, which only converts actions, starts without it
+if TYPE_CHECKING:
+    from rsoccer_gym.Entities import Robot as RSoccerRobot, Ball as RSoccerBall
+    from rsoccer_gym.Entities.Frame import Frame
+
+def _is_inside_field(robot: 'RSoccerRobot'):
     return FieldUtils.is_inside_field(
         robot.x,
         robot.y,
@@ -27,7 +33,7 @@ class RSoccerUtils:
 
     @staticmethod
     def to_robot(
-        rsoccer_robot: RSoccerRobot,
+        rsoccer_robot: 'RSoccerRobot',
         active: bool = True
     ):
         robot = Robot(rsoccer_robot.id, active)
@@ -45,7 +51,7 @@ class RSoccerUtils:
     @staticmethod
     def set_robot(
         robot: Robot,
-        rsoccer_robot: RSoccerRobot
+        rsoccer_robot: 'RSoccerRobot'
     ):
         robot.active = _is_inside_field(rsoccer_robot)
 
@@ -60,7 +66,7 @@ class RSoccerUtils:
         return robot
 
     @staticmethod
-    def to_ball(rsoccer_ball: RSoccerBall):
+    def to_ball(rsoccer_ball: 'RSoccerBall'):
         ball = Ball()
 
         ball.position.x = rsoccer_ball.x
@@ -71,7 +77,7 @@ class RSoccerUtils:
         return ball
     
     @staticmethod
-    def set_ball(ball: Ball, rsoccer_ball: RSoccerBall):
+    def set_ball(ball: Ball, rsoccer_ball: 'RSoccerBall'):
         ball.position.x = rsoccer_ball.x
         ball.position.y = rsoccer_ball.y
         ball.velocity.x = rsoccer_ball.v_x
@@ -82,7 +88,7 @@ class RSoccerUtils:
     @staticmethod
     def set_field_by_frame(
         field: Field,
-        frame: Frame,
+        frame: 'Frame',
         is_yellow_team: bool
     ):
         RSoccerUtils.set_ball(field.ball, frame.ball)
@@ -105,7 +111,55 @@ class RSoccerUtils:
         return field
     
     @staticmethod
-    def _get_rendering_frame_by_frame(frame: Frame):
+    def set_field_by_array_frame(
+        field: Field,
+        frame: ArrayFrame,
+        is_yellow_team: bool
+    ):
+        RSoccerUtils.set_ball(field.ball, frame.ball)
+
+        robots = frame.robots
+        values = robots.tolist()
+
+        thetas = GeometryUtils.normalize_array_in_pi(np.deg2rad(robots[:, THETA])).tolist()
+        v_thetas = GeometryUtils.normalize_array_in_pi(np.deg2rad(robots[:, V_THETA])).tolist()
+
+        actives = FieldUtils.are_inside_field(
+            robots[:, X],
+            robots[:, Y],
+            Configuration.field_length,
+            Configuration.field_width,
+            Configuration.field_goal_width,
+            Configuration.field_goal_depth).tolist()
+
+        def set_robots(field_robots: 'dict[int, Robot]', start: int, count: int):
+            for i in range(count):
+                index = start + i
+                robot = field_robots[i]
+                row = values[index]
+
+                robot.active = actives[index]
+
+                robot.position.x = row[X]
+                robot.position.y = row[Y]
+                robot.position.theta = thetas[index]
+
+                robot.velocity.x = row[V_X]
+                robot.velocity.y = row[V_Y]
+                robot.velocity.theta = v_thetas[index]
+
+        blue = (0, frame.n_robots_blue)
+        yellow = (frame.n_robots_blue, frame.n_robots_yellow)
+
+        set_robots(field._robots, *(yellow if is_yellow_team else blue))
+        set_robots(field._foes, *(blue if is_yellow_team else yellow))
+
+        return field
+
+    @staticmethod
+    def _get_rendering_frame_by_frame(frame: 'Frame'):
+        from rsoccer_gym.Entities.Frame import Frame
+
         rendering_frame = Frame()
 
         def get_robot(source_robot):
@@ -129,31 +183,9 @@ class RSoccerUtils:
         return rendering_frame
     
     @staticmethod
-    def _get_frame_by_rendering_frame(rendering_frame: Frame):
-        frame = Frame()
-
-        def get_robot(source_robot):
-            return RSoccerUtils._get_robot_inverted_y_axis(source_robot)
-        
-        def get_ball():
-            return RSoccerUtils._get_ball_inverted_y_axis(rendering_frame)
+    def _get_robot_inverted_y_axis(source_robot: 'RSoccerRobot'):
+        from rsoccer_gym.Entities import Robot as RSoccerRobot
 
-        for item in rendering_frame.robots_blue:
-            frame.robots_blue[item] = get_robot(
-                rendering_frame.robots_blue[item]
-            )
-
-        for item in rendering_frame.robots_yellow:
-            frame.robots_yellow[item] = get_robot(
-                rendering_frame.robots_yellow[item]
-            )
-
-        frame.ball = get_ball()
-
-        return frame
-    
-    @staticmethod
-    def _get_robot_inverted_y_axis(source_robot: RSoccerRobot):
         robot = RSoccerRobot()
         DomainUtils.copy(source_robot, robot)
         robot.y = -robot.y
@@ -162,7 +194,9 @@ class RSoccerUtils:
         return robot
 
     @staticmethod 
-    def _get_ball_inverted_y_axis(frame: Frame):
+    def _get_ball_inverted_y_axis(frame: 'Frame'):
+        from rsoccer_gym.Entities import Ball as RSoccerBall
+
         source_ball = frame.ball
         ball = RSoccerBall()
         DomainUtils.copy(source_ball, ball)
@@ -188,7 +222,7 @@ class RSoccerUtils:
         return -x, -y
     
     @staticmethod
-    def get_norm_theta_by_rsoccer_robot(robot: RSoccerRobot, is_left_team: bool):
+    def get_norm_theta_by_rsoccer_robot(robot: 'RSoccerRobot', is_left_team: bool):
         if is_left_team:
             return RSoccerUtils.get_corrected_angle(robot.theta) / np.pi
         
@@ -1,12 +1,20 @@
+import asyncio
+import atexit
+import os
 import threading
-from communication.receiver.firasim_receiver import FirasimReceiver
+from communication.receiver.firasim_receiver import FirasimTeamsReceiver
+from communication.recording.datagram_log import REFEREE_CHANNEL, VISION_CHANNEL, DatagramLogReader, DatagramLogWriter
+from communication.recording.datagram_replay import STEPPED_MODE, DatagramReplay
 from communication.referee.referee import Referee
 from communication.replacer.replacer import Replacer
 from communication.sender.firasim_sender import FirasimSender
+from communication.transport.async_communication import AsyncCommunication
 from configuration.configuration import Configuration
+from lib.control.frame_scheduler import AsyncFrameScheduler, FrameScheduler
 from lib.command.robot_command import RobotCommand
 from lib.command.team_command import TeamCommand
 from lib.domain.enums.foul_enum import FoulEnum
+from lib.domain.enums.role_enum import RoleEnum
 from lib.domain.field import Field
 from lib.domain.referee_message import RefereeMessage
 from lib.domain.robot import Robot
@@ -18,6 +26,7 @@ from lib.utils.model_utils import ModelUtils
 from lib.utils.motion_utils import MotionUtils
 from lib.utils.roles.attacker_utils import AttackerUtils
 from lib.utils.roles.defender_utils import DefenderUtils
+from lib.utils.roles.fused_role_utils import FusedRoleUtils
 from lib.utils.roles.goalkeeper_utils import GoalkeeperUtils
 from lib.utils.game_state_machine_utils import GameStateMachineUtils
 import time
@@ -128,6 +137,41 @@ def normal_play(
     else:
         return team_without_coordination_normal_play(field)
 
+def fused_normal_play(teams: 'list[tuple[bool, Field]]'):
+    coordinated_fields = [
+        field
+        for is_yellow_team, field in teams
+        if Configuration.firasim_team_is_yellow_team == is_yellow_team
+    ]
+
+    coordinated_roles = iter(FusedRoleUtils.get_team_roles_by_fields(
+        coordinated_fields,
+        team_model,
+        start_time
+    ))
+
+    roles = [
+        next(coordinated_roles)
+        if Configuration.firasim_team_is_yellow_team == is_yellow_team
+        else [RoleEnum.ATTACKER, RoleEnum.DEFENDER, RoleEnum.GOALKEEPER]
+        for is_yellow_team, _ in teams
+    ]
+
+    speeds = FusedRoleUtils.get_speeds_by_fields(
+        [field for _, field in teams],
+        roles,
+        {
+            RoleEnum.ATTACKER: attacker_model,
+            RoleEnum.DEFENDER: defender_model,
+            RoleEnum.GOALKEEPER: goalkeeper_model
+        }
+    )
+
+    return [
+        [RobotCommand(left_speed, right_speed) for left_speed, right_speed in item]
+        for item in speeds
+    ]
+
 def stopped_play():
     return [RobotCommand(0, 0) for _ in range(3)]
 
@@ -156,7 +200,9 @@ def positioning(
     positionings: dict,
     field: Field
 ):
-    robot_commands = []
+    robots = []
+    target_positions = []
+    obstacles = []
 
     for item in positionings:
         if item == "ball":
@@ -165,17 +211,24 @@ def positioning(
         robot = field.get_robot_by_id(int(item))
 
         if robot.active:
-            pid_error_key_team = str(is_yellow_team)
-            robot_command, pid_errors[pid_error_key_team][item] = go_to_point_command(
-                robot,
-                field,
-                (positionings[item]["x"], positionings[item]["y"]),
-                pid_errors[pid_error_key_team][item]
-            )
+            robots.append(robot)
+            target_positions.append((positionings[item]["x"], positionings[item]["y"]))
+            obstacles.append(FieldUtils.to_obstacles_except_current_robot(field, robot.id))
 
-            robot_commands.append(robot_command)
+            # the univector field does not use the pid error
+            pid_errors[str(is_yellow_team)][item] = 0
 
-    return robot_commands
+    speeds = MotionUtils.go_to_points_univector(
+        robots,
+        target_positions,
+        obstacles,
+        desired_theta=0
+    )
+
+    return [
+        RobotCommand(left_speed, right_speed)
+        for left_speed, right_speed in speeds
+    ]
 
 def perform(
     is_yellow_team: bool,
@@ -184,8 +237,57 @@ def perform(
     machine: GameStateMachine
 ):
     machine.set_state_by_referee_message(message)
-    state = machine.get_state()
-    
+
+    return perform_by_state(
+        is_yellow_team,
+        field,
+        machine.get_state()
+    )
+
+def perform_teams(
+    teams: 'list[tuple[bool, Field, GameStateMachine]]',
+    message: RefereeMessage
+):
+    team_commands = [None] * len(teams)
+    game_on_indexes = []
+
+    for i, (is_yellow_team, field, machine) in enumerate(teams):
+        machine.set_state_by_referee_message(message)
+        state = machine.get_state()
+
+        if state == GameStateMachineUtils.get_state_name(FoulEnum.GAME_ON, None, is_yellow_team):
+            game_on_indexes.append(i)
+        else:
+            team_commands[i] = perform_by_state(is_yellow_team, field, state)
+
+    if len(game_on_indexes) == 0:
+        return team_commands
+
+    # the teams in game are decided together, batching the model calls
+    commands = fused_normal_play([teams[i][:2] for i in game_on_indexes])
+
+    for i, item in zip(game_on_indexes, commands):
+        team_commands[i] = to_team_command(teams[i][0], item)
+
+    return team_commands
+
+def to_team_command(
+    is_yellow_team: bool,
+    commands: 'list[RobotCommand] | None'
+):
+    if commands is None:
+        return None
+
+    command = TeamCommand(is_yellow_team)
+    command.commands = commands
+
+    return command
+
+def perform_by_state(
+    is_yellow_team: bool,
+    field: Field,
+    state: str
+):
     def get_state_name(
         foul_enum: FoulEnum,
         is_yellow: 'bool | None' = None
@@ -223,13 +325,7 @@ def perform(
     else:
         commands = halt()
 
-    if commands is None:
-        return None
-
-    command = TeamCommand(is_yellow_team)
-    command.commands = commands
-
-    return command
+    return to_team_command(is_yellow_team, commands)
 
 def free_kick_team(
     is_yellow_team: bool,
@@ -351,42 +447,94 @@ goalkeeper_model = ModelUtils.goalkeeper_model()
 team_model = ModelUtils.team_model()
 
 blue_field = Field()
-blue_receiver = FirasimReceiver(False, blue_field)
 yellow_field = Field()
-yellow_receiver = FirasimReceiver(True, yellow_field)
 
 blue_machine = GameStateMachine(False)
 yellow_machine = GameStateMachine(True)
 
 referee_message = RefereeMessage()
 
-referee = Referee(referee_message)
-sender = FirasimSender()
-replacer = Replacer()
+# created by create_communication, so that importing this module (as the
+# decision benchmark does) opens no sockets
+vision_receiver: 'FirasimTeamsReceiver | None' = None
+referee: 'Referee | None' = None
+sender: 'FirasimSender | None' = None
+replacer: 'Replacer | None' = None
+replay: 'DatagramReplay | None' = None
+
+frame_scheduler = FrameScheduler(Configuration.control_rate)
+
+def create_communication():
+    global vision_receiver, referee, sender, replacer, replay
+
+    vision_source = None
+    referee_source = None
+
+    if Configuration.replay_path is not None:
+        replay = DatagramReplay(
+            DatagramLogReader(Configuration.replay_path),
+            Configuration.replay_mode,
+            Configuration.replay_speed)
+
+        vision_source = replay.get_channel(VISION_CHANNEL)
+        referee_source = replay.get_channel(REFEREE_CHANNEL)
+
+        # a stepped replay hands out one vision frame per decision
+        if replay.mode == STEPPED_MODE:
+            replay.step()
+
+    vision_receiver = FirasimTeamsReceiver(blue_field, yellow_field, vision_source)
+    referee = Referee(referee_message, referee_source)
+    sender = FirasimSender()
+    replacer = Replacer()
+
+    if Configuration.recording_enabled:
+        recorder = DatagramLogWriter(os.path.join(
+            Configuration.recording_directory,
+            f"datagrams_{time.strftime('%Y_%m_%d_%H_%M_%S')}.log"))
+
+        atexit.register(recorder.close)
+
+        vision_receiver.set_recorder(recorder, VISION_CHANNEL)
+        referee.set_recorder(recorder, REFEREE_CHANNEL)
+
+# set when the replay reaches the end of its log
+stop_event = threading.Event()
 
 def update():
     while True:
-        referee.update()
-        blue_receiver.update()
-        yellow_receiver.update()
+        try:
+            referee.update()
+            has_new_frame = vision_receiver.update()
+        except EOFError:
+            stop_event.set()
+            # wakes the control loop up so that it sees the stop
+            frame_scheduler.notify_frame()
+            return
+
+        if has_new_frame:
+            frame_scheduler.notify_frame()
+        elif replay is not None and replay.mode == STEPPED_MODE:
+            # a repeated frame makes no decision, so it does not use up the step
+            replay.step()
 
 update_thread = threading.Thread(target=update)
 
+teams = [
+    (False, blue_field, blue_machine),
+    (True, yellow_field, yellow_machine)
+]
+
 def main():
+    create_communication()
     update_thread.start()
-    while True:
-        blue_command = perform(
-            False,
-            blue_field,
-            referee_message,
-            blue_machine
-        )
+    while not stop_event.is_set():
+        if not frame_scheduler.wait_for_frame(frame_scheduler.get_timeout()):
+            continue
 
-        yellow_command = perform(
-            True,
-            yellow_field,
-            referee_message,
-            yellow_machine
+        blue_command, yellow_command = perform_teams(
+            teams,
+            referee_message
         )
 
         if blue_command is not None:
@@ -395,5 +543,44 @@ def main():
         if yellow_command is not None:
             sender.transmit_team(yellow_command)
 
+        if replay is not None and replay.mode == STEPPED_MODE:
+            replay.step()
+
+async def async_main():
+    async_frame_scheduler = AsyncFrameScheduler(Configuration.control_rate)
+
+    create_communication()
+
+    communication = AsyncCommunication(
+        [vision_receiver],
+        referee,
+        [sender, replacer],
+        async_frame_scheduler
+    )
+
+    await communication.start()
+
+    try:
+        while True:
+            if not await async_frame_scheduler.wait_for_frame(async_frame_scheduler.get_timeout()):
+                continue
+
+            blue_command, yellow_command = perform_teams(
+                teams,
+                referee_message
+            )
+
+            if blue_command is not None:
+                sender.transmit_team(blue_command)
+
+            if yellow_command is not None:
+                sender.transmit_team(yellow_command)
+    finally:
+        communication.close()
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    # a replay has no sockets to hand over to the event loop
+    if Configuration.control_asyncio and Configuration.replay_path is None:
+        asyncio.run(async_main())
+    else:
+        main()
\ No newline at end of file
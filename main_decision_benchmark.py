@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import numpy as np
+
+import main
+from communication.sender.firasim_sender import FirasimSender
+from lib.benchmark.decision_benchmark import get_latency_distributions, get_random_field_pair, get_referee_messages, run_decision_benchmark
+from lib.benchmark.report import get_metadata, save_report
+
+seed = 0
+
+# synthetic blue and yellow field pairs fed through perform_teams for every referee message
+fields_count = 200
+
+output_path = f"benchmarks/decision_benchmark_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
+
+def main_benchmark():
+    random = np.random.default_rng(seed)
+    field_pairs = [get_random_field_pair(random) for _ in range(fields_count)]
+
+    latencies = run_decision_benchmark(
+        main.perform_teams,
+        FirasimSender._fill_team_command_packet,
+        field_pairs,
+        get_referee_messages())
+
+    distributions = get_latency_distributions(latencies)
+
+    for key, parts in distributions.items():
+        total = parts["total"]
+        print(f"{key}: p50 {total['p50_ms']:.3f} ms, p99 {total['p99_ms']:.3f} ms, max {total['max_ms']:.3f} ms")
+
+    report = {
+        "metadata": get_metadata(fields=fields_count, seed=seed),
+        "results": distributions
+    }
+
+    save_report(report, output_path)
+    print(f"Report saved to {output_path}")
+
+if __name__ == '__main__':
+    main_benchmark()
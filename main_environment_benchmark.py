@@ -0,0 +1,92 @@
+import re
+from datetime import datetime
+
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+
+from lib.benchmark.environment_benchmark import run_single_env_benchmark, run_vec_env_benchmark
+from lib.benchmark.report import get_metadata, save_report
+from lib.environment.attacker_environment import AttackerEnvironment
+from lib.environment.defender_environment import DefenderEnvironment
+from lib.environment.goalkeeper_environment import GoalkeeperEnvironment
+from lib.environment.shared_memory_vec_env import SharedMemoryVecEnv
+from lib.environment.team_environment import TeamEnvironment
+from lib.utils.behavior.attacker_behavior_utils import AttackerBehaviorUtils
+from lib.utils.behavior.defender_behavior_utils import DefenderBehaviorUtils
+from lib.utils.behavior.goalkeeper_behavior_utils import GoalkeeperBehaviorUtils
+from lib.utils.behavior.team_behavior_utils import TeamBehaviorUtils
+
+render_mode = "rgb_array"
+
+seed = 0
+
+# environment steps of each run, split among num_envs in the VecEnv runs
+steps_count = 2000
+
+num_envs = 4
+
+vec_env_classes = [
+    DummyVecEnv,
+    SubprocVecEnv,
+    SharedMemoryVecEnv
+]
+
+environments = [
+    ("attacker", AttackerEnvironment, AttackerBehaviorUtils),
+    ("defender", DefenderEnvironment, DefenderBehaviorUtils),
+    ("goalkeeper", GoalkeeperEnvironment, GoalkeeperBehaviorUtils),
+    ("team", TeamEnvironment, TeamBehaviorUtils)
+]
+
+output_path = f"benchmarks/environment_benchmark_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
+
+def get_task_functions(behavior_utils_class):
+    task_functions = []
+
+    for name in dir(behavior_utils_class):
+        match = re.fullmatch(r"get_task_(\d+)", name)
+
+        if match is not None:
+            task_functions.append((int(match.group(1)), getattr(behavior_utils_class, name)))
+
+    return sorted(task_functions)
+
+def create_env(environment_class, task_function):
+    def _init():
+        return environment_class(task_function(), render_mode)
+    return _init
+
+def main():
+    results = []
+
+    for role, environment_class, behavior_utils_class in environments:
+        for task_number, task_function in get_task_functions(behavior_utils_class):
+            env_fn = create_env(environment_class, task_function)
+
+            runs = [lambda: run_single_env_benchmark(env_fn, steps_count, seed)]
+
+            for vec_env_class in vec_env_classes:
+                runs.append(lambda vec_env_class=vec_env_class: run_vec_env_benchmark(
+                    vec_env_class,
+                    [env_fn] * num_envs,
+                    steps_count // num_envs,
+                    seed))
+
+            for run in runs:
+                result = {"role": role, "task": task_number, **run()}
+                results.append(result)
+
+                print(
+                    f"{role} task {task_number} {result['configuration']}: "
+                    f"{result['steps_per_second']:.0f} steps/s, "
+                    f"p50 {result['p50_ms']:.3f} ms, p99 {result['p99_ms']:.3f} ms")
+
+    report = {
+        "metadata": get_metadata(steps=steps_count, num_envs=num_envs, seed=seed),
+        "results": results
+    }
+
+    save_report(report, output_path)
+    print(f"Report saved to {output_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+from configuration.configuration import Configuration
+from lib.inference.numpy_policy_exporter import export_numpy_policy
+
+model_paths = [
+    Configuration.model_attacker_path,
+    Configuration.model_defender_path,
+    Configuration.model_goalkeeper_path,
+    Configuration.model_team_path
+]
+
+def main():
+    for model_path in model_paths:
+        output_path = export_numpy_policy(model_path)
+        print(f"{model_path} -> {output_path}")
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,16 @@ from stable_baselines3.common.vec_env import SubprocVecEnv
 from stable_baselines3.common.monitor import Monitor
 
 from lib.curriculum.behavior_callback import BehaviorCallback
+from lib.environment.shared_memory_vec_env import SharedMemoryVecEnv
+from lib.inference.inference_client import InferenceClient
+from lib.inference.inference_server import InferenceServer
 from lib.environment.goalkeeper_environment import GoalkeeperEnvironment
+from lib.utils.model_utils import ModelUtils
 from lib.utils.behavior.goalkeeper_behavior_utils import GoalkeeperBehaviorUtils
 
 import os
+import shutil
+import tempfile
 from datetime import datetime
 
 task_training_name = "goalkeeper"
@@ -16,6 +22,9 @@ render_mode = "rgb_array"
 
 num_threads = 14
 
+# number of environments; with the shared memory VecEnv they are split among num_threads processes
+num_envs = num_threads
+
 total_timesteps = 400_000_000
 
 gae_lambda = 0.95
@@ -27,6 +36,15 @@ batch_size = 128
 
 device = "cpu"
 
+# runs the opponent models of all environments in batched forward passes
+use_inference_server = False
+
+# maps the model weights from memory-mapped files instead of loading them in every environment
+use_shared_models = False
+
+# exchanges the observations, actions, rewards and dones through shared memory instead of pipes
+use_shared_memory_vec_env = False
+
 load_model = True
 loaded_model_path = "models/goalkeeper/PPO/2025_1_25_0_22_2/PPO_model_task_1_update_100_32250806_steps.zip"
 
@@ -38,9 +56,16 @@ log_interval = total_timesteps // 10
 def create_env(
     save_path,
     index,
-    first_task_function
+    first_task_function,
+    inference_client_arguments = None,
+    shared_directory = None
 ):
     def _init():
+        if inference_client_arguments is not None:
+            ModelUtils.set_inference_client(InferenceClient(*inference_client_arguments))
+
+        ModelUtils.set_shared_directory(shared_directory)
+
         env = GoalkeeperEnvironment(first_task_function(), render_mode)
         return Monitor(env, f"{save_path}/monitor_log/env_{index}")
     return _init
@@ -65,6 +90,12 @@ def get_task_models_path():
     return f"models/{task_training_name}/{algorithm_name}/{get_datetime_folder_name()}"
 
 def main():
+    shared_directory = None
+
+    if use_shared_models:
+        shared_directory = tempfile.mkdtemp(prefix="shared_models_")
+        ModelUtils.set_shared_directory(shared_directory)
+
     get_first_task = lambda: GoalkeeperBehaviorUtils.get_task_1(starting_update)
 
     tasks = [
@@ -75,14 +106,26 @@ def main():
 
     create_folder_if_not_exists(save_path)
 
-    env = SubprocVecEnv([
+    inference_client_arguments = None
+
+    if use_inference_server:
+        inference_client_arguments = InferenceServer().start().get_client_arguments()
+
+    env_fns = [
         create_env(
             save_path,
             i,
-            get_first_task
+            get_first_task,
+            inference_client_arguments,
+            shared_directory
         )
-        for i in range(num_threads)
-    ])
+        for i in range(num_envs)
+    ]
+
+    if use_shared_memory_vec_env:
+        env = SharedMemoryVecEnv(env_fns, n_workers=num_threads)
+    else:
+        env = SubprocVecEnv(env_fns)
 
     model = PPO(
         policy=policy,
@@ -103,7 +146,8 @@ def main():
         model_name=algorithm_name,
         save_path=save_path,
         log_path=save_path,
-        tasks=tasks)
+        tasks=tasks,
+        shared_directory=shared_directory)
     
     try:
         model.learn(
@@ -114,6 +158,12 @@ def main():
     except:
         if int(input("Save current model: 1 - Yes, 2 - No")) == 1:
             model.save(f"{save_path}/interrupted_model")
+    finally:
+        # closes the environments, which flushes their trajectory recorders
+        env.close()
+
+        if shared_directory is not None:
+            shutil.rmtree(shared_directory, ignore_errors=True)
     
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+
+from lib.benchmark.decision_benchmark import get_latency_distributions, get_random_field_pair, get_referee_messages, run_decision_benchmark
+from lib.command.robot_command import RobotCommand
+from lib.command.team_command import TeamCommand
+
+def _perform_teams(teams, message):
+    team_commands = []
+
+    for is_yellow_team, field, machine in teams:
+        machine.set_state_by_referee_message(message)
+
+        if machine.get_state() == "halt":
+            team_commands.append(None)
+            continue
+
+        command = TeamCommand(is_yellow_team)
+        command.commands = [RobotCommand(field.ball.position.x, 0) for _ in range(3)]
+        team_commands.append(command)
+
+    return team_commands
+
+class TestDecisionBenchmark(unittest.TestCase):
+    def test_run_decision_benchmark(self):
+        random = np.random.default_rng(0)
+        field_pairs = [get_random_field_pair(random) for _ in range(5)]
+        filled_commands = []
+
+        latencies = run_decision_benchmark(
+            _perform_teams,
+            filled_commands.append,
+            field_pairs,
+            get_referee_messages(),
+            warmup_count=1)
+
+        self.assertIn("blue.free_kick_team", latencies)
+        self.assertIn("yellow.free_kick_foe_team", latencies)
+        self.assertIn("blue.game_on", latencies)
+
+        # each team gets every team foul once for it and once for the foe
+        self.assertEqual(len(latencies["blue.free_kick_team"]["total"]), 4)
+        self.assertEqual(len(latencies["yellow.halt"]["total"]), 4)
+
+        # the halt commands are None and are not filled
+        self.assertEqual(len(filled_commands), (len(get_referee_messages()) - 1) * 2 * 5)
+
+        distributions = get_latency_distributions(latencies)
+
+        for parts in distributions.values():
+            self.assertEqual(parts.keys(), {"perform", "fill_packet", "total"})
+            self.assertLessEqual(parts["total"]["p50_ms"], parts["total"]["max_ms"])
+
+    def test_random_field_pair(self):
+        blue_field, yellow_field = get_random_field_pair(np.random.default_rng(0))
+
+        # the teams play on opposite sides, so each sees the other mirrored
+        for i in range(3):
+            blue_robot = blue_field.get_robot_by_id(i)
+            yellow_foe = yellow_field.get_foe_by_id(i)
+
+            self.assertAlmostEqual(yellow_foe.position.x, -blue_robot.position.x)
+            self.assertAlmostEqual(yellow_foe.position.y, -blue_robot.position.y)
+            self.assertAlmostEqual(yellow_foe.velocity.x, -blue_robot.velocity.x)
+
+        self.assertAlmostEqual(yellow_field.ball.position.x, -blue_field.ball.position.x)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import unittest
+import gymnasium as gym
+import numpy as np
+from gymnasium.spaces import Box
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+
+from lib.benchmark.environment_benchmark import run_single_env_benchmark, run_vec_env_benchmark
+
+class _Environment(gym.Env):
+    def __init__(self):
+        self.observation_space = Box(low=-1, high=1, shape=(3,), dtype=np.float32)
+        self.action_space = Box(low=-1, high=1, shape=(2,), dtype=np.float32)
+        self.steps = 0
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed, options=options)
+        self.steps = 0
+        return np.zeros(3, dtype=np.float32), {}
+
+    def step(self, action):
+        self.steps += 1
+        return np.zeros(3, dtype=np.float32), 0.0, self.steps == 10, False, {}
+
+class TestEnvironmentBenchmark(unittest.TestCase):
+    def test_single_env_benchmark(self):
+        result = run_single_env_benchmark(_Environment, 50, warmup_steps_count=5)
+
+        self.assertEqual(result["steps"], 50)
+        self.assertEqual(result["episodes"], 5)
+        self.assertGreater(result["steps_per_second"], 0)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+    def test_vec_env_benchmark(self):
+        result = run_vec_env_benchmark(DummyVecEnv, [_Environment] * 2, 20, warmup_steps_count=0)
+
+        self.assertEqual(result["configuration"], "DummyVecEnv")
+        self.assertEqual(result["steps"], 40)
+        self.assertEqual(result["episodes"], 4)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "reads /proc")
+    def test_memory_of_a_run(self):
+        result = run_vec_env_benchmark(SubprocVecEnv, [_Environment] * 2, 5, warmup_steps_count=0)
+
+        self.assertGreater(result["rss_mb"], 0)
+        self.assertIsNotNone(result["rss_increase_mb"])
+        self.assertGreater(result["children_rss_mb"], 0)
+
+        result = run_vec_env_benchmark(DummyVecEnv, [_Environment], 5, warmup_steps_count=0)
+
+        self.assertIsNone(result["children_rss_mb"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from lib.benchmark.report import get_metadata, save_report
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class TestReport(unittest.TestCase):
+    def test_save_report(self):
+        report = {"metadata": get_metadata(steps=10, seed=0), "results": []}
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "benchmarks", "report.json")
+            save_report(report, file_path)
+
+            with open(file_path) as file:
+                self.assertEqual(json.load(file), report)
+
+    def test_no_training_imports(self):
+        # the decision benchmark imports the report without the training stack
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, lib.benchmark.report; print(sorted(set(sys.modules) & {'gymnasium', 'stable_baselines3'}))"
+            ],
+            cwd=ROOT_PATH,
+            capture_output=True,
+            text=True,
+            check=True)
+
+        self.assertEqual(output.stdout.strip(), "[]")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from communication.recording.datagram_log import REFEREE_CHANNEL, VISION_CHANNEL, DatagramLogReader, DatagramLogWriter
+from communication.recording.datagram_replay import FAST_MODE, REALTIME_MODE, STEPPED_MODE, DatagramReplay
+
+RECORDS = [
+    (10.0, VISION_CHANNEL, b"v1"),
+    (10.5, REFEREE_CHANNEL, b"r1"),
+    (11.0, VISION_CHANNEL, b"v2"),
+    (12.0, VISION_CHANNEL, b"v3"),
+    (12.5, REFEREE_CHANNEL, b"r2")
+]
+
+class _Clock:
+    def __init__(self):
+        self.time = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.time
+
+    def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.time += delay
+
+class TestDatagramLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "log", "datagrams.log")
+
+        writer = DatagramLogWriter(self.path)
+
+        for timestamp, channel, data in RECORDS:
+            writer.write(channel, data, timestamp)
+
+        writer.close()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_read(self):
+        reader = DatagramLogReader(self.path)
+
+        self.assertEqual([reader.read(i) for i in range(len(reader))], RECORDS)
+        self.assertEqual(reader.get_position_by_time(11.5), 3)
+        self.assertEqual(list(reader.get_channel_positions(REFEREE_CHANNEL)), [1, 4])
+
+        reader.close()
+
+    def test_rebuilds_index_and_drops_cut_record(self):
+        os.remove(self.path + ".idx")
+
+        with open(self.path, "ab") as file:
+            file.write(b"\x00\x01")
+
+        reader = DatagramLogReader(self.path)
+
+        self.assertEqual([reader.read(i) for i in range(len(reader))], RECORDS)
+
+        reader.close()
+
+    def test_fast_replay(self):
+        replay = DatagramReplay(DatagramLogReader(self.path), FAST_MODE)
+        vision = replay.get_channel(VISION_CHANNEL)
+        referee = replay.get_channel(REFEREE_CHANNEL)
+
+        self.assertIsNone(referee.poll())
+        self.assertEqual(vision.receive(), b"v1")
+        self.assertIsNone(referee.poll())
+        self.assertEqual(vision.receive(), b"v2")
+        self.assertEqual(referee.poll(), b"r1")
+        self.assertEqual(vision.receive(), b"v3")
+        self.assertIsNone(referee.poll())
+
+        with self.assertRaises(EOFError):
+            vision.receive()
+
+    def test_realtime_replay(self):
+        clock = _Clock()
+        replay = DatagramReplay(
+            DatagramLogReader(self.path),
+            REALTIME_MODE,
+            speed=2.0,
+            start_time=10.2,
+            clock=clock,
+            sleep=clock.sleep)
+
+        vision = replay.get_channel(VISION_CHANNEL)
+        referee = replay.get_channel(REFEREE_CHANNEL)
+
+        self.assertEqual(referee.poll(), b"r1")
+        self.assertEqual(vision.receive(), b"v2")
+        self.assertEqual(vision.receive(), b"v3")
+
+        # 0.5 s and 1 s of recorded time at twice the speed
+        self.assertEqual(clock.sleeps, [0.25, 0.5])
+
+    def test_stepped_replay(self):
+        replay = DatagramReplay(DatagramLogReader(self.path), STEPPED_MODE)
+        vision = replay.get_channel(VISION_CHANNEL)
+        received = []
+
+        thread = threading.Thread(target=lambda: received.extend([vision.receive(), vision.receive()]))
+        thread.start()
+
+        replay.step(2)
+        thread.join(5)
+
+        self.assertEqual(received, [b"v1", b"v2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import asyncio
+import socket
+import unittest
+
+from communication.transport.datagram_queue_protocol import DatagramQueueProtocol
+
+class TestDatagramQueueProtocol(unittest.TestCase):
+    def test_keeps_most_recent_datagrams(self):
+        async def run():
+            protocol = DatagramQueueProtocol(2)
+
+            for item in [b"1", b"2", b"3"]:
+                protocol.datagram_received(item, None)
+
+            return [protocol.queue.get_nowait(), protocol.queue.get_nowait()], protocol.dropped_count
+
+        datagrams, dropped_count = asyncio.run(run())
+
+        self.assertEqual(datagrams, [b"2", b"3"])
+        self.assertEqual(dropped_count, 1)
+
+    def test_receives_from_socket(self):
+        async def run():
+            receiver_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            receiver_socket.bind(("127.0.0.1", 0))
+
+            loop = asyncio.get_running_loop()
+            transport, protocol = await loop.create_datagram_endpoint(
+                DatagramQueueProtocol,
+                sock=receiver_socket)
+
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender_socket:
+                sender_socket.sendto(b"frame", receiver_socket.getsockname())
+
+            data = await asyncio.wait_for(protocol.queue.get(), 1)
+            transport.close()
+
+            return data
+
+        self.assertEqual(asyncio.run(run()), b"frame")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import threading
+import time
+import unittest
+
+from lib.control.frame_scheduler import FrameScheduler
+
+class TestFrameScheduler(unittest.TestCase):
+    def test_wait_for_frame_without_new_frame(self):
+        scheduler = FrameScheduler()
+
+        self.assertFalse(scheduler.wait_for_frame(timeout=.01))
+
+        scheduler.notify_frame()
+
+        self.assertTrue(scheduler.wait_for_frame(timeout=.01))
+        self.assertFalse(scheduler.wait_for_frame(timeout=.01))
+
+    def test_wait_for_frame_wakes_on_notify(self):
+        scheduler = FrameScheduler()
+        timer = threading.Timer(.05, scheduler.notify_frame)
+        timer.start()
+
+        self.assertTrue(scheduler.wait_for_frame(timeout=1))
+        timer.join()
+
+    def test_fixed_rate(self):
+        scheduler = FrameScheduler(rate=20)
+        start_time = time.perf_counter()
+
+        for _ in range(3):
+            scheduler.notify_frame()
+            scheduler.wait_for_frame()
+
+        self.assertGreaterEqual(time.perf_counter() - start_time, .1)
+
+    def test_period_without_new_frame_is_skipped(self):
+        scheduler = FrameScheduler(rate=50)
+        start_time = time.perf_counter()
+
+        self.assertEqual(scheduler.get_timeout(), .02)
+        self.assertFalse(scheduler.wait_for_frame(scheduler.get_timeout()))
+        self.assertLess(time.perf_counter() - start_time, .5)
+
+        self.assertIsNone(FrameScheduler().get_timeout())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from lib.curriculum.metrics_writer import CSV_FORMAT, JSONL_FORMAT, MetricsWriter
+
+RECORDS = [
+    {"event": "log", "timesteps": 100, "task": "1", "update": 0, "score_mean": None},
+    {"event": "update", "timesteps": 200, "task": "1", "update": 1, "score_mean": 0.75}
+]
+
+class TestMetricsWriter(unittest.TestCase):
+    def test_jsonl(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "logs", "metrics.jsonl")
+
+            writer = MetricsWriter(file_path, JSONL_FORMAT, flush_interval=0.01)
+
+            for record in RECORDS:
+                writer.write(record)
+
+            writer.close()
+
+            with open(file_path) as file:
+                self.assertEqual([json.loads(line) for line in file], RECORDS)
+
+    def test_csv_appends_without_second_header(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "metrics.csv")
+
+            for record in RECORDS:
+                writer = MetricsWriter(file_path, CSV_FORMAT, flush_interval=0.01)
+                writer.write(record)
+                writer.close()
+
+            with open(file_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+
+            self.assertEqual([row["timesteps"] for row in rows], ["100", "200"])
+            self.assertEqual(rows[1]["score_mean"], "0.75")
+
+    def test_drops_records_when_full(self):
+        with tempfile.TemporaryDirectory() as directory:
+            writer = MetricsWriter(os.path.join(directory, "metrics.jsonl"), queue_size=1, flush_interval=0.01)
+
+            for _ in range(1000):
+                writer.write(RECORDS[0])
+
+            writer.close()
+
+            with open(writer.file_path) as file:
+                lines_count = len(file.readlines())
+
+            self.assertEqual(lines_count + writer.dropped_count, 1000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from statistics import NormalDist
+import numpy as np
+
+from lib.curriculum.score_statistics import RunningScores, ThresholdSchedule
+
+class TestRunningScores(unittest.TestCase):
+    def test_running_statistics(self):
+        running_scores = RunningScores(20)
+        random = np.random.default_rng(0)
+
+        for _ in range(30):
+            running_scores.extend(list(random.choice([-1, -.5, 0, 1], random.integers(0, 5))))
+
+            scores = np.array(running_scores.scores)
+
+            self.assertAlmostEqual(running_scores.get_mean(), np.mean(scores))
+            self.assertAlmostEqual(running_scores.get_variance(), np.var(scores, ddof=1))
+            self.assertEqual(running_scores.get_results_counts(), (
+                int(np.sum(scores > 0)),
+                int(np.sum(scores == 0)),
+                int(np.sum(scores < 0))))
+
+        self.assertTrue(running_scores.is_full())
+
+        running_scores.clear()
+
+        self.assertEqual(len(running_scores), 0)
+        self.assertEqual(running_scores.get_results_counts(), (0, 0, 0))
+        self.assertTrue(np.isnan(running_scores.get_mean()))
+
+    def test_confidence_interval(self):
+        running_scores = RunningScores(100)
+        running_scores.extend([1] * 90 + [0] * 10)
+
+        low, high = running_scores.get_confidence_interval(.95)
+        margin = 1.959964 * np.sqrt(np.var([1] * 90 + [0] * 10, ddof=1) / 100)
+
+        self.assertAlmostEqual(low, .9 - margin, places=5)
+        self.assertAlmostEqual(high, .9 + margin, places=5)
+
+        # one-sided bound, as used for the promotion of a curriculum task
+        self.assertGreater(running_scores.get_mean() - running_scores.get_margin(NormalDist().inv_cdf(.95)), .8)
+
+class TestThresholdSchedule(unittest.TestCase):
+    def test_get_threshold(self):
+        schedule = ThresholdSchedule([(5, .5), (2, .6), (9, .4)], .7)
+
+        self.assertEqual(
+            [schedule.get_threshold(update_count) for update_count in range(11)],
+            [.7, .7, .6, .6, .6, .5, .5, .5, .5, .4, .4])
+
+if __name__ == '__main__':
+    unittest.main()
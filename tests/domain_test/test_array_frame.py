@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+
+from lib.domain.array_frame import ArrayFrame
+
+class TestArrayFrame(unittest.TestCase):
+    def _get_state(self):
+        ball = [.1, .2, 0, .3, .4]
+        blue = [[-.5, .1, 90, .2, -.3, 10], [-.2, -.3, 0, 0, 0, 0]]
+        yellow = [[.5, -.1, 270, -.2, .3, -10], [.2, .3, 450, 0, .1, 0]]
+
+        return ball + sum(blue, []) + sum(yellow, [])
+
+    def test_set_by_rsim_state(self):
+        frame = ArrayFrame(2, 2).set_by_rsim_state(self._get_state())
+
+        self.assertAlmostEqual(frame.ball.x, .1)
+        self.assertAlmostEqual(frame.ball.y, -.2)
+        self.assertAlmostEqual(frame.ball.v_y, .4)
+
+        robot = frame.robots_blue[0]
+
+        self.assertAlmostEqual(robot.y, -.1)
+        self.assertAlmostEqual(robot.theta, 270)
+        self.assertAlmostEqual(robot.v_y, .3)
+        self.assertAlmostEqual(robot.v_theta, 10)
+
+        self.assertAlmostEqual(frame.robots_blue[1].theta, 0)
+        self.assertAlmostEqual(frame.robots_yellow[0].theta, 90)
+        self.assertAlmostEqual(frame.robots_yellow[1].theta, 270)
+        self.assertEqual(frame.robots_yellow[1].id, 1)
+        self.assertTrue(frame.robots_yellow[1].yellow)
+
+    def test_views_follow_refill(self):
+        frame = ArrayFrame(2, 2)
+        robot = frame.robots_yellow[0]
+
+        frame.set_by_rsim_state(self._get_state())
+
+        self.assertAlmostEqual(robot.x, .5)
+        self.assertEqual(frame.robots.dtype, np.float32)
+
+if __name__ == "__main__":
+    unittest.main()
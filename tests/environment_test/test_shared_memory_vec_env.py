@@ -0,0 +1,100 @@
+import unittest
+import gymnasium as gym
+import numpy as np
+from gymnasium.spaces import Box
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from lib.environment.shared_memory_vec_env import SharedMemoryVecEnv
+
+class CountingEnvironment(gym.Env):
+    def __init__(self, episode_length: int):
+        self.episode_length = episode_length
+        self.observation_space = Box(low=-100, high=100, shape=(4,), dtype=np.float32)
+        self.action_space = Box(low=-1, high=1, shape=(2,), dtype=np.float32)
+        self.steps = 0
+        self.total = 0
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed, options=options)
+        self.steps = 0
+        return self._get_observation(), {}
+
+    def _get_observation(self):
+        return np.array([self.steps, self.total, self.episode_length, 0], dtype=np.float32)
+
+    def step(self, action):
+        self.steps += 1
+        self.total += float(action[0])
+        done = self.steps == self.episode_length
+
+        # every other step has an info of its own, as a profiler report
+        info = {"steps": self.steps} if self.steps % 2 == 0 else {}
+
+        if done:
+            info["last_game_score"] = self.total
+
+        return self._get_observation(), float(action[1]), done, False, info
+
+    def add(self, value: float):
+        self.total += value
+        return self.total
+
+def _create_env(episode_length: int):
+    return lambda: CountingEnvironment(episode_length)
+
+class TestSharedMemoryVecEnv(unittest.TestCase):
+    def test_step(self):
+        self._test_step(None)
+
+    def test_step_with_several_envs_per_worker(self):
+        self._test_step(2)
+
+    def _test_step(self, n_workers: 'int | None'):
+        env_fns = [_create_env(3), _create_env(4), _create_env(5)]
+        shared_env = SharedMemoryVecEnv(env_fns, "fork", n_workers=n_workers)
+        dummy_env = DummyVecEnv(env_fns)
+
+        try:
+            np.testing.assert_array_equal(shared_env.reset(), dummy_env.reset())
+
+            random = np.random.default_rng(0)
+
+            for _ in range(12):
+                actions = random.uniform(-1, 1, (3, 2)).astype(np.float32)
+
+                observations, rewards, dones, infos = shared_env.step(actions)
+                expected_observations, expected_rewards, expected_dones, expected_infos = dummy_env.step(actions)
+
+                np.testing.assert_array_equal(observations, expected_observations)
+                np.testing.assert_array_equal(rewards, expected_rewards)
+                np.testing.assert_array_equal(dones, expected_dones)
+
+                for info, expected_info in zip(infos, expected_infos):
+                    self.assertEqual(info.keys(), expected_info.keys())
+
+                    if "terminal_observation" in info:
+                        np.testing.assert_array_equal(info["terminal_observation"], expected_info["terminal_observation"])
+
+                    if "last_game_score" in info:
+                        self.assertAlmostEqual(info["last_game_score"], expected_info["last_game_score"])
+
+            self.assertEqual(shared_env.env_method("add", 1.5, indices=[1]), dummy_env.env_method("add", 1.5, indices=[1]))
+            self.assertEqual(shared_env.get_attr("episode_length"), [3, 4, 5])
+        finally:
+            shared_env.close()
+            dummy_env.close()
+
+    def test_attributes_of_wrapped_env(self):
+        shared_env = SharedMemoryVecEnv([lambda: Monitor(CountingEnvironment(3))], "fork")
+
+        try:
+            shared_env.set_attr("episode_length", 7)
+
+            self.assertEqual(shared_env.get_attr("episode_length"), [7])
+            self.assertEqual(shared_env.env_method("add", 2.0), [2.0])
+        finally:
+            shared_env.close()
+
+if __name__ == '__main__':
+    unittest.main()
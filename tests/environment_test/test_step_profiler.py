@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+
+from lib.environment.step_profiler import StepProfiler
+
+class _Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+class TestStepProfiler(unittest.TestCase):
+    def _run_step(
+        self,
+        profiler: StepProfiler,
+        clock: _Clock,
+        step_time: float
+    ):
+        profiler.start()
+        clock.time += step_time
+        profiler.add("opponent", step_time / 2)
+        profiler.mark("get_commands")
+        clock.time += 2 * step_time
+        profiler.mark("send_commands")
+        return profiler.finish()
+
+    def test_summary(self):
+        clock = _Clock()
+        profiler = StepProfiler(capacity=4, report_interval=5, clock=clock)
+
+        summaries = [self._run_step(profiler, clock, 0.001 * (i + 1)) for i in range(5)]
+
+        self.assertEqual(summaries[:4], [None] * 4)
+
+        summary = summaries[4]
+
+        self.assertEqual(summary["get_commands"]["count"], 5)
+        self.assertAlmostEqual(summary["get_commands"]["mean"], 0.003)
+        self.assertAlmostEqual(summary["send_commands"]["max"], 0.010)
+        self.assertAlmostEqual(summary["opponent"]["mean"], 0.0015)
+        self.assertAlmostEqual(summary["total"]["mean"], 0.009)
+
+        # the ring buffer only keeps the last 4 steps
+        self.assertAlmostEqual(summary["get_commands"]["p50"], 0.0035)
+
+        histogram = summary["total"]["histogram"]
+        self.assertEqual(len(histogram["counts"]), len(histogram["edges"]) + 1)
+        self.assertEqual(sum(histogram["counts"]), 5)
+
+    def test_reset_prefix_and_dump(self):
+        clock = _Clock()
+
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = StepProfiler(report_interval=1, directory=directory, clock=clock)
+
+            profiler.start("reset.")
+            clock.time += 0.5
+            profiler.mark("rsim_reset")
+            summary = profiler.finish()
+
+            self.assertEqual(set(summary.keys()), {"reset.rsim_reset", "reset.total"})
+
+            file_names = os.listdir(directory)
+            self.assertEqual(len(file_names), 1)
+
+            with open(os.path.join(directory, file_names[0])) as file:
+                self.assertEqual(json.load(file), summary)
+
+    def test_uncounted_samples_do_not_report(self):
+        clock = _Clock()
+        profiler = StepProfiler(report_interval=2, clock=clock)
+
+        profiler.start("reset.")
+        clock.time += 0.5
+        profiler.mark("rsim_reset")
+
+        self.assertIsNone(profiler.finish(counted=False))
+        self.assertIsNone(self._run_step(profiler, clock, 0.001))
+
+        summary = self._run_step(profiler, clock, 0.001)
+
+        self.assertEqual(summary["reset.rsim_reset"]["count"], 1)
+        self.assertEqual(summary["total"]["count"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+import numpy as np
+
+from lib.domain.array_frame import ArrayFrame
+from lib.environment.trajectory_recorder import TASK_ID_LENGTH, TrajectoryRecorder, load_trajectories
+
+class TestTrajectoryRecorder(unittest.TestCase):
+    def test_record_and_load(self):
+        frame = ArrayFrame(3, 3)
+        observations = np.arange(14 * 4, dtype=np.float32).reshape(14, 4)
+
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = TrajectoryRecorder(directory, chunk_size=4)
+            recorder.set_observation(observations[0])
+
+            for i in range(1, 11):
+                frame.ball_array[:] = i
+                frame.robots[:] = -i
+                done = i == 5
+
+                recorder.record(frame, observations[i], np.array([i, -i]), i / 10, done, "task", i)
+
+                if done:
+                    recorder.set_observation(observations[12])
+
+            recorder.close()
+
+            trajectories = load_trajectories(directory)
+
+            self.assertEqual([len(item) for item in trajectories["reward"]], [4, 4, 2])
+
+            def get(name: str):
+                return np.concatenate(trajectories[name])
+
+            steps = np.arange(1, 11)
+
+            np.testing.assert_array_equal(get("ball")[:, 0], steps)
+            np.testing.assert_array_equal(get("robots")[:, 2, 3], -steps)
+            np.testing.assert_array_equal(get("action")[:, 1], -steps)
+            np.testing.assert_allclose(get("reward"), steps / 10)
+            np.testing.assert_array_equal(get("done"), steps == 5)
+            np.testing.assert_array_equal(get("update_count"), steps)
+            self.assertTrue(np.all(get("task_id") == "task"))
+
+            # the observation after a done is the one set by the reset
+            expected_observations = observations[[0, 1, 2, 3, 4, 12, 6, 7, 8, 9]]
+
+            np.testing.assert_array_equal(get("observation"), expected_observations)
+            np.testing.assert_array_equal(get("next_observation"), observations[1:11])
+
+    def test_episodes_are_kept_without_close(self):
+        frame = ArrayFrame(3, 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = TrajectoryRecorder(directory, chunk_size=100)
+            recorder.set_observation(np.zeros(4, dtype=np.float32))
+
+            for i in range(1, 8):
+                recorder.record(frame, np.full(4, i, dtype=np.float32), np.zeros(2), 0, i == 5)
+
+            # the transitions after the last episode end are not listed yet
+            trajectories = load_trajectories(directory)
+
+            self.assertEqual([len(item) for item in trajectories["done"]], [5])
+            self.assertTrue(trajectories["done"][0][-1])
+
+    def test_long_task_id(self):
+        frame = ArrayFrame(3, 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = TrajectoryRecorder(directory, chunk_size=4)
+            task_id = "t" * TASK_ID_LENGTH
+
+            recorder.record(frame, np.zeros(4, dtype=np.float32), np.zeros(2), 0, True, task_id)
+
+            with self.assertRaises(ValueError):
+                recorder.record(frame, np.zeros(4, dtype=np.float32), np.zeros(2), 0, True, task_id + "t")
+
+            recorder.close()
+
+            self.assertEqual(list(load_trajectories(directory)["task_id"][0]), [task_id])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import threading
+import unittest
+import numpy as np
+
+from lib.inference.batched_inference import BatchedInference, BatchedModel
+
+class _DoublingModel:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, observation, deterministic=False):
+        self.batch_sizes.append(len(observation))
+        return 2 * observation, None
+
+class TestBatchedInference(unittest.TestCase):
+    def test_predict(self):
+        batched_inference = BatchedInference()
+        model = _DoublingModel()
+        batched_model = BatchedModel(batched_inference, model)
+
+        threads_count = 4
+        calls_count = 3
+        actions = {}
+
+        def run(index: int):
+            try:
+                for call in range(calls_count):
+                    observation = np.array([index, call], dtype=np.float32)
+                    actions[(index, call)] = batched_model.predict(observation, deterministic=True)[0]
+            finally:
+                batched_inference.finish()
+
+        batched_inference.begin(threads_count)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(threads_count)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(model.batch_sizes, [threads_count] * calls_count)
+
+        for (index, call), action in actions.items():
+            np.testing.assert_array_equal(action, [2 * index, 2 * call])
+
+    def test_predict_without_other_threads(self):
+        batched_inference = BatchedInference()
+        model = _DoublingModel()
+
+        batched_inference.begin(1)
+        action, _ = BatchedModel(batched_inference, model).predict(np.ones((2, 3)))
+        batched_inference.finish()
+
+        np.testing.assert_array_equal(action, 2 * np.ones((2, 3)))
+        self.assertEqual(model.batch_sizes, [2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import threading
+import time
+import unittest
+import numpy as np
+
+from lib.inference.inference_client import InferenceClient, RemoteModel
+from lib.inference.inference_server import InferenceServer
+
+class _SumModel:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, observations, deterministic=False):
+        self.batch_sizes.append(len(observations))
+        return observations.sum(axis=1, keepdims=True), None
+
+class TestInferenceServer(unittest.TestCase):
+    def test_batches_requests_from_all_clients(self):
+        model = _SumModel()
+        server = InferenceServer(max_wait=1, load_model=lambda _: model).start()
+        clients = [InferenceClient(*server.get_client_arguments()) for _ in range(4)]
+        actions = [None] * len(clients)
+
+        for client in clients:
+            client.connect()
+
+        while server.get_connections_count() < len(clients):
+            time.sleep(.01)
+
+        def predict(index: int):
+            remote_model = RemoteModel(clients[index], "model")
+            actions[index], _ = remote_model.predict(np.array([index, 1]), True)
+
+        threads = [threading.Thread(target=predict, args=(i,)) for i in range(len(clients))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(5)
+
+        for client in clients:
+            client.close()
+
+        server.stop()
+
+        self.assertEqual([item.tolist() for item in actions], [[1], [2], [3], [4]])
+        self.assertEqual(model.batch_sizes, [4])
+
+    def test_raises_loading_errors_on_client(self):
+        def load_model(_):
+            raise FileNotFoundError()
+
+        server = InferenceServer(load_model=load_model).start()
+        client = InferenceClient(*server.get_client_arguments())
+
+        with self.assertRaises(FileNotFoundError):
+            client.predict("missing", np.zeros(2), True)
+
+        client.close()
+        server.stop()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+from stable_baselines3 import PPO
+
+from lib.inference.numpy_policy import NumpyPolicy
+from lib.inference.numpy_policy_exporter import export_numpy_policy
+
+class _Environment(gym.Env):
+    def __init__(self, action_space: spaces.Space):
+        self.observation_space = spaces.Box(-1, 1, (6,), dtype=np.float32)
+        self.action_space = action_space
+
+    def reset(self, *, seed=None, options=None):
+        return self.observation_space.sample(), {}
+
+    def step(self, action):
+        return self.observation_space.sample(), 0, False, False, {}
+
+class TestNumpyPolicy(unittest.TestCase):
+    def _assert_same_actions(self, action_space: spaces.Space):
+        model = PPO("MlpPolicy", _Environment(action_space), device="cpu")
+        observations = np.random.uniform(-1, 1, (20, 6)).astype(np.float32)
+
+        with tempfile.TemporaryDirectory() as directory:
+            model_path = os.path.join(directory, "model.zip")
+            model.save(model_path)
+
+            numpy_policy = NumpyPolicy.load(export_numpy_policy(model_path))
+
+        expected, _ = model.predict(observations, deterministic=True)
+        actions, _ = numpy_policy.predict(observations, deterministic=True)
+
+        np.testing.assert_allclose(actions, expected, atol=1e-5)
+
+        action, _ = numpy_policy.predict(observations[0], deterministic=True)
+
+        self.assertEqual(action.shape, action_space.shape)
+
+    def test_box_actions(self):
+        self._assert_same_actions(spaces.Box(-1, 1, (2,), dtype=np.float32))
+
+    def test_multi_discrete_actions(self):
+        self._assert_same_actions(spaces.MultiDiscrete([4, 4, 4]))
+
+if __name__ == "__main__":
+    unittest.main()
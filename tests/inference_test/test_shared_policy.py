@@ -0,0 +1,96 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+import torch
+import gymnasium as gym
+from gymnasium import spaces
+from stable_baselines3 import PPO
+from stable_baselines3.common.policies import ActorCriticPolicy
+
+from lib.inference.shared_policy import SHARED_POLICY_EXTENSION, SharedPolicyModel, SharedPolicyPublisher, get_shared_policy_model
+
+class _Environment(gym.Env):
+    def __init__(self):
+        self.observation_space = spaces.Box(-1, 1, (4,), dtype=np.float32)
+        self.action_space = spaces.Box(-1, 1, (2,), dtype=np.float32)
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed, options=options)
+        return np.zeros(4, dtype=np.float32), {}
+
+    def step(self, action):
+        return np.zeros(4, dtype=np.float32), 0.0, True, False, {}
+
+class TestSharedPolicy(unittest.TestCase):
+    def _get_policy(self):
+        return ActorCriticPolicy(
+            spaces.Box(-1, 1, (4,), dtype=np.float32),
+            spaces.Box(-1, 1, (2,), dtype=np.float32),
+            ActorCriticPolicy._dummy_schedule)
+
+    def test_model_follows_published_weights(self):
+        policy = self._get_policy()
+        observation = np.array([.1, -.2, .3, -.4], dtype=np.float32)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, f"policy{SHARED_POLICY_EXTENSION}")
+            publisher = SharedPolicyPublisher(file_path)
+            publisher.publish(policy)
+
+            model = pickle.loads(pickle.dumps(SharedPolicyModel(file_path)))
+
+            action, _ = model.predict(observation, deterministic=True)
+            expected, _ = policy.predict(observation, deterministic=True)
+
+            np.testing.assert_allclose(action, expected, rtol=1e-6)
+
+            with torch.no_grad():
+                for parameter in policy.parameters():
+                    parameter.add_(.5)
+
+            publisher.publish(policy)
+
+            action, _ = model.predict(observation, deterministic=True)
+            expected, _ = policy.predict(observation, deterministic=True)
+
+            np.testing.assert_allclose(action, expected, rtol=1e-6)
+            self.assertEqual(model.get_version(), 2)
+
+    def test_remove(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, f"policy{SHARED_POLICY_EXTENSION}")
+            publisher = SharedPolicyPublisher(file_path)
+            publisher.publish(self._get_policy())
+
+            self.assertNotEqual(os.listdir(directory), [])
+
+            publisher.remove()
+
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_get_shared_policy_model_after_a_crash(self):
+        env = _Environment()
+        model = PPO("MlpPolicy", env, n_steps=8, batch_size=8, device="cpu")
+        observation = np.array([.1, -.2, .3, -.4], dtype=np.float32)
+
+        with tempfile.TemporaryDirectory() as directory:
+            model_path = os.path.join(directory, "model.zip")
+            model.save(model_path)
+
+            shared_directory = os.path.join(directory, "shared")
+            shared_model = get_shared_policy_model(model_path, shared_directory)
+
+            # the lock file left behind by a process that died while publishing
+            os.remove(shared_model.file_path)
+
+            shared_model = get_shared_policy_model(model_path, shared_directory)
+
+            action, _ = shared_model.predict(observation, deterministic=True)
+            expected, _ = model.predict(observation, deterministic=True)
+
+            np.testing.assert_allclose(action, expected, rtol=1e-6)
+
+if __name__ == "__main__":
+    unittest.main()
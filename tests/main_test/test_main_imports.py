@@ -0,0 +1,74 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+from stable_baselines3 import PPO
+
+from lib.inference.numpy_policy_exporter import export_numpy_policy
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# imports main with every model as an .npz and prints the training modules it loaded
+_IMPORT_SCRIPT = """
+import json
+import sys
+from configuration.configuration import Configuration
+
+Configuration.model_attacker_path = sys.argv[1]
+Configuration.model_defender_path = sys.argv[1]
+Configuration.model_goalkeeper_path = sys.argv[1]
+Configuration.model_team_path = sys.argv[1]
+
+import main
+
+print(json.dumps([name for name in sys.argv[2:] if name in sys.modules]))
+"""
+
+TRAINING_MODULES = ["gymnasium", "pygame", "rsoccer_gym", "torch", "stable_baselines3"]
+
+class _Environment(gym.Env):
+    def __init__(self):
+        self.observation_space = spaces.Box(-1, 1, (6,), dtype=np.float32)
+        self.action_space = spaces.Box(-1, 1, (2,), dtype=np.float32)
+
+    def reset(self, *, seed=None, options=None):
+        return self.observation_space.sample(), {}
+
+    def step(self, action):
+        return self.observation_space.sample(), 0, False, False, {}
+
+def _has_protobuf_modules():
+    try:
+        return importlib.util.find_spec("communication.protobuf.firasim.packet_pb2") is not None
+    except ImportError:
+        return False
+
+@unittest.skipUnless(_has_protobuf_modules(), "the protobuf modules are not generated")
+class TestMainImports(unittest.TestCase):
+    def test_numpy_models_do_not_load_the_training_stack(self):
+        model = PPO("MlpPolicy", _Environment(), device="cpu")
+
+        with tempfile.TemporaryDirectory() as directory:
+            model_path = os.path.join(directory, "model.zip")
+            model.save(model_path)
+
+            result = subprocess.run(
+                [sys.executable, "-c", _IMPORT_SCRIPT, export_numpy_policy(model_path), *TRAINING_MODULES],
+                cwd=ROOT_PATH,
+                capture_output=True,
+                text=True,
+                check=True)
+
+        loaded_modules = json.loads(result.stdout.splitlines()[-1])
+
+        self.assertNotIn("gymnasium", loaded_modules)
+        self.assertEqual(loaded_modules, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import math
+import random
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from configuration.configuration import Configuration
+from lib.domain.field import Field
+from lib.observation.observation_builder import ObservationBuilder
+from lib.utils.field_utils import FieldUtils
+from lib.utils.geometry_utils import GeometryUtils
+
+def _norm(value: float, max_value: float):
+    return np.clip(value / max_value, -1, 1)
+
+def _is_inside_field(x: float, y: float):
+    return FieldUtils.is_inside_field(
+        x,
+        y,
+        Configuration.field_length,
+        Configuration.field_width,
+        Configuration.field_goal_width,
+        Configuration.field_goal_depth)
+
+def _get_random_field():
+    field = Field()
+
+    def set_entity(entity):
+        entity.position.x = random.uniform(-.9, .9)
+        entity.position.y = random.uniform(-.7, .7)
+        entity.position.theta = random.uniform(-math.pi, math.pi)
+        entity.velocity.x = random.uniform(-1.5, 1.5)
+        entity.velocity.y = random.uniform(-1.5, 1.5)
+
+    set_entity(field.ball)
+
+    for i in range(3):
+        set_entity(field.get_robot_by_id(i))
+        set_entity(field.get_foe_by_id(i))
+
+    return field
+
+def _get_expected_attacker_observation(field: Field, robot_id: int):
+    max_v = Configuration.rsoccer_training_max_v
+    max_distance = Configuration.rsoccer_training_max_distance
+
+    current_robot = field.get_robot_by_id(robot_id)
+    current_position = current_robot.get_position_tuple()
+    ball_position = field.ball.get_position_tuple()
+
+    observation = [
+        np.clip(GeometryUtils.distance(current_position, ball_position) / max_distance, -1, 1),
+        GeometryUtils.angle_between_points(current_position, ball_position) / np.pi,
+        _norm(field.ball.velocity.x, max_v),
+        _norm(field.ball.velocity.y, max_v),
+        _norm(current_robot.position.x, Configuration.rsoccer_training_max_x),
+        _norm(current_robot.position.y, Configuration.rsoccer_training_max_y),
+        current_robot.position.theta / np.pi,
+        _norm(current_robot.velocity.x, max_v),
+        _norm(current_robot.velocity.y, max_v)
+    ]
+
+    robots = [field.get_robot_by_id(i) for i in range(3) if i != robot_id]
+    robots.extend(field.get_foe_by_id(i) for i in range(3))
+
+    for robot in robots:
+        position = robot.get_position_tuple()
+
+        if _is_inside_field(*position):
+            observation.extend([
+                np.clip(GeometryUtils.distance(current_position, position) / max_distance, -1, 1),
+                GeometryUtils.angle_between_points(current_position, position) / np.pi,
+                robot.position.theta / np.pi,
+                _norm(robot.velocity.x, max_v),
+                _norm(robot.velocity.y, max_v)
+            ])
+        else:
+            observation.extend([0, 0, 0, 0, 0])
+
+    return np.array(observation, dtype=np.float32)
+
+def _get_expected_team_observation(field: Field, time_factor: float):
+    max_v = Configuration.rsoccer_training_max_v
+    max_x = Configuration.rsoccer_training_max_x
+    max_y = Configuration.rsoccer_training_max_y
+    ball = field.ball
+
+    observation = [
+        time_factor,
+        _norm(ball.position.x, max_x),
+        _norm(ball.position.y, max_y),
+        _norm(ball.velocity.x, max_v),
+        _norm(ball.velocity.y, max_v)
+    ]
+
+    robots = [field.get_robot_by_id(i) for i in range(3)]
+    robots.extend(field.get_foe_by_id(i) for i in range(3))
+
+    for robot in robots:
+        if _is_inside_field(*robot.get_position_tuple()):
+            observation.extend([
+                _norm(robot.position.x, max_x),
+                _norm(robot.position.y, max_y),
+                robot.position.theta / np.pi,
+                _norm(robot.velocity.x, max_v),
+                _norm(robot.velocity.y, max_v)
+            ])
+        else:
+            observation.extend([0, 0, 0, 0, 0])
+
+    return np.array(observation, dtype=np.float32)
+
+class TestObservationBuilder(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.observation_builder = ObservationBuilder.get_configuration_builder()
+
+    def test_attacker_observation_by_field(self):
+        for _ in range(50):
+            field = _get_random_field()
+            self.observation_builder.set_field(field)
+
+            for robot_id in range(3):
+                observation = self.observation_builder.get_attacker_observation(
+                    robot_id,
+                    False,
+                    True)
+
+                np.testing.assert_allclose(
+                    observation,
+                    _get_expected_attacker_observation(field, robot_id),
+                    atol=1e-6)
+
+    def test_team_observation_by_field(self):
+        for _ in range(50):
+            field = _get_random_field()
+            self.observation_builder.set_field(field)
+
+            observation = self.observation_builder.get_team_observation(.5, False, True)
+
+            np.testing.assert_allclose(
+                observation,
+                _get_expected_team_observation(field, .5),
+                atol=1e-6)
+
+    def test_goalkeeper_observation_is_prefix_of_defender_observation(self):
+        field = _get_random_field()
+        field.get_robot_by_id(2).position.x = 0
+        field.get_robot_by_id(2).position.y = 0
+        self.observation_builder.set_field(field)
+
+        defender_observation = self.observation_builder\
+            .get_defender_observation(2, False, True).copy()
+        goalkeeper_observation = self.observation_builder\
+            .get_goalkeeper_observation(2, False, True)
+
+        self.assertEqual(len(defender_observation), 34)
+        self.assertEqual(len(goalkeeper_observation), 9)
+        np.testing.assert_array_equal(goalkeeper_observation, defender_observation[:9])
+
+    def test_rsoccer_frame_is_mirrored_for_right_team(self):
+        def robot(x, y, theta):
+            return SimpleNamespace(x=x, y=y, theta=theta, v_x=.2, v_y=-.1)
+
+        frame = SimpleNamespace(
+            ball=SimpleNamespace(x=.3, y=.1, v_x=.5, v_y=0),
+            robots_blue={0: robot(-.2, .1, 90), 1: robot(10, 10, 0), 2: robot(11, 11, 0)},
+            robots_yellow={0: robot(.4, -.2, 270), 1: robot(20, 20, 0), 2: robot(21, 21, 0)})
+
+        self.observation_builder.set_rsoccer_frame(frame)
+
+        observation = self.observation_builder.get_goalkeeper_observation(0, True, False)
+
+        expected = np.array([
+            _norm(-.3, Configuration.rsoccer_training_max_x),
+            _norm(-.1, Configuration.rsoccer_training_max_y),
+            _norm(-.5, Configuration.rsoccer_training_max_v),
+            0,
+            _norm(-.4, Configuration.rsoccer_training_max_x),
+            _norm(.2, Configuration.rsoccer_training_max_y),
+            .5,
+            _norm(-.2, Configuration.rsoccer_training_max_v),
+            _norm(.1, Configuration.rsoccer_training_max_v)
+        ], dtype=np.float32)
+
+        np.testing.assert_allclose(observation, expected, atol=1e-6)
+
+if __name__ == "__main__":
+    unittest.main()
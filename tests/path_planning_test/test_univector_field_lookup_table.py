@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from lib.path_planning.univector_field_lookup_table import PhiTufLookupTable
+from lib.path_planning.univector_field_navigation import default_configuration
+from lib.path_planning.vectorized_univector_field_navigation import get_phi_tuf_values
+
+class TestPhiTufLookupTable(unittest.TestCase):
+    def test_check_error(self):
+        table = PhiTufLookupTable(default_configuration, .6, .5, .004)
+
+        error = table.check_error(.002, 20000)
+
+        self.assertLess(error, .002)
+
+        with self.assertRaises(ValueError):
+            PhiTufLookupTable(default_configuration, .6, .5, .004, exact_radius=0).check_error(.002, 20000)
+
+    def test_get_phi_tuf_values_outside_table(self):
+        table = PhiTufLookupTable(default_configuration, .2, .2, .004)
+        vector_x = np.array([.5, -.3, .01])
+        vector_y = np.array([.1, .4, 0])
+
+        expected = get_phi_tuf_values(np.stack([vector_x, vector_y], axis=1), (0, 0))
+
+        np.testing.assert_array_equal(table.get_phi_tuf_values(vector_x, vector_y), expected)
+
+    def test_memory_mapped_table(self):
+        with tempfile.TemporaryDirectory() as directory:
+            table = PhiTufLookupTable(default_configuration, .3, .3, .004, directory)
+            loaded_table = PhiTufLookupTable(default_configuration, .3, .3, .004, directory)
+
+            self.assertEqual(len(os.listdir(directory)), 1)
+            self.assertIsInstance(loaded_table.table, np.memmap)
+            np.testing.assert_array_equal(table.table, loaded_table.table)
+
+            del table, loaded_table
+
+if __name__ == '__main__':
+    unittest.main()
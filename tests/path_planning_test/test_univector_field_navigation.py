@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+
+from lib.domain.univector_field_navigation.obstacle import Obstacle
+from lib.domain.univector_field_navigation.obstacle_grid import ObstacleGrid
+from lib.path_planning.univector_field_navigation import default_configuration, get_univector_field_point_theta, get_univector_field_point_theta_by_all_obstacles
+
+class TestUnivectorFieldNavigation(unittest.TestCase):
+    def setUp(self):
+        self.random = np.random.default_rng(0)
+
+    def _get_random_obstacles(self, count: int):
+        return [
+            Obstacle(
+                tuple(self.random.uniform(-.8, .8, 2)),
+                tuple(self.random.uniform(-.5, .5, 2)))
+            for _ in range(count)
+        ]
+
+    def test_get_obstacles_near(self):
+        obstacles = self._get_random_obstacles(200)
+        obstacle_grid = ObstacleGrid(.1, obstacles)
+
+        near_obstacles = obstacle_grid.get_obstacles_near((.2, -.1), .1)
+
+        self.assertLess(len(near_obstacles), len(obstacles))
+
+        for obstacle in obstacles:
+            distance = np.hypot(obstacle.position[0] - .2, obstacle.position[1] + .1)
+
+            if distance <= .1:
+                self.assertIn(obstacle, near_obstacles)
+
+    def test_single_obstacle_matches_closest_obstacle_composition(self):
+        for _ in range(200):
+            robot_position = tuple(self.random.uniform(-.8, .8, 2))
+            desired_position = tuple(self.random.uniform(-.8, .8, 2))
+            obstacle = Obstacle(
+                tuple(np.add(robot_position, self.random.uniform(-.15, .15, 2))),
+                tuple(self.random.uniform(-.5, .5, 2)))
+
+            expected = get_univector_field_point_theta(
+                robot_position,
+                (.1, -.2),
+                desired_position,
+                [obstacle])
+
+            value = get_univector_field_point_theta_by_all_obstacles(
+                robot_position,
+                (.1, -.2),
+                desired_position,
+                [obstacle])
+
+            if np.hypot(*np.subtract(robot_position, obstacle.position)) > default_configuration.influence_radius:
+                expected = get_univector_field_point_theta(robot_position, (.1, -.2), desired_position, [])
+
+            self.assertAlmostEqual(value, expected, places=12)
+
+    def test_obstacle_grid_matches_obstacles_list(self):
+        obstacles = self._get_random_obstacles(100)
+        obstacle_grid = ObstacleGrid(default_configuration.influence_radius, obstacles)
+
+        for _ in range(200):
+            robot_position = tuple(self.random.uniform(-.8, .8, 2))
+            desired_position = tuple(self.random.uniform(-.8, .8, 2))
+
+            expected = get_univector_field_point_theta_by_all_obstacles(
+                robot_position,
+                (0, 0),
+                desired_position,
+                obstacles)
+
+            value = get_univector_field_point_theta_by_all_obstacles(
+                robot_position,
+                (0, 0),
+                desired_position,
+                [],
+                obstacle_grid)
+
+            self.assertAlmostEqual(value, expected, places=12)
+
+if __name__ == '__main__':
+    unittest.main()
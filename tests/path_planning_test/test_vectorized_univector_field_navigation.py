@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+
+from lib.domain.univector_field_navigation.obstacle import Obstacle
+from lib.path_planning.univector_field_navigation import get_univector_field_point_theta
+from lib.path_planning.vectorized_univector_field_navigation import get_univector_field_grid, get_univector_field_points_theta
+
+class TestVectorizedUnivectorFieldNavigation(unittest.TestCase):
+    def setUp(self):
+        random = np.random.default_rng(0)
+        points_count = 500
+
+        self.positions = random.uniform(-.8, .8, (points_count, 2))
+        self.velocities = random.uniform(-1, 1, (points_count, 2))
+        self.desired_positions = random.uniform(-.8, .8, (points_count, 2))
+        self.obstacle_positions = random.uniform(-.8, .8, (points_count, 5, 2))
+        self.obstacle_velocities = random.uniform(-1, 1, (points_count, 5, 2))
+
+    def _get_expected(self, index: int, obstacles: 'list[Obstacle]'):
+        return get_univector_field_point_theta(
+            tuple(self.positions[index]),
+            tuple(self.velocities[index]),
+            tuple(self.desired_positions[index]),
+            obstacles)
+
+    def test_get_univector_field_points_theta(self):
+        thetas = get_univector_field_points_theta(
+            self.positions,
+            self.velocities,
+            self.desired_positions,
+            self.obstacle_positions,
+            self.obstacle_velocities)
+
+        for i in range(len(self.positions)):
+            obstacles = [
+                Obstacle(tuple(position), tuple(velocities))
+                for position, velocities in zip(self.obstacle_positions[i], self.obstacle_velocities[i])
+            ]
+
+            self.assertAlmostEqual(thetas[i], self._get_expected(i, obstacles), places=12)
+
+    def test_get_univector_field_points_theta_without_obstacles(self):
+        thetas = get_univector_field_points_theta(
+            self.positions,
+            self.velocities,
+            self.desired_positions,
+            np.zeros((0, 2)),
+            np.zeros((0, 2)))
+
+        for i in range(len(self.positions)):
+            self.assertAlmostEqual(thetas[i], self._get_expected(i, []), places=12)
+
+    def test_get_univector_field_grid(self):
+        x_values = np.linspace(-.7, .7, 8)
+        y_values = np.linspace(-.6, .6, 6)
+        obstacles = [Obstacle((.2, .1), (.3, 0)), Obstacle((-.3, -.2))]
+
+        thetas = get_univector_field_grid(x_values, y_values, (.5, 0), obstacles)
+
+        self.assertEqual(thetas.shape, (6, 8))
+
+        for i, y in enumerate(y_values):
+            for j, x in enumerate(x_values):
+                expected = get_univector_field_point_theta((x, y), (0, 0), (.5, 0), obstacles)
+                self.assertAlmostEqual(thetas[i, j], expected, places=12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+import numpy as np
+
+from lib.domain.field import Field
+from lib.domain.robot import Robot
+from lib.supporter.default_supporter import BALL_MIN_DISTANCE, CONSIDERED_ROBOT_DISTANCE, DISTANCE_BEHIND_BALL, FIELD_LENGTH, GOAL_AREA_LENGTH, GOAL_AREA_WIDTH, GRID_XS, GRID_YS, MAX_DISTANCE, ROBOT_MIN_DISTANCE, W_DISTANCE_TO_BALL, W_DISTANCE_TO_GOAL, W_DISTANCE_TO_POSITION, W_DISTANCE_TO_ROBOT, SupporterTracker, _get_scores, get_supporter_position, get_supporter_position_by_multiresolution
+from lib.utils.field_utils import FieldUtils
+from lib.utils.geometry_utils import GeometryUtils
+
+def _get_random_field(random: np.random.Generator):
+    field = Field()
+
+    def get_robots():
+        robots = {}
+
+        for i in range(3):
+            robot = Robot(i, bool(random.uniform() < .9))
+            robot.position.x, robot.position.y = random.uniform(-.7, .7, 2)
+            robots[i] = robot
+
+        return robots
+
+    field.set_robots(get_robots())
+    field.set_foes(get_robots())
+    field.get_robot_by_id(0).active = True
+    field.ball.position.x, field.ball.position.y = random.uniform(-.7, .7, 2)
+
+    return field
+
+def _get_reference_score(
+    robot_id: int,
+    field: Field,
+    position: 'tuple[float, float]'
+):
+    # the scalar score, one position at a time, the supporter used to search
+    if FieldUtils.is_inside_goal_area(position, FIELD_LENGTH, GOAL_AREA_LENGTH, GOAL_AREA_WIDTH):
+        return 0
+
+    def attraction(reference_position, min_distance):
+        distance = GeometryUtils.distance(position, reference_position)
+        return 0 if distance < min_distance else 1 - (distance - min_distance) / (MAX_DISTANCE - min_distance)
+
+    def repulsion(reference_position, min_distance):
+        distance = GeometryUtils.distance(position, reference_position)
+        return 0 if distance < min_distance else (distance - min_distance) / (MAX_DISTANCE - min_distance)
+
+    ball = field.ball
+    robots = [item for item in field.get_active_robots() if item.id != robot_id] + field.get_active_foes()
+
+    robot_scores = [
+        repulsion(item.get_position_tuple(), ROBOT_MIN_DISTANCE)
+        for item in robots
+        if GeometryUtils.distance(item.get_position_tuple(), ball.get_position_tuple()) <= CONSIDERED_ROBOT_DISTANCE
+    ]
+
+    if ball.position.x < 0:
+        goal_score = attraction((-FIELD_LENGTH / 2, 0), 0)
+    elif position[0] > ball.position.x - DISTANCE_BEHIND_BALL:
+        goal_score = 0
+    else:
+        goal_score = attraction((FIELD_LENGTH / 2, 0), 0)
+
+    return W_DISTANCE_TO_ROBOT * (1 if len(robot_scores) == 0 else np.mean(robot_scores)) +\
+        W_DISTANCE_TO_POSITION * attraction(field.get_robot_by_id(robot_id).get_position_tuple(), 0) +\
+        W_DISTANCE_TO_BALL * attraction(ball.get_position_tuple(), BALL_MIN_DISTANCE) +\
+        W_DISTANCE_TO_GOAL * goal_score
+
+class TestDefaultSupporter(unittest.TestCase):
+    def test_get_supporter_position(self):
+        random = np.random.default_rng(0)
+
+        for _ in range(50):
+            field = _get_random_field(random)
+
+            # the previous search, one score per grid position
+            max_score = -1
+            expected = (0, 0)
+
+            for x, y in zip(GRID_XS, GRID_YS):
+                score = _get_reference_score(0, field, (x, y))
+
+                if score > max_score:
+                    max_score = score
+                    expected = (x, y)
+
+            self.assertEqual(get_supporter_position(0, field), expected)
+
+    def test_supporter_tracker(self):
+        random = np.random.default_rng(1)
+        field = _get_random_field(random)
+        tracker = SupporterTracker(1, 10, .05, .01)
+
+        position = tracker.get_position(0, field)
+
+        self.assertEqual(position, get_supporter_position(0, field))
+
+        x_step = np.diff(np.unique(GRID_XS))[0]
+        y_step = np.diff(np.unique(GRID_YS))[0]
+
+        # small moves only refine the target around the previous cell
+        for _ in range(5):
+            field.ball.position.x += .002
+            new_position = tracker.get_position(0, field)
+
+            self.assertGreater(tracker.steps_since_full_search, 0)
+            self.assertLessEqual(abs(new_position[0] - position[0]), x_step * 1.001)
+            self.assertLessEqual(abs(new_position[1] - position[1]), y_step * 1.001)
+
+            position = new_position
+
+        # a new landscape triggers a full search
+        field.ball.position.x, field.ball.position.y = position
+        tracker.get_position(0, field)
+        scores = _get_scores(0, field, GRID_XS, GRID_YS)
+
+        self.assertEqual(tracker.steps_since_full_search, 0)
+        self.assertLessEqual(scores.max() - scores[tracker.index], .01)
+
+    def test_get_supporter_position_by_multiresolution(self):
+        random = np.random.default_rng(2)
+
+        for _ in range(20):
+            field = _get_random_field(random)
+            position = get_supporter_position(0, field)
+
+            self.assertEqual(
+                get_supporter_position_by_multiresolution(0, field, 1),
+                position)
+
+            refined_position = get_supporter_position_by_multiresolution(0, field, 3, 3, 3)
+
+            self.assertGreaterEqual(
+                _get_reference_score(0, field, refined_position),
+                _get_reference_score(0, field, position))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 
 from configuration.configuration import Configuration
 from lib.utils.field_utils import FieldUtils
@@ -64,5 +65,30 @@ class TestFieldUtils(unittest.TestCase):
 
         self.assertEqual(inside, True)
 
+    def test_are_inside_field(self):
+        field_length = Configuration.field_length
+        field_width = Configuration.field_width
+        goal_width = Configuration.field_goal_width
+        goal_depth = Configuration.field_goal_depth
+
+        x = np.array([-.849, .849, 0, .7, .76])
+        y = np.array([-.19, .3, .66, .64, 0])
+
+        inside = FieldUtils.are_inside_field(
+            x,
+            y,
+            field_length,
+            field_width,
+            goal_width,
+            goal_depth
+        )
+
+        expected = [
+            FieldUtils.is_inside_field(x[i], y[i], field_length, field_width, goal_width, goal_depth)
+            for i in range(len(x))
+        ]
+
+        self.assertEqual(inside.tolist(), expected)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,103 @@
+import importlib.util
+import math
+import random
+import unittest
+
+import numpy as np
+
+from lib.domain.enums.role_enum import RoleEnum
+from lib.domain.field import Field
+
+def _get_random_field():
+    field = Field()
+
+    def set_entity(entity):
+        entity.position.x = random.uniform(-.9, .9)
+        entity.position.y = random.uniform(-.7, .7)
+        entity.position.theta = random.uniform(-math.pi, math.pi)
+        entity.velocity.x = random.uniform(-1.5, 1.5)
+        entity.velocity.y = random.uniform(-1.5, 1.5)
+
+    set_entity(field.ball)
+
+    for i in range(3):
+        set_entity(field.get_robot_by_id(i))
+        set_entity(field.get_foe_by_id(i))
+
+    return field
+
+class _LinearModel:
+    def __init__(self, scale: float):
+        self.scale = scale
+        self.batch_sizes = []
+
+    def predict(self, observation, deterministic=True):
+        observation = np.asarray(observation)
+        self.batch_sizes.append(len(observation) if observation.ndim > 1 else 1)
+
+        return np.tanh(self.scale * observation[..., :2]), None
+
+@unittest.skipIf(importlib.util.find_spec("rsoccer_gym") is None, "rsoccer_gym is not installed")
+class TestFusedRoleUtils(unittest.TestCase):
+    def test_speeds_by_fields_match_per_robot_speeds(self):
+        from lib.supporter.default_supporter import get_supporter_speeds
+        from lib.utils.roles.attacker_utils import AttackerUtils
+        from lib.utils.roles.defender_utils import DefenderUtils
+        from lib.utils.roles.fused_role_utils import TEAM_ACTION_ROLES, FusedRoleUtils
+        from lib.utils.roles.goalkeeper_utils import GoalkeeperUtils
+
+        random.seed(0)
+
+        models = {
+            RoleEnum.ATTACKER: _LinearModel(1.5),
+            RoleEnum.DEFENDER: _LinearModel(-.7),
+            RoleEnum.GOALKEEPER: _LinearModel(3)
+        }
+
+        role_utils = {
+            RoleEnum.ATTACKER: AttackerUtils,
+            RoleEnum.DEFENDER: DefenderUtils,
+            RoleEnum.GOALKEEPER: GoalkeeperUtils
+        }
+
+        for _ in range(20):
+            # the blue and the yellow field, each seen by its own team
+            fields = [_get_random_field(), _get_random_field()]
+            roles = [[random.choice(TEAM_ACTION_ROLES) for _ in range(3)] for _ in fields]
+
+            speeds = FusedRoleUtils.get_speeds_by_fields(fields, roles, models)
+
+            for field_index, field in enumerate(fields):
+                for robot_id, role_enum in enumerate(roles[field_index]):
+                    if role_enum == RoleEnum.SUPPORTER:
+                        expected = get_supporter_speeds(robot_id, field)
+                    else:
+                        expected = role_utils[role_enum].get_speeds_by_field(
+                            field,
+                            robot_id,
+                            models[role_enum])
+
+                    np.testing.assert_allclose(speeds[field_index][robot_id], expected, rtol=1e-6)
+
+    def test_one_predict_per_role(self):
+        from lib.utils.roles.fused_role_utils import FusedRoleUtils
+
+        models = {
+            RoleEnum.ATTACKER: _LinearModel(1),
+            RoleEnum.DEFENDER: _LinearModel(1),
+            RoleEnum.GOALKEEPER: _LinearModel(1)
+        }
+
+        roles = [
+            [RoleEnum.ATTACKER, RoleEnum.DEFENDER, RoleEnum.GOALKEEPER],
+            [RoleEnum.ATTACKER, RoleEnum.ATTACKER, RoleEnum.SUPPORTER]
+        ]
+
+        FusedRoleUtils.get_speeds_by_fields([_get_random_field(), _get_random_field()], roles, models)
+
+        self.assertEqual(models[RoleEnum.ATTACKER].batch_sizes, [3])
+        self.assertEqual(models[RoleEnum.DEFENDER].batch_sizes, [1])
+        self.assertEqual(models[RoleEnum.GOALKEEPER].batch_sizes, [1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import importlib.util
+import unittest
+
+from lib.domain.enums.foul_enum import FoulEnum
+from lib.domain.referee_message import RefereeMessage
+
+@unittest.skipIf(
+    importlib.util.find_spec("communication.protobuf.referee.vssref_command_pb2") is None,
+    "the referee protobuf modules were not generated")
+class TestRefereeUtils(unittest.TestCase):
+    def test_zero_foul_and_team_color(self):
+        from communication.protobuf.referee import vssref_command_pb2
+        from lib.utils.referee_utils import RefereeUtils
+
+        # FREE_KICK and BLUE, both the proto3 default value
+        packet = vssref_command_pb2.VSSRef_Command()
+        referee_message = RefereeMessage()
+
+        RefereeUtils.set_referee_message(referee_message, packet)
+
+        self.assertEqual(referee_message.foul_enum, FoulEnum.FREE_KICK)
+        self.assertTrue(referee_message.is_yellow_team)
+        self.assertIsNone(referee_message.foul_quadrant)
+        self.assertIsNone(referee_message.game_half_enum)
+
+if __name__ == '__main__':
+    unittest.main()